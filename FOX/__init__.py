@@ -13,40 +13,13 @@ https://auto-fox.readthedocs.io/en/latest/
 
 from os.path import join
 
-from scm.plams import Settings as _Settings
-
 from .__version__ import __version__
-
-from .functions import (
-    assert_error, get_example_xyz, group_by_values
-)
-
-from .io import (
-    PSFContainer,
-    PRMContainer,
-    create_hdf5, create_xyz_hdf5, to_hdf5, from_hdf5
-)
-
-from .classes import (
-    FrozenSettings,
-    MultiMolecule,
-    ARMC, run_armc,
-)
-
-from .ff import (
-    get_bonded,
-    get_non_bonded,
-    get_intra_non_bonded,
-    estimate_lj, get_free_energy
-)
+from .functions.lazy import lazy_loader
 
 __author__ = "Bas van Beek"
 __email__ = 'b.f.van.beek@vu.nl'
 __version__ = __version__
 
-if hasattr(_Settings, 'suppress_missing'):
-    _Settings.supress_missing = _Settings.suppress_missing
-
 #: The path+filename of the example multi-xyz file.
 example_xyz: str = join(__path__[0], 'data', 'Cd68Se55_26COO_MD_trajec.xyz')
 del join
@@ -69,3 +42,14 @@ __all__ = [
 
     'recipes'
 ]
+
+# Attributes are imported upon first access; *e.g.* ``FOX.ARMC`` imports PLAMS and pandas,
+# while ``FOX.armc_functions.csv_utils`` only requires h5py and pandas
+__getattr__, __dir__ = lazy_loader(__name__, {
+    '.functions': ['assert_error', 'get_example_xyz', 'group_by_values'],
+    '.io': ['PSFContainer', 'PRMContainer',
+            'create_hdf5', 'create_xyz_hdf5', 'to_hdf5', 'from_hdf5'],
+    '.classes': ['FrozenSettings', 'MultiMolecule', 'ARMC', 'run_armc'],
+    '.ff': ['get_bonded', 'get_non_bonded', 'get_intra_non_bonded',
+            'estimate_lj', 'get_free_energy'],
+}, submodules=['recipes'])
@@ -2,24 +2,43 @@
 FOX.armc_functions.csv_utils
 ============================
 
-A module for exporting ARMC result to .csv files.
+A module for exporting ARMC result to .csv, .parquet and .feather files.
 
 Index
 -----
 .. currentmodule:: FOX.armc_functions.csv_utils
 .. autosummary::
     dset_to_csv
+    dset_to_file
 
 API
 ---
 .. autofunction:: dset_to_csv
+.. autofunction:: dset_to_file
 
 """
 
+import os
 from os import PathLike
-from typing import Optional, AnyStr, Union
+from typing import Optional, AnyStr, Union, Iterable, Hashable, Iterator
 
-from ..io.hdf5_utils import from_hdf5
+import pandas as pd
+
+from ..io.hdf5_utils import LazyDataset
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_ERROR: Optional[str] = None
+except ImportError:
+    PYARROW_ERROR = ("Exporting ARMC results to the {!r} format requires the 'pyarrow' package."
+                     "\n'pyarrow' can be installed via PyPi with the following command:"
+                     "\n\tpip install pyarrow")
+
+__all__ = []
+
+#: The supported file formats of :func:`dset_to_file`.
+FORMATS = frozenset({'csv', 'parquet', 'feather'})
 
 
 def dset_to_csv(filename_in: Union[AnyStr, PathLike],
@@ -29,6 +48,7 @@ def dset_to_csv(filename_in: Union[AnyStr, PathLike],
     """Export ARMC results to one or more .csv files.
 
     A single .csv file will be created for all datasets in **datasets**.
+    Data is streamed to the .csv file in blocks of super-iterations (see :func:`dset_to_file`).
 
     Parameters
     ----------
@@ -44,20 +64,147 @@ def dset_to_csv(filename_in: Union[AnyStr, PathLike],
 
     iteration : int
         The ARMC iteration containg the dataset of interest.
-        Only relevant when dealing with datasets with more than three dimensions;
+        Only relevant when dealing with datasets containing a DataFrame per iteration;
         will be ignored otherwise.
 
-    Returns
-    -------
-    |matplotlib.figure.Figure|_:
-        A matplotlib figure containg PES descriptors.
-
     """
     filename_out = filename_out or dataset + '.csv'
+    dset_to_file(filename_in, dataset, filename_out, fmt='csv', iteration=iteration)
+
+
+def dset_to_file(filename_in: Union[AnyStr, PathLike],
+                 dataset: str,
+                 filename_out: Union[None, AnyStr, PathLike] = None,
+                 fmt: Optional[str] = None,
+                 kappa: Optional[slice] = None,
+                 columns: Optional[Iterable[Hashable]] = None,
+                 iteration: int = -1,
+                 chunksize: Optional[int] = None) -> None:
+    """Stream an ARMC dataset to a .csv, .parquet or .feather file.
+
+    Data is read and written in blocks of super-iterations,
+    ensuring that the entire dataset never has to be loaded into memory.
+    The .parquet and .feather formats require the pyarrow_ package;
+    (MultiIndex) column labels are converted into strings for the latter two formats,
+    *e.g.* ``("charge", "Cd")`` becomes ``"charge.Cd"``.
+
+    .. _pyarrow: https://arrow.apache.org/docs/python/
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX.armc_functions.csv_utils import dset_to_file
+
+        >>> hdf5_file = str(...)
+
+        # Export the parameters of the first 10 super-iterations
+        >>> dset_to_file(hdf5_file, 'param', 'param.parquet', kappa=slice(0, 10))
+
+    Parameters
+    ----------
+    filename_in : str
+        The path+name of the ARMC .hdf5 file.
+
+    dataset : |str|_
+        The name of the to-be exported dataset (*e.g.* ``"aux_error"``).
+
+    filename_out : str, optional
+        The path+name of the to-be created file.
+        Will default to **dataset** (appended with the extension of **fmt**) if ``None``.
+
+    fmt : str, optional
+        The format of the to-be created file: ``"csv"``, ``"parquet"`` or ``"feather"``.
+        Will be inferred from the extension of **filename_out** if ``None``,
+        defaulting to ``"csv"`` if neither is specified.
+
+    kappa : slice, optional
+        The to-be exported super-iterations, :math:`\\kappa`.
+        All super-iterations are exported if ``None``.
 
-    # Gather the pes descriptors
-    df = from_hdf5(filename_in, dataset)
-    if isinstance(df, list):
-        df = df[iteration]
+    columns : list, optional
+        The to-be exported columns, *e.g.* a set of parameters or atom pairs.
 
-    df.to_csv(filename_out)
+    iteration : int
+        The ARMC iteration containg the dataset of interest.
+        Only relevant when dealing with datasets containing a DataFrame per iteration
+        (*e.g.* PES descriptors); will be ignored otherwise.
+
+    chunksize : int, optional
+        The number of super-iterations per block.
+        If ``None``, determine the number of super-iterations based on
+        :data:`READ_CHUNK_SIZE<FOX.io.hdf5_utils.READ_CHUNK_SIZE>`.
+
+    Raises
+    ------
+    ValueError
+        Raised if an unsupported file format is specified.
+
+    ImportError
+        Raised if **fmt** is ``"parquet"`` or ``"feather"`` and pyarrow_ is not installed.
+
+    """
+    if fmt is None and filename_out is not None:
+        fmt = os.path.splitext(os.fsdecode(filename_out))[1].lstrip('.').lower() or None
+    fmt = fmt or 'csv'
+    if fmt not in FORMATS:
+        raise ValueError(f"'fmt' expects 'csv', 'parquet' or 'feather'; observed value: {fmt!r}")
+    elif fmt != 'csv' and PYARROW_ERROR is not None:
+        raise ImportError(PYARROW_ERROR.format(fmt))
+    filename_out = filename_out or f'{dataset}.{fmt}'
+
+    dset = LazyDataset(filename_in, dataset)
+    if isinstance(dset.read(0, 0), list):  # i.e. a list of DataFrames per iteration
+        iterator = (_read_iteration(dset, iteration, columns),)
+    else:
+        iterator = (_to_frame(df) for df in dset.iter_frames(kappa, columns, chunksize))
+
+    if fmt == 'csv':
+        _write_csv(filename_out, iterator)
+    else:
+        _write_arrow(filename_out, iterator, fmt)
+
+
+def _read_iteration(dset: LazyDataset, iteration: int,
+                    columns: Optional[Iterable[Hashable]] = None) -> pd.DataFrame:
+    """Read a single ARMC **iteration** from a dataset containing a DataFrame per iteration."""
+    kappa, omega = divmod(range(len(dset))[iteration], dset.shape[1])
+    return dset.read(kappa, omega, columns)[0]
+
+
+def _to_frame(df: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    """Convert **df** into a DataFrame."""
+    return df.to_frame() if isinstance(df, pd.Series) else df
+
+
+def _write_csv(filename: Union[AnyStr, PathLike], iterator: Iterator[pd.DataFrame]) -> None:
+    """Write all DataFrames in **iterator** to the .csv file **filename**."""
+    with open(filename, 'w', newline='') as f:
+        for i, df in enumerate(iterator):
+            df.to_csv(f, header=not i)
+
+
+def _write_arrow(filename: Union[AnyStr, PathLike], iterator: Iterator[pd.DataFrame],
+                 fmt: str) -> None:
+    """Write all DataFrames in **iterator** to the .parquet or .feather file **filename**."""
+    writer = None
+    try:
+        for df in iterator:
+            df = df.copy()
+            df.columns = [_label_to_str(i) for i in df.columns]
+            table = pa.Table.from_pandas(df, preserve_index=True)
+            if writer is None and fmt == 'parquet':
+                writer = pq.ParquetWriter(filename, table.schema)
+            elif writer is None:  # Feather (version 2) is the Arrow IPC file format
+                writer = pa.ipc.new_file(filename, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _label_to_str(label: Hashable) -> str:
+    """Convert a (MultiIndex) column label into a string."""
+    if isinstance(label, tuple):
+        return '.'.join(str(i) for i in label)
+    return str(label)
@@ -0,0 +1,170 @@
+"""
+FOX.armc_functions.pes_cache
+============================
+
+A module for caching reference PES descriptors on the disk.
+
+Index
+-----
+.. currentmodule:: FOX.armc_functions.pes_cache
+.. autosummary::
+    get_pes_cached
+    get_pes_cache_key
+
+API
+---
+.. autofunction:: get_pes_cached
+.. autofunction:: get_pes_cache_key
+
+"""
+
+import os
+import pickle
+import hashlib
+import warnings
+import functools
+from types import CodeType
+from typing import Callable, Any, Union, AnyStr, IO, Tuple
+
+import numpy as np
+
+from ..__version__ import __version__
+from ..io.read_xyz import _atomic_save
+from ..classes.multi_mol import MultiMolecule
+
+__all__ = ['get_pes_cached', 'get_pes_cache_key']
+
+#: The version of the PES cache layout; bump whenever the layout or the key are changed.
+_CACHE_VERSION = '2'
+
+#: The directory of the FOX package.
+_FOX_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_pes_cached(func: functools.partial, mol: MultiMolecule,
+                   cache_dir: Union[AnyStr, os.PathLike]) -> Any:
+    """Evaluate ``func(mol)``, storing and reusing the result in a content-addressed cache.
+
+    The cache is keyed by the cartesian coordinates and atoms of **mol**, the Auto-FOX version,
+    the function and its (keyword) arguments (see :func:`get_pes_cache_key`).
+    Issues encountered while writing the cache (*e.g.* a read-only directory)
+    are reported with a warning, the result of ``func(mol)`` being returned regardless.
+
+    Parameters
+    ----------
+    func : :class:`functools.partial`
+        A partial object for constructing the PES descriptor of **mol**.
+
+    mol : :class:`MultiMolecule`
+        The reference trajectory.
+
+    cache_dir : :class:`str`
+        The directory for storing the cache files.
+
+    Returns
+    -------
+    :class:`object`
+        The PES descriptor, *e.g.* a DataFrame with a radial distribution function.
+
+    """
+    filename = os.path.join(os.fsdecode(cache_dir), f'{get_pes_cache_key(func, mol)}.pkl')
+
+    # Plan A: Read the cache
+    try:
+        with open(filename, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):  # The cache is absent or corrupted
+        pass
+
+    # Plan B: Construct the PES descriptor and (re-)write the cache
+    ret = func(mol)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _atomic_save(filename, _pickle_dump, ret)
+    except (OSError, pickle.PicklingError) as ex:
+        warnings.warn(f"Failed to write the PES cache {filename!r}: {ex}", RuntimeWarning)
+    return ret
+
+
+def get_pes_cache_key(func: functools.partial, mol: MultiMolecule) -> str:
+    """Return a SHA-1 digest identifying the PES descriptor ``func(mol)``.
+
+    Callables defined within Auto-FOX or in compiled code are identified by their
+    module and qualified name, the Auto-FOX version being part of the digest.
+    All other Python functions (*e.g.* user-defined functions and lambda expressions)
+    are additionally identified by their bytecode, constants, default arguments and
+    the content of their closures.
+    Arrays in the (keyword) arguments of **func** are identified by their content.
+
+    """
+    sha1 = hashlib.sha1(f'{_CACHE_VERSION}:{__version__}'.encode())
+    sha1.update(np.ascontiguousarray(mol, dtype=float).view(np.uint8))
+    sha1.update(repr(sorted(mol.atoms.items(), key=str)).encode())
+    sha1.update(_get_name(func.func).encode())
+    sha1.update(_repr(func.args).encode())
+    sha1.update(_repr(func.keywords).encode())
+    return sha1.hexdigest()
+
+
+def _pickle_dump(f: IO[bytes], obj: Any) -> None:
+    """Pickle **obj** into the opened file **f**; the signature is compatible with :func:`numpy.save`."""  # noqa: E501
+    pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _get_name(func: Callable, seen: Tuple[int, ...] = ()) -> str:
+    """Return the module and qualified name of **func**.
+
+    The name of non-FOX Python functions is appended with a digest of their code;
+    **seen** contains the ids of all functions whose digest is currently being constructed.
+
+    """
+    name = getattr(func, '__qualname__', type(func).__qualname__)
+    name = f'{getattr(func, "__module__", None)}.{name}'
+
+    code = getattr(func, '__code__', None)
+    if not isinstance(code, CodeType):  # e.g. builtin functions and ufuncs
+        return name
+    elif os.path.abspath(code.co_filename).startswith(_FOX_DIR + os.sep):
+        return name
+    elif id(func) in seen:  # A recursive closure
+        return name
+    return f'{name}({_hash_func(func, seen + (id(func),))})'
+
+
+def _hash_func(func: Callable, seen: Tuple[int, ...] = ()) -> str:
+    """Return a SHA-1 digest of the code, defaults and closure of the Python function **func**."""
+    closure = []
+    for cell in getattr(func, '__closure__', None) or ():
+        try:
+            closure.append(cell.cell_contents)
+        except ValueError:  # An empty cell
+            closure.append(None)
+
+    sha1 = hashlib.sha1(_hash_code(func.__code__).encode())
+    sha1.update(_repr(getattr(func, '__defaults__', None), seen).encode())
+    sha1.update(_repr(getattr(func, '__kwdefaults__', None), seen).encode())
+    sha1.update(_repr(closure, seen).encode())
+    return sha1.hexdigest()
+
+
+def _hash_code(code: CodeType) -> str:
+    """Return a SHA-1 digest of the bytecode, constants and names of **code**."""
+    sha1 = hashlib.sha1(code.co_code)
+    for const in code.co_consts:  # The repr of code objects contains their memory address
+        sha1.update((_hash_code(const) if isinstance(const, CodeType) else repr(const)).encode())
+    sha1.update(repr(code.co_names).encode())
+    return sha1.hexdigest()
+
+
+def _repr(obj: Any, seen: Tuple[int, ...] = ()) -> str:
+    """Return a process-independent string representation of **obj**."""
+    if isinstance(obj, dict):
+        return '{' + ', '.join(f'{k!r}: {_repr(v, seen)}' for k, v in sorted(obj.items())) + '}'
+    elif isinstance(obj, (list, tuple)):
+        return '[' + ', '.join(_repr(i, seen) for i in obj) + ']'
+    elif isinstance(obj, np.ndarray):  # The repr of large arrays is truncated
+        digest = hashlib.sha1(np.ascontiguousarray(obj).view(np.uint8)).hexdigest()
+        return f'ndarray({obj.dtype}, {obj.shape}, {digest})'
+    elif callable(obj):
+        return _get_name(obj, seen)
+    return repr(obj)
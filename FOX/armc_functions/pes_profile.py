@@ -0,0 +1,183 @@
+"""
+FOX.armc_functions.pes_profile
+==============================
+
+A module for profiling the callables used for constructing PES descriptors.
+
+Index
+-----
+.. currentmodule:: FOX.armc_functions.pes_profile
+.. autosummary::
+    PESProfiler
+    PESProfiler.reset
+    PESProfiler.dump_stats
+    get_profile_summary
+
+API
+---
+.. autoclass:: PESProfiler
+.. automethod:: PESProfiler.reset
+.. automethod:: PESProfiler.dump_stats
+.. autofunction:: get_profile_summary
+
+"""
+
+import os
+import time
+import cProfile
+import tracemalloc
+from typing import Callable, Optional, Union, Generic, TypeVar, Mapping, Any
+
+import numpy as np
+import pandas as pd
+
+from ..classes.multi_mol import MultiMolecule
+
+__all__ = ['PESProfiler', 'get_profile_summary']
+
+T = TypeVar('T')
+
+#: Accepted values for the **mode** parameter of :class:`PESProfiler`.
+PROFILE_MODES = frozenset({True, 'cprofile', 'tracemalloc'})
+
+
+class PESProfiler(Generic[T]):
+    """A wrapper around a PES evaluator which records the number of calls and their wall time.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX import MultiMolecule
+        >>> from FOX.armc_functions.pes_profile import PESProfiler
+
+        >>> mol = MultiMolecule.from_xyz(...)
+        >>> profiler = PESProfiler(MultiMolecule.init_rdf, mode='cprofile')
+        >>> rdf = profiler(mol)
+
+        >>> print(profiler.call_count, profiler.time)  # doctest: +SKIP
+        1 0.5164
+        >>> profiler.dump_stats('init_rdf.prof')
+
+    Parameters
+    ----------
+    func : :class:`Callable<collections.abc.Callable>`
+        The to-be profiled PES evaluator.
+
+    mode : :class:`bool` or :class:`str`
+        The profiling mode.
+        ``True`` exclusively records the number of calls and their cumulative wall time.
+        ``"cprofile"`` and ``"tracemalloc"`` additionally collect
+        function-level statistics with :mod:`cProfile` or
+        the peak memory allocated by the function with :mod:`tracemalloc`, respectively.
+
+    Attributes
+    ----------
+    call_count : :class:`int`
+        The number of calls since the last :meth:`PESProfiler.reset`.
+
+    time : :class:`float`
+        The cumulative wall time of all calls, in seconds.
+
+    peak_memory : :class:`float`
+        The peak memory allocated by a single call, in MiB.
+        Only recorded if **mode** is ``"tracemalloc"``; ``nan`` otherwise.
+
+    profile : :class:`cProfile.Profile`, optional
+        The collected :mod:`cProfile` statistics if **mode** is ``"cprofile"``;
+        ``None`` otherwise.
+
+    """
+
+    __slots__ = ('func', 'mode', 'call_count', 'time', 'peak_memory', 'profile')
+
+    def __init__(self, func: Callable[[MultiMolecule], T],
+                 mode: Union[bool, str] = True) -> None:
+        """Initialize a :class:`PESProfiler` instance."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"'mode' expects True, 'cprofile' or 'tracemalloc'; observed value: "
+                             f"{mode!r}")
+        self.func = func
+        self.mode = mode
+        self.reset()
+
+    def __repr__(self) -> str:
+        """Implement :func:`repr(self)<repr>`."""
+        name = getattr(self.func, '__name__', self.func)
+        return f'{self.__class__.__name__}({name}, mode={self.mode!r})'
+
+    def __deepcopy__(self, memo: Optional[dict] = None) -> 'PESProfiler[T]':
+        """Implement :func:`copy.deepcopy(self)<copy.deepcopy>`; profiling statistics are reset."""
+        return type(self)(self.func, self.mode)
+
+    def __call__(self, mol: MultiMolecule) -> T:
+        """Call :attr:`PESProfiler.func` with **mol**, updating all profiling statistics."""
+        start = time.perf_counter()
+        if self.mode == 'cprofile':
+            ret = self.profile.runcall(self.func, mol)
+        elif self.mode == 'tracemalloc':
+            ret = self._call_tracemalloc(mol)
+        else:
+            ret = self.func(mol)
+
+        self.time += time.perf_counter() - start
+        self.call_count += 1
+        return ret
+
+    def _call_tracemalloc(self, mol: MultiMolecule) -> T:
+        """Call :attr:`PESProfiler.func` while tracing its memory allocations."""
+        is_tracing = tracemalloc.is_tracing()
+        if not is_tracing:
+            tracemalloc.start()
+        current, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python >= 3.9
+            tracemalloc.reset_peak()
+
+        try:
+            return self.func(mol)
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            if not is_tracing:
+                tracemalloc.stop()
+            self.peak_memory = float(np.fmax(self.peak_memory, (peak - current) / 2**20))
+
+    def reset(self) -> None:
+        """Reset all profiling statistics."""
+        self.call_count = 0
+        self.time = 0.0
+        self.peak_memory = np.nan
+        self.profile = cProfile.Profile() if self.mode == 'cprofile' else None
+
+    def dump_stats(self, filename: Union[str, os.PathLike]) -> bool:
+        """Write the :mod:`cProfile` statistics to **filename**; see :mod:`pstats`.
+
+        Returns ``False`` if no statistics were collected and ``True`` otherwise.
+
+        """
+        if self.profile is None or not self.call_count:
+            return False
+        self.profile.dump_stats(os.fspath(filename))
+        return True
+
+
+def get_profile_summary(profilers: Mapping[Any, PESProfiler]) -> pd.DataFrame:
+    """Construct a DataFrame summarizing the statistics of all profilers in **profilers**.
+
+    Parameters
+    ----------
+    profilers : :class:`Mapping<collections.abc.Mapping>` [:data:`Any<typing.Any>`, :class:`PESProfiler`]
+        A mapping with the names of PES descriptors as keys and profilers as values.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+        A DataFrame with the number of calls, the total and mean wall time and
+        the peak allocated memory of every profiler.
+
+    """  # noqa: E501
+    ret = pd.DataFrame(index=pd.Index(list(profilers), name='PES descriptor'))
+    ret['calls'] = [p.call_count for p in profilers.values()]
+    ret['total time (s)'] = [p.time for p in profilers.values()]
+    ret['mean time (s)'] = ret['total time (s)'] / ret['calls'].replace(0, np.nan)
+    ret['peak memory (MiB)'] = [p.peak_memory for p in profilers.values()]
+    return ret
@@ -0,0 +1,105 @@
+"""
+FOX.armc_functions.pes_stream
+=============================
+
+A module for accumulating PES descriptors while a molecular dynamics simulation is running.
+
+Index
+-----
+.. currentmodule:: FOX.armc_functions.pes_stream
+.. autosummary::
+    PESAccumulator
+    PESAccumulator.update
+    PESAccumulator.result
+
+API
+---
+.. autoclass:: PESAccumulator
+.. automethod:: PESAccumulator.update
+.. automethod:: PESAccumulator.result
+
+"""
+
+from typing import Callable, Optional, TypeVar, Generic
+
+from ..classes.multi_mol import MultiMolecule
+
+__all__ = ['PESAccumulator']
+
+T = TypeVar('T')
+
+
+class PESAccumulator(Generic[T]):
+    """A class for accumulating a frame-averaged PES descriptor over consecutive blocks of frames.
+
+    Every block of frames is passed to **func** and the result is weighted by the number of
+    frames in the block; :meth:`PESAccumulator.result` returns the weighted mean.
+    This is identical to calling **func** on the entire trajectory,
+    as long as **func** returns a quantity averaged over all frames
+    (*e.g.* :meth:`MultiMolecule.init_rdf` and :meth:`MultiMolecule.init_adf`).
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> import pandas as pd
+        >>> from FOX import MultiMolecule
+        >>> from FOX.armc_functions.pes_stream import PESAccumulator
+
+        >>> mol = MultiMolecule.from_xyz(...)
+        >>> accumulator = PESAccumulator(MultiMolecule.init_rdf)
+        >>> for i in range(0, len(mol), 100):
+        ...     accumulator.update(mol[i:i+100])
+
+        >>> rdf: pd.DataFrame = accumulator.result()
+
+    Parameters
+    ----------
+    func : :class:`Callable<collections.abc.Callable>`
+        A callable which takes a :class:`MultiMolecule` instance and returns
+        a frame-averaged PES descriptor.
+
+    Attributes
+    ----------
+    frame_count : :class:`int`
+        The total number of frames passed to :meth:`PESAccumulator.update`.
+
+    """
+
+    __slots__ = ('func', 'frame_count', '_sum')
+
+    def __init__(self, func: Callable[[MultiMolecule], T]) -> None:
+        """Initialize a :class:`PESAccumulator` instance."""
+        self.func = func
+        self.frame_count = 0
+        self._sum: Optional[T] = None
+
+    def __repr__(self) -> str:
+        """Implement :func:`repr(self)<repr>`."""
+        name = getattr(self.func, '__name__', self.func)
+        return f'{self.__class__.__name__}({name}, frame_count={self.frame_count})'
+
+    def update(self, mol: MultiMolecule) -> None:
+        """Evaluate the PES descriptor for a block of frames and add it to the running sum."""
+        if not len(mol):
+            return None
+
+        value = self.func(mol) * len(mol)
+        if self._sum is None:
+            self._sum = value
+        else:
+            self._sum += value
+        self.frame_count += len(mol)
+
+    def result(self) -> T:
+        """Return the PES descriptor averaged over all accumulated frames.
+
+        Raises
+        ------
+        ValueError
+            Raised if no frames have been accumulated.
+
+        """
+        if self._sum is None:
+            raise ValueError(f"No frames have been passed to {self!r}")
+        return self._sum / self.frame_count
@@ -9,26 +9,32 @@ Index
 .. currentmodule:: FOX.armc_functions.plotting
 .. autosummary::
     plot_pes_descriptors
+    plot_pes_descriptors_mp
     plot_param
     plot_dset
 
 API
 ---
 .. autofunction:: FOX.armc_functions.plotting.plot_pes_descriptors
+.. autofunction:: FOX.armc_functions.plotting.plot_pes_descriptors_mp
 .. autofunction:: FOX.armc_functions.plotting.plot_param
 .. autofunction:: FOX.armc_functions.plotting.plot_dset
 
 """
 
-from typing import Optional, Iterable, Union, Hashable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Iterable, Union, Hashable, Dict, List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
+from pandas.core.generic import NDFrame
 
-from ..io.hdf5_utils import from_hdf5
+from ..io.hdf5_utils import LazyDataset, IncrementalDataset
 from ..functions.utils import assert_error
 
 try:
     import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
     PltFigure = plt.Figure
     PLT_ERROR = ''
 except ImportError:
@@ -45,7 +51,9 @@ def plot_pes_descriptors(filename_in: str,
                          descriptor: str,
                          filename_out: Optional[str],
                          iteration: int = -1,
-                         savefig_kwarg: Optional[dict] = None) -> plt.Figure:
+                         savefig_kwarg: Optional[dict] = None,
+                         fig: Optional[PltFigure] = None,
+                         cache: Optional[Dict[str, IncrementalDataset]] = None) -> PltFigure:
     """Create and save a figure showing side-by-side comparisons of QM and MM PES descriptors.
 
     .. _matplotlib.savefig: https://matplotlib.org/3.1.0/api/_as_gen/matplotlib.pyplot.savefig.html
@@ -81,41 +89,130 @@ def plot_pes_descriptors(filename_in: str,
     savefig_kwarg : |None|_ or |dict|_
         Optional: A dictionary with user-specified keyword arguments for matplotlib.savefig_.
 
+    fig : |matplotlib.figure.Figure|_, optional
+        Optional: An existing figure which will be cleared and reused.
+        A new figure is created if ``None``.
+
+    cache : |dict|_ [|str|_, :class:`IncrementalDataset<FOX.io.hdf5_utils.IncrementalDataset>`], optional
+        Optional: A dictionary for storing the read datasets in between calls.
+        If provided, only the ARMC iterations completed since the previous call will be read.
+
     Returns
     -------
     |matplotlib.figure.Figure|_:
         A matplotlib figure containg PES descriptors.
 
-    """
+    """  # noqa: E501
     filename_out = filename_out or descriptor + '.png'
 
-    # Gather the pes descriptors
-    pes_mm = from_hdf5(filename_in, descriptor)[iteration]
-    pes_qm = from_hdf5(filename_in, descriptor + '.ref')[0]
+    # Gather the pes descriptors; only the requested iteration is read
+    dset = LazyDataset(filename_in, descriptor)
+    kappa, omega = divmod(range(len(dset))[iteration], dset.shape[1])
+    pes_mm = dset.read(kappa, omega)[0]
+    pes_qm = _read_cached(filename_in, descriptor + '.ref', cache)[0]
 
     # Define constants
     ncols = len(pes_mm.columns)
     figsize = (4 * ncols, 6)
 
     # Construct the figures
-    fig, ax_tup = plt.subplots(ncols=ncols, sharex=True, sharey=False)
+    fig, ax_tup = _get_axes(fig, ncols, figsize, sharex=True, sharey=False)
     for key, ax in zip(pes_mm, ax_tup):
         df = pd.DataFrame({'MM-MD': pes_mm[key], 'QM-MD': pes_qm[key]}, index=pes_mm.index)
         df.columns.name = descriptor
         df.plot(ax=ax, title=key, figsize=figsize)
 
     # Save and return the figures
-    if savefig_kwarg is None:
-        plt.savefig(filename_out, dpi=300, quality=100, transparent=True, format='png')
-    else:
-        plt.savefig(filename_out, **savefig_kwarg)
+    _savefig(fig, filename_out, savefig_kwarg)
     return fig
 
 
+def plot_pes_descriptors_mp(filename_in: str,
+                            descriptors: Sequence[str],
+                            filenames_out: Optional[Sequence[str]] = None,
+                            iteration: int = -1,
+                            savefig_kwarg: Optional[dict] = None,
+                            executor: Optional[Executor] = None) -> List[str]:
+    """Create and save the figures of multiple PES descriptors in parallel.
+
+    .. _matplotlib.savefig: https://matplotlib.org/3.1.0/api/_as_gen/matplotlib.pyplot.savefig.html
+
+    The figures of all descriptors in **descriptors** are created (and closed)
+    in a pool of processes; see :func:`plot_pes_descriptors` for more details.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from concurrent.futures import ProcessPoolExecutor
+
+        >>> descriptors = ['rdf.0', 'adf.0']
+        >>> with ProcessPoolExecutor(max_workers=2) as executor:
+        ...     filenames = plot_pes_descriptors_mp('armc.hdf5', descriptors, executor=executor)
+
+        >>> print(filenames)
+        ['rdf.0.png', 'adf.0.png']
+
+    Parameters
+    ----------
+    filename_in : str
+        The path+name of the ARMC .hdf5 file.
+
+    descriptors : |list|_ [|str|_]
+        The names of the datasets containing the to-be retrieved PES descriptors.
+
+    filenames_out : |list|_ [|str|_], optional
+        Optional: The path+names of the to-be created figures.
+        Will default to all dataset names in **descriptors** (appended with ``'.png'``) if ``None``.
+
+    iteration : int
+        The ARMC iteration containg the PES descriptors of interest.
+
+    savefig_kwarg : |None|_ or |dict|_
+        Optional: A dictionary with user-specified keyword arguments for matplotlib.savefig_.
+
+    executor : :class:`concurrent.futures.Executor`, optional
+        Optional: The executor used for creating the figures.
+        If ``None``, create a new :class:`~concurrent.futures.ProcessPoolExecutor`
+        for the duration of this function.
+        Reusing a single executor is more efficient when figures are repeatedly refreshed.
+
+    Returns
+    -------
+    |list|_ [|str|_]:
+        The path+names of the created figures.
+
+    """
+    if filenames_out is None:
+        filenames_out = [descriptor + '.png' for descriptor in descriptors]
+    args = [(filename_in, k, v, iteration, savefig_kwarg) for k, v in
+            zip(descriptors, filenames_out)]
+
+    if executor is None:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_plot_pes_worker, *zip(*args)))
+    return list(executor.map(_plot_pes_worker, *zip(*args)))
+
+
+def _plot_pes_worker(filename_in: str, descriptor: str, filename_out: str,
+                     iteration: int, savefig_kwarg: Optional[dict]) -> str:
+    """Create and save a single PES descriptor figure for :func:`plot_pes_descriptors_mp`.
+
+    The figure is created without :mod:`matplotlib.pyplot`,
+    ensuring it is neither shown nor retained by the calling (worker) process.
+
+    """
+    plot_pes_descriptors(filename_in, descriptor, filename_out, iteration=iteration,
+                         savefig_kwarg=savefig_kwarg, fig=Figure())
+    return filename_out
+
+
 @assert_error(PLT_ERROR)
 def plot_param(filename_in: str,
                filename_out: Optional[str] = None,
-               savefig_kwarg: Optional[dict] = None) -> plt.Figure:
+               savefig_kwarg: Optional[dict] = None,
+               fig: Optional[PltFigure] = None,
+               cache: Optional[Dict[str, IncrementalDataset]] = None) -> PltFigure:
     """Create and save a figure from the ``"param"`` hdf5 dataset in **filename_in**.
 
     .. _matplotlib.savefig: https://matplotlib.org/3.1.0/api/_as_gen/matplotlib.pyplot.savefig.html
@@ -144,23 +241,31 @@ def plot_param(filename_in: str,
     savefig_kwarg : |None|_ or |dict|_
         Optional: A dictionary with user-specified keyword arguments for matplotlib.savefig_.
 
+    fig : |matplotlib.figure.Figure|_, optional
+        Optional: An existing figure which will be cleared and reused.
+        A new figure is created if ``None``.
+
+    cache : |dict|_ [|str|_, :class:`IncrementalDataset<FOX.io.hdf5_utils.IncrementalDataset>`], optional
+        Optional: A dictionary for storing the read datasets in between calls.
+        If provided, only the ARMC iterations completed since the previous call will be read.
+
     Returns
     -------
     |matplotlib.figure.Figure|_:
         A matplotlib figure containg forcefield parameters.
 
-    """
+    """  # noqa: E501
     filename_out = filename_out or 'param.png'
 
     # Gather the pes descriptors
-    param = from_hdf5(filename_in, 'param')
+    param = _read_cached(filename_in, 'param', cache)
 
     # Define constants
     ncols = len(param.columns.levels[0])
     figsize = (4 * ncols, 6)
 
     # Construct the figures
-    fig, ax_tup = plt.subplots(ncols=ncols, sharex=True, sharey=False)
+    fig, ax_tup = _get_axes(fig, ncols, figsize, sharex=True, sharey=False)
     for key, ax in zip(param.columns.levels[0], ax_tup):
         df = param[key].copy()
         df.columns.name = 'Atoms/Atom pairs'
@@ -168,10 +273,7 @@ def plot_param(filename_in: str,
         df.plot(ax=ax, title=key, figsize=figsize)
 
     # Save and return the figures
-    if savefig_kwarg is None:
-        plt.savefig(filename_out, dpi=300, quality=100, transparent=True, format='png')
-    else:
-        plt.savefig(filename_out, **savefig_kwarg)
+    _savefig(fig, filename_out, savefig_kwarg)
     return fig
 
 
@@ -179,7 +281,9 @@ def plot_param(filename_in: str,
 def plot_dset(filename_in: str,
               datasets: Union[Hashable, Iterable[Hashable]],
               filename_out: Optional[str] = None,
-              savefig_kwarg: Optional[dict] = None) -> plt.Figure:
+              savefig_kwarg: Optional[dict] = None,
+              fig: Optional[PltFigure] = None,
+              cache: Optional[Dict[str, IncrementalDataset]] = None) -> PltFigure:
     """Create and save a figure from an arbitrary hdf5 dataset in **filename_in**.
 
     See :func:`plot_pes_descriptors` and :func:`plot_param` for functions specialized in plotting
@@ -215,19 +319,27 @@ def plot_dset(filename_in: str,
     savefig_kwarg : |None|_ or |dict|_
         Optional: A dictionary with user-specified keyword arguments for matplotlib.savefig_.
 
+    fig : |matplotlib.figure.Figure|_, optional
+        Optional: An existing figure which will be cleared and reused.
+        A new figure is created if ``None``.
+
+    cache : |dict|_ [|str|_, :class:`IncrementalDataset<FOX.io.hdf5_utils.IncrementalDataset>`], optional
+        Optional: A dictionary for storing the read datasets in between calls.
+        If provided, only the ARMC iterations completed since the previous call will be read.
+
     Returns
     -------
     |matplotlib.figure.Figure|_:
         A matplotlib figure containg PES descriptors.
 
-    """
+    """  # noqa: E501
     filename_out = filename_out or 'datasets.png'
 
     if isinstance(datasets, str):
         datasets = [datasets]
 
     # Gather the pes descriptors
-    df_dict = {dset: from_hdf5(filename_in, dset) for dset in datasets}
+    df_dict = {dset: _read_cached(filename_in, dset, cache) for dset in datasets}
     for k, v in df_dict.items():
         if isinstance(v, list):
             df_dict[k] = v[-1]
@@ -239,16 +351,43 @@ def plot_dset(filename_in: str,
     figsize = (4 * ncols, 6)
 
     # Construct the figures
-    fig, ax_tup = plt.subplots(ncols=ncols, sharex=False, sharey=False)
-    if ncols == 1:
-        ax_tup = (ax_tup,)
+    fig, ax_tup = _get_axes(fig, ncols, figsize, sharex=False, sharey=False)
     for (key, df), ax in zip(df_dict.items(), ax_tup):
-        df.index.name = 'ARMC Iteration'
+        df = df.rename_axis('ARMC Iteration')
         df.plot(ax=ax, title=key, figsize=figsize)
 
     # Save and return the figures
+    _savefig(fig, filename_out, savefig_kwarg)
+    return fig
+
+
+def _read_cached(filename: str, key: str,
+                 cache: Optional[Dict[str, IncrementalDataset]] = None
+                 ) -> Union[NDFrame, List[pd.DataFrame]]:
+    """Read the dataset **key** from **filename**, only reading new iterations if **key** is in **cache**."""  # noqa: E501
+    if cache is None:
+        dset = IncrementalDataset(filename, key)
+    elif key not in cache:
+        dset = cache[key] = IncrementalDataset(filename, key)
+    else:
+        dset = cache[key]
+    dset.update()
+    return dset.data
+
+
+def _get_axes(fig: Optional[PltFigure], ncols: int, figsize: Tuple[float, float],
+              **kwargs: bool) -> Tuple[PltFigure, np.ndarray]:
+    """Return **ncols** new axes in **fig**; **fig** is cleared or, if ``None``, created."""
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig.clf()
+    return fig, fig.subplots(ncols=ncols, squeeze=False, **kwargs)[0]
+
+
+def _savefig(fig: PltFigure, filename: str, savefig_kwarg: Optional[dict] = None) -> None:
+    """Save **fig** to **filename**."""
     if savefig_kwarg is None:
-        plt.savefig(filename_out, dpi=300, quality=100, transparent=True, format='png')
+        fig.savefig(filename, dpi=300, transparent=True, format='png')
     else:
-        plt.savefig(filename_out, **savefig_kwarg)
-    return fig
+        fig.savefig(filename, **savefig_kwarg)
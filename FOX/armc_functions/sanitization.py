@@ -25,7 +25,7 @@ from ..io.read_psf import PSFContainer, overlay_str_file, overlay_rtf_file
 from ..classes.multi_mol import MultiMolecule
 from ..functions.utils import get_template, dict_to_pandas, get_atom_count, _get_move_range
 from ..functions.cp2k_utils import set_keys, set_subsys_kind
-from ..functions.molecule_utils import fix_bond_orders
+from ..functions.molecule_utils import fix_bond_orders, get_bond_matrix
 
 __all__ = ['init_armc_sanitization']
 
@@ -103,7 +103,7 @@ def validate(s: Settings) -> Settings:
     s_flat.armc = schema_armc.validate(s_flat.armc)
     s_flat.move = schema_move.validate(s_flat.move)
     s_flat.param = schema_param.validate(s_flat.param)
-    s_flat.molecule = validate_mol(s_flat.molecule)
+    s_flat.molecule = validate_mol(s_flat.molecule, cache=s_flat.job[('xyz_cache',)])
     for k, v in pes_settings.items():
         schema_pes = get_pes_schema(k)
         pes_settings[k] = schema_pes.validate(v)
@@ -123,7 +123,8 @@ def validate(s: Settings) -> Settings:
     return s_ret
 
 
-def validate_mol(mol: Union[MultiMolecule, str, Iterable]) -> Tuple[MultiMolecule]:
+def validate_mol(mol: Union[MultiMolecule, str, Iterable],
+                 cache: Union[bool, str] = False) -> Tuple[MultiMolecule]:
     """Validate the ``"molecule"`` block and return a tuple of MultiMolecule instance(s).
 
     Parameters
@@ -132,6 +133,11 @@ def validate_mol(mol: Union[MultiMolecule, str, Iterable]) -> Tuple[MultiMolecul
         The path+filename of one or more .xyz file(s) or :class:`.MultiMolecule` instance(s).
         Multiple instances can be supplied by wrapping them in an iterable (*e.g.* a :class:`tuple`)
 
+    cache : |bool|_ or |str|_
+        Whether or not .xyz files should be read using a binary cache
+        (see :func:`.read_multi_xyz_cached`).
+        Alternatively, the path to a cache directory can be provided.
+
     Returns
     -------
     |tuple|_ [|FOX.MultiMolecule|_]
@@ -152,7 +158,7 @@ def validate_mol(mol: Union[MultiMolecule, str, Iterable]) -> Tuple[MultiMolecul
             item.round(3)
             return (item,)
         elif isinstance(item, str):
-            ret = MultiMolecule.from_xyz(item)
+            ret = MultiMolecule.from_xyz(item, cache=cache)
             ret.round(3)
             return (ret,)
         elif not isinstance(item, abc.Iterable):
@@ -192,6 +198,14 @@ def _parse_job(s: Settings) -> Settings:
     s.preopt_settings = job.pop('preopt_settings')
     s.keep_files = job.pop('keep_files')
     s.rmsd_threshold = job.pop('rmsd_threshold')
+    s.input_template = job.pop('input_template')
+    s.scratch_dir = job.pop('scratch_dir')
+    pes_cache = job.pop('pes_cache')
+    s.pes_cache = None if pes_cache is None else join(job.path, pes_cache)
+    s.watchdog = job.pop('watchdog').as_dict()
+    del job['xyz_cache']  # Already used by validate_mol()
+    if job.pop('trajectory_format') == 'dcd':
+        s.md_settings.input.motion.print.trajectory.format = 'DCD'
     return s.pop('job')
 
 
@@ -318,10 +332,11 @@ def _generate_psf(s: Settings, path: str, i: int) -> Optional[PSFContainer]:
 
     # Initialize and populate the psf instance
     psf = PSFContainer()
+    bond_mat = get_bond_matrix(plams_mol)
     psf.generate_bonds(plams_mol)
-    psf.generate_angles(plams_mol)
-    psf.generate_dihedrals(plams_mol)
-    psf.generate_impropers(plams_mol)
+    psf.generate_angles(plams_mol, bond_mat)
+    psf.generate_dihedrals(plams_mol, bond_mat)
+    psf.generate_impropers(plams_mol, bond_mat)
     psf.generate_atoms(plams_mol)
     psf.charge = 0.0
 
@@ -72,7 +72,15 @@ def get_pes_schema(key: str) -> Schema:
         ),
 
         Optional('args', default=[]): And(abc.Sequence,
-                                          error='pes.{}.args expects a sequence'.format(key))
+                                          error='pes.{}.args expects a sequence'.format(key)),
+
+        Optional('stream', default=False): And(bool,
+                                               error='pes.{}.stream expects a boolean'.format(key)),
+
+        Optional('profile', default=False): Or(
+            bool, 'cprofile', 'tracemalloc',
+            error=('pes.{}.profile expects a boolean, "cprofile" or "tracemalloc"'.format(key))
+        )
     })
     return schema_pes
 
@@ -131,7 +139,27 @@ schema_job: Schema = Schema({
 
     ('path',): And(str, error='job.path expects a string'),
 
-    ('rmsd_threshold',): And(_float, Use(float), error='job.rmsd_threshold expects a float')
+    ('rmsd_threshold',): And(_float, Use(float), error='job.rmsd_threshold expects a float'),
+
+    ('trajectory_format',): And(str, Use(str.lower), lambda x: x in {'xyz', 'dcd'},
+                                error="job.trajectory_format expects either 'xyz' or 'dcd'"),
+
+    ('input_template',): And(bool, error='job.input_template expects a boolean'),
+
+    ('scratch_dir',): Or(None, str, error='job.scratch_dir expects a string or None'),
+
+    ('pes_cache',): Or(None, str, error='job.pes_cache expects a string or None'),
+
+    ('xyz_cache',): Or(bool, str, error='job.xyz_cache expects a boolean or string'),
+
+    ('watchdog', 'min_distance'): Or(None, And(_float, Use(float)),
+                                     error='job.watchdog.min_distance expects a float or None'),
+
+    ('watchdog', 'max_rmsd'): Or(None, And(_float, Use(float)),
+                                 error='job.watchdog.max_rmsd expects a float or None'),
+
+    ('watchdog', 'interval'): And(_float, lambda x: x > 0, Use(float),
+                                  error='job.watchdog.interval expects a positive float')
 })
 
 #: Schema for validating the ``"param"`` block.
@@ -0,0 +1,217 @@
+"""
+FOX.armc_functions.timer
+========================
+
+A module for measuring the wall time and peak memory usage of the various stages of ARMC.
+
+Index
+-----
+.. currentmodule:: FOX.armc_functions.timer
+.. autosummary::
+    StageTimer
+    StageTimer.span
+    StageTimer.reset
+    StageTimer.commit
+    StageTimer.summary
+    get_peak_rss
+    reset_peak_rss
+
+API
+---
+.. autoclass:: StageTimer
+.. automethod:: StageTimer.span
+.. automethod:: StageTimer.reset
+.. automethod:: StageTimer.commit
+.. automethod:: StageTimer.summary
+.. autofunction:: get_peak_rss
+.. autofunction:: reset_peak_rss
+
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Tuple, List, Dict, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+__all__ = ['StageTimer', 'get_peak_rss', 'reset_peak_rss']
+
+#: The default stages of a single ARMC iteration.
+STAGES: Tuple[str, ...] = ('move', 'md', 'parse', 'pes_post_process', 'pes', 'aux_error', 'hdf5')
+
+
+def get_peak_rss() -> float:
+    """Return the peak resident set size (RSS) of the current process in MiB.
+
+    On Linux the peak RSS is measured since the last call to :func:`reset_peak_rss`.
+    The peak RSS over the entire lifetime of the process is returned otherwise;
+    ``nan`` is returned if the latter is unavailable.
+
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+
+    if resource is None:
+        return np.nan
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 2**20 if sys.platform == 'darwin' else max_rss / 2**10  # bytes vs KiB
+
+
+def reset_peak_rss() -> None:
+    """Reset the peak RSS as reported by :func:`get_peak_rss`; a no-op if not on Linux."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+class StageTimer:
+    """A class for recording the wall time and peak RSS of the stages of ARMC iterations.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX.armc_functions.timer import StageTimer
+
+        >>> timer = StageTimer()
+        >>> with timer.span('md'):
+        ...     ...
+        >>> with timer.span('pes'):
+        ...     ...
+
+        >>> row = timer.commit()  # Finalize the current iteration
+        >>> print(timer.summary())  # doctest: +SKIP
+                          mean time (s)  total time (s)  peak RSS (MiB)
+        stage
+        move                        NaN             NaN             NaN
+        md                     0.000004        0.000004       71.242188
+        ...
+
+    Parameters
+    ----------
+    stages : :class:`Iterable<collections.abc.Iterable>` [:class:`str`]
+        The names of all stages.
+
+    Attributes
+    ----------
+    stages : :class:`tuple` [:class:`str`]
+        The names of all stages.
+
+    time : :class:`numpy.ndarray` [:class:`float`]
+        The wall time, in seconds, of each stage during the current iteration.
+        Stages entered multiple times accumulate their wall time.
+
+    peak_rss : :class:`numpy.ndarray` [:class:`float`]
+        The peak RSS, in MiB, of each stage during the current iteration (see :func:`get_peak_rss`).
+
+    history : :class:`list` [:class:`numpy.ndarray`]
+        All rows returned by :meth:`StageTimer.commit` since the last call
+        to :meth:`StageTimer.summary`.
+
+    """
+
+    __slots__ = ('stages', 'time', 'peak_rss', 'history', '_index', '_active')
+
+    def __init__(self, stages: Iterable[str] = STAGES) -> None:
+        """Initialize a :class:`StageTimer` instance."""
+        self.stages = tuple(stages)
+        self._index: Dict[str, int] = {k: i for i, k in enumerate(self.stages)}
+        self._active: List[int] = []
+        self.history: List[np.ndarray] = []
+        self.reset()
+
+    def __repr__(self) -> str:
+        """Implement :func:`repr(self)<repr>`."""
+        return f'{self.__class__.__name__}(stages={self.stages!r})'
+
+    @property
+    def index(self) -> pd.MultiIndex:
+        """Get the index of the rows returned by :meth:`StageTimer.commit`."""
+        return pd.MultiIndex.from_product([self.stages, ['time', 'peak_rss']])
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Return a context manager for measuring the wall time and peak RSS of **stage**."""
+        i = self._index[stage]
+        self._update_rss()
+        reset_peak_rss()
+
+        self._active.append(i)
+        start = time.perf_counter()
+        try:
+            yield None
+        finally:
+            dt = time.perf_counter() - start
+            self.time[i] = np.nansum([self.time[i], dt])
+            self._update_rss()
+            self._active.pop()
+
+    def _update_rss(self) -> None:
+        """Update the peak RSS of all currently active stages, including enclosing stages."""
+        if not self._active:
+            return None
+        rss = get_peak_rss()
+        idx = self._active
+        self.peak_rss[idx] = np.fmax(self.peak_rss[idx], rss)
+
+    def reset(self) -> None:
+        """Reset :attr:`StageTimer.time` and :attr:`StageTimer.peak_rss`."""
+        self.time = np.full(len(self.stages), np.nan)
+        self.peak_rss = np.full(len(self.stages), np.nan)
+
+    def commit(self) -> np.ndarray:
+        """Finalize the current iteration and return its wall times and peak RSSs.
+
+        The returned array is appended to :attr:`StageTimer.history`,
+        the timer being reset afterwards.
+        Its elements are ordered according to :attr:`StageTimer.index`.
+
+        """
+        ret = np.stack([self.time, self.peak_rss], axis=1).ravel()
+        self.history.append(ret)
+        self.reset()
+        return ret
+
+    def summary(self, clear: bool = True) -> pd.DataFrame:
+        """Summarize the wall times and peak RSSs of all iterations in :attr:`StageTimer.history`.
+
+        Parameters
+        ----------
+        clear : :class:`bool`
+            Whether or not :attr:`StageTimer.history` should be cleared afterwards.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            A DataFrame with the mean and total wall time and the peak RSS of every stage.
+
+        """
+        history = np.array(self.history, ndmin=2).reshape(-1, len(self.stages), 2)
+        if clear:
+            self.history = []
+
+        time_ar, rss_ar = history[..., 0], history[..., 1]
+        count = np.count_nonzero(~np.isnan(time_ar), axis=0)
+        total = np.where(count, np.nansum(time_ar, axis=0), np.nan)
+        with np.errstate(invalid='ignore'):
+            mean = total / count
+
+        return pd.DataFrame({
+            'mean time (s)': mean,
+            'total time (s)': total,
+            'peak RSS (MiB)': np.fmax.reduce(rss_ar, axis=0) if len(rss_ar) else np.nan
+        }, index=pd.Index(self.stages, name='stage'))
@@ -0,0 +1,242 @@
+"""
+FOX.armc_functions.watchdog
+===========================
+
+A module for terminating diverging molecular dynamics simulations at an early stage.
+
+Index
+-----
+.. currentmodule:: FOX.armc_functions.watchdog
+.. autosummary::
+    MDWatchdog
+    MDWatchdog.poll
+    MDWatchdog.check_frame
+
+API
+---
+.. autoclass:: MDWatchdog
+.. automethod:: MDWatchdog.poll
+.. automethod:: MDWatchdog.check_frame
+
+"""
+
+import os
+import logging
+import threading
+from typing import Optional, List, Callable
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from scm.plams.core.basejob import Job
+
+from ..logger import DEFAULT_LOGGER
+from ..io.read_dcd import read_dcd, DCDError
+from ..functions.cp2k_utils import get_trajectory_format
+
+__all__ = ['MDWatchdog']
+
+
+class MDWatchdog(threading.Thread):
+    """A thread which inspects the trajectory of a running CP2K job.
+
+    The trajectory is read incrementally, every **interval** seconds,
+    and all new frames are checked with :meth:`MDWatchdog.check_frame`.
+    If a frame crosses one of the thresholds the job is terminated by
+    creating a CP2K ``EXIT`` file in its working directory and
+    :attr:`MDWatchdog.reason` is set.
+    All new frames are furthermore passed to **callback**, if specified,
+    including the frames written after the final inspection.
+    If **callback** raises an exception it is logged and disabled,
+    while the trajectory remains inspected for the remainder of the job.
+
+    The thread is only started if at least one threshold or a callback is specified;
+    it is designed to be used as a context manager around :meth:`Job.run()<scm.plams.core.basejob.Job.run>`.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from scm.plams import Cp2kJob
+        >>> from FOX.armc_functions.watchdog import MDWatchdog
+
+        >>> job = Cp2kJob(...)
+        >>> with MDWatchdog(job, min_distance=0.5, max_rmsd=10.0) as watchdog:
+        ...     results = job.run()
+
+        >>> if watchdog.tripped:
+        ...     print(watchdog.reason)
+
+    Parameters
+    ----------
+    job : :class:`Job<scm.plams.core.basejob.Job>`
+        The to-be inspected job.
+        Its :attr:`~scm.plams.core.basejob.Job.path` is used for locating the trajectory;
+        the latter can be either an .xyz or a .dcd file.
+
+    min_distance : :class:`float`, optional
+        The minimum allowed interatomic distance in Angstrom.
+
+    max_rmsd : :class:`float`, optional
+        The maximum allowed root mean square displacement (RMSD) in Angstrom,
+        calculated with respect to the first frame of the trajectory.
+
+    interval : :class:`float`
+        The time in seconds between two consecutive trajectory inspections.
+
+    callback : :class:`Callable<collections.abc.Callable>`, optional
+        A callable which is called with an :math:`m*n*3` array containing
+        the cartesian coordinates of all :math:`m` new frames.
+        Used for accumulating PES descriptors while the job is running
+        (see :class:`PESAccumulator<FOX.armc_functions.pes_stream.PESAccumulator>`).
+
+    logger : :class:`logging.Logger`, optional
+        The logger used for reporting exceptions raised by **callback**.
+        Defaults to :data:`DEFAULT_LOGGER<FOX.logger.DEFAULT_LOGGER>`.
+
+    Attributes
+    ----------
+    reason : :class:`str`, optional
+        A description of the crossed threshold; ``None`` if the job has not been terminated.
+
+    """  # noqa: E501
+
+    def __init__(self, job: Job, min_distance: Optional[float] = None,
+                 max_rmsd: Optional[float] = None, interval: float = 1.0,
+                 callback: Optional[Callable[[np.ndarray], None]] = None,
+                 logger: Optional[logging.Logger] = None) -> None:
+        """Initialize a :class:`MDWatchdog` instance."""
+        super().__init__(name=f'{self.__class__.__name__}-{job.name}', daemon=True)
+        self.job = job
+        self.min_distance = min_distance
+        self.max_rmsd = max_rmsd
+        self.interval = interval
+        self.callback = callback
+        self.logger = logger if logger is not None else DEFAULT_LOGGER
+        self.reason: Optional[str] = None
+
+        self._stop_event = threading.Event()
+        self._ref: Optional[np.ndarray] = None
+        self._offset = 0
+        self._frame_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether or not at least one threshold or a callback has been specified."""
+        return self.min_distance is not None or self.max_rmsd is not None or bool(self.callback)
+
+    @property
+    def tripped(self) -> bool:
+        """Return whether or not the job has been terminated by this instance."""
+        return self.reason is not None
+
+    def __enter__(self) -> 'MDWatchdog':
+        """Enter the context manager; start the thread if :attr:`MDWatchdog.enabled` is ``True``."""  # noqa: E501
+        if self.enabled:
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the context manager; stop and join the thread and pass any remaining frames to the callback."""  # noqa: E501
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+        if exc_type is None and self.callback is not None and not self.tripped:
+            self.poll()
+
+    def run(self) -> None:
+        """Inspect the trajectory every :attr:`MDWatchdog.interval` seconds."""
+        while not self._stop_event.wait(self.interval):
+            if self.poll():
+                self._terminate()
+                return None
+
+    def _terminate(self) -> None:
+        """Create a CP2K ``EXIT`` file, requesting CP2K to stop after the current MD step."""
+        with open(os.path.join(self.job.path, 'EXIT'), 'w'):
+            pass
+
+    def poll(self) -> bool:
+        """Read and check all new frames; return ``True`` if a threshold has been crossed."""
+        filename = self._get_trajectory()
+        if filename is None:
+            return False
+
+        try:
+            if filename.endswith('.dcd'):
+                frames = read_dcd(filename, mol_subset=slice(self._frame_count, None))
+            else:
+                frames = self._read_xyz(filename)
+        except DCDError:  # The header has not been written yet
+            return False
+
+        for xyz in frames:
+            self._frame_count += 1
+            if self.check_frame(xyz):
+                return True
+
+        if self.callback is not None and len(frames):
+            try:
+                self.callback(np.asarray(frames))
+            except Exception as ex:  # Stop streaming; the thresholds are still checked
+                self.logger.error(f"Disabling the callback of {self.name}; "
+                                  f"{ex.__class__.__name__}: {ex}", exc_info=True)
+                self.callback = None
+        return False
+
+    def check_frame(self, xyz: np.ndarray) -> bool:
+        """Check a single :math:`n*3` array of cartesian coordinates.
+
+        The first frame is used as reference for the RMSD.
+        Return ``True`` and set :attr:`MDWatchdog.reason` if a threshold has been crossed.
+
+        """
+        if self._ref is None:
+            self._ref = xyz
+
+        if self.max_rmsd is not None:
+            rmsd = np.sqrt(((xyz - self._ref)**2).sum(axis=1).mean())
+            if rmsd > self.max_rmsd:
+                self.reason = (f"RMSD of frame {self._frame_count} exceeds "
+                               f"{self.max_rmsd} Angstrom: {rmsd:.4f}")
+                return True
+
+        if self.min_distance is not None and len(xyz) > 1:
+            dist = cKDTree(xyz).query(xyz, k=2)[0][:, 1].min()
+            if dist < self.min_distance:
+                self.reason = (f"Interatomic distance in frame {self._frame_count} is below "
+                               f"{self.min_distance} Angstrom: {dist:.4f}")
+                return True
+        return False
+
+    def _get_trajectory(self) -> Optional[str]:
+        """Return the path+filename of the trajectory or ``None`` if it does not exist (yet)."""
+        path = self.job.path
+        if path is None or not os.path.isdir(path):
+            return None
+
+        ext = '.' + get_trajectory_format(self.job.settings)
+        for file in os.listdir(path):
+            if '-pos' in file and file.endswith(ext):
+                return os.path.join(path, file)
+        return None
+
+    def _read_xyz(self, filename: str) -> List[np.ndarray]:
+        """Read all complete frames which have been appended to **filename** since the last call."""  # noqa: E501
+        with open(filename, 'rb') as f:
+            f.seek(self._offset)
+            lines: List[bytes] = f.read().split(b'\n')[:-1]  # Ignore the last incomplete line
+
+        ret = []
+        i = 0
+        while i < len(lines):
+            try:
+                j = i + 2 + int(lines[i])
+                if j > len(lines):
+                    break
+                ret.append(np.array([k.split()[1:4] for k in lines[i+2:j]], dtype=float))
+            except ValueError:  # Not a valid .xyz frame
+                break
+            self._offset += sum(len(k) + 1 for k in lines[i:j])
+            i = j
+        return ret
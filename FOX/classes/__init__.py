@@ -6,12 +6,16 @@ Various classes implemented in Auto-FOX.
 
 """
 
-from .frozen_settings import FrozenSettings
-from .multi_mol import MultiMolecule
-from .armc import ARMC, run_armc
+from ..functions.lazy import lazy_loader
 
 __all__ = [
-    'FrozenSettings'
+    'FrozenSettings',
     'MultiMolecule',
     'ARMC', 'run_armc',
 ]
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    '.frozen_settings': ['FrozenSettings'],
+    '.multi_mol': ['MultiMolecule'],
+    '.armc': ['ARMC', 'run_armc'],
+})
@@ -22,11 +22,14 @@ API
 import os
 import io
 import logging
-from typing import Tuple, Dict, Any, Optional, Iterable, Callable, Mapping, Union, AnyStr
+from typing import (
+    Tuple, Dict, Any, Optional, Iterable, Callable, Mapping, Union, AnyStr, List, Sequence
+)
 from contextlib import AbstractContextManager, redirect_stdout
 
 import yaml
 import numpy as np
+import pandas as pd
 
 from scm.plams import init, finish, config, Settings
 
@@ -43,6 +46,11 @@ from ..armc_functions.sanitization import init_armc_sanitization
 
 __all__ = ['ARMC', 'run_armc']
 
+#: A block of reference PES descriptors with identical shapes;
+#: the indices of the matching keys, the stacked descriptors, their normalization factors
+#: and whether or not NaNs should be skipped (see :meth:`ARMC.get_aux_error`).
+AuxBlock = Tuple[np.ndarray, np.ndarray, np.ndarray, bool]
+
 try:
     Dumper = yaml.CDumper
 except AttributeError:
@@ -94,10 +102,13 @@ def run_armc(armc: 'ARMC',
                               lambda n: 'Trying to obtain results of crashed or failed job' in n)
 
         with redirect_stdout(writer):
-            if not restart:  # To restart or not? That's the question
-                armc()
-            else:
-                armc.restart()
+            try:
+                if not restart:  # To restart or not? That's the question
+                    armc()
+                else:
+                    armc.restart()
+            finally:
+                armc.clear_scratch_dir()
 
 
 def _get_armc_logger(logfile: Optional[str], name: str, **kwargs) -> logging.Logger:
@@ -153,6 +164,8 @@ class ARMC(MonteCarlo):
 
     """
 
+    _PRIVATE_ATTR = MonteCarlo._PRIVATE_ATTR | {'_aux_ref', '_hdf5_timings'}
+
     @property
     def super_iter_len(self) -> int:
         """Get :attr:`ARMC.iter_len` ``//`` :attr:`ARMC.sub_iter_len`."""
@@ -174,6 +187,12 @@ class ARMC(MonteCarlo):
         self.phi: float = phi
         self.apply_phi: Callable[[float, float], float] = apply_phi
 
+        # Stacked reference PES descriptors; see ARMC.get_aux_error()
+        self._aux_ref: Tuple[Tuple[str, ...], Tuple[Any, ...], List[AuxBlock]] = ((), (), [])
+
+        # Whether or not ARMC.hdf5_file contains the "timings" dataset; see ARMC.__call__()
+        self._hdf5_timings: bool = True
+
     @classmethod
     def from_yaml(cls, filename: str) -> Tuple['ARMC', dict]:
         """Create a :class:`.ARMC` instance from a .yaml file.
@@ -201,7 +220,8 @@ class ARMC(MonteCarlo):
         s, pes_kwarg, job_kwarg = init_armc_sanitization(yaml_dict)
         self = cls.from_dict(s)
         for name, options in pes_kwarg.items():
-            self.add_pes_evaluator(name, options.func, options.args, options.kwargs)
+            self.add_pes_evaluator(name, options.func, options.args, options.kwargs,
+                                   options.stream, options.profile)
         return self, job_kwarg
 
     def to_yaml(self, filename: Union[AnyStr, os.PathLike, io.IOBase],
@@ -244,6 +264,10 @@ class ARMC(MonteCarlo):
             s.job.folder = folder
         s.job.keep_files = self.keep_files
         s.job.rmsd_threshold = self.rmsd_threshold
+        s.job.input_template = self.input_template
+        s.job.scratch_dir = self.scratch_dir
+        s.job.pes_cache = self.pes_cache
+        s.job.watchdog = self.watchdog
         s.job.job_type = f'{self.job_type.func.__module__}.{self.job_type.func.__qualname__}'
         s.job.name = self.job_type.keywords['name']
         s.job.preopt_settings = self.preopt_settings[0] if self.preopt_settings else None
@@ -271,6 +295,8 @@ class ARMC(MonteCarlo):
             pes_dict = s.pes[name.rsplit('.', maxsplit=1)[0]]
             pes_dict.func = f'{partial.func.__module__}.{partial.func.__qualname__}'
             pes_dict.args = list(partial.args)
+            pes_dict.stream = getattr(partial, 'stream', False)
+            pes_dict.profile = getattr(partial, 'profile', False)
             if 'kwargs' not in pes_dict:
                 pes_dict.kwargs = []
             pes_dict.kwargs.append(partial.keywords)
@@ -296,12 +322,17 @@ class ARMC(MonteCarlo):
                 self.logger.critical(f'{ex.__class__.__name__}: {ex}', exc_info=True)
                 raise ex
             self.clear_job_cache()
+            self._hdf5_timings = True
+            self._timer.reset()
 
         elif key_new is None:
             ex = TypeError("'key_new' cannot be 'None' if 'start' is larger than 0")
             self.logger.critical(f'{ex.__class__.__name__}: {ex}', exc_info=True)
             raise ex
 
+        else:
+            self._check_hdf5_timings()
+
         # Start the main loop
         for kappa in range(start, self.super_iter_len):
             acceptance = np.zeros(self.sub_iter_len, dtype=bool)
@@ -310,11 +341,18 @@ class ARMC(MonteCarlo):
             for omega in range(self.sub_iter_len):
                 key_new = self.do_inner(kappa, omega, acceptance, key_new)
             self.update_phi(acceptance)
+            self._log_timings(kappa)
 
     def do_inner(self, kappa: int, omega: int, acceptance: np.ndarray,
                  key_old: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
         r"""Run the inner loop of the :meth:`ARMC.__call__` method.
 
+        The wall time and peak RSS of the various stages of the inner loop are
+        exported to the ``"timings"`` dataset of the .hdf5 file
+        (see :class:`StageTimer<FOX.armc_functions.timer.StageTimer>`).
+        As the timings are exported along with all other results,
+        the ``"hdf5"`` stage of each row refers to the export of the preceding iteration.
+
         Parameters
         ----------
         kappa : int
@@ -336,13 +374,15 @@ class ARMC(MonteCarlo):
 
         """
         # Step 1: Perform a random move
-        key_new = self.move()
+        with self._timer.span('move'):
+            key_new = self.move()
 
         # Step 2: Check if the move has been performed already; calculate PES descriptors if not
         pes_new, mol_list = self.get_pes_descriptors(key_new)
 
         # Step 3: Evaluate the auxiliary error; accept if the new parameter set lowers the error
-        aux_new = self.get_aux_error(pes_new)
+        with self._timer.span('aux_error'):
+            aux_new = self.get_aux_error(pes_new)
         aux_old = self[key_old]
         error_change = (aux_new - aux_old).sum()
         accept = error_change < 0
@@ -362,12 +402,48 @@ class ARMC(MonteCarlo):
             key_new = key_old
 
         # Step 5: Export the results to HDF5
-        hdf5_kwarg = self._hdf5_kwarg(mol_list, accept, aux_new, pes_new)
-        to_hdf5(self.hdf5_file, hdf5_kwarg, kappa, omega)
+        with self._timer.span('hdf5'):
+            hdf5_kwarg = self._hdf5_kwarg(mol_list, accept, aux_new, pes_new)
+            timings = self._timer.commit()  # The remainder of this stage ends up in the next row
+            if self._hdf5_timings:
+                hdf5_kwarg['timings'] = timings
+            to_hdf5(self.hdf5_file, hdf5_kwarg, kappa, omega)
         if not accept:
             self.param['param'] = self.param['param_old']
         return key_new
 
+    def _check_hdf5_timings(self) -> None:
+        """Check if :attr:`ARMC.hdf5_file` contains the ``"timings"`` dataset.
+
+        .hdf5 files created prior to Auto-FOX 0.7.5 lack aforementioned dataset,
+        in which case the timings are exclusively logged.
+
+        """
+        import h5py
+
+        with h5py.File(self.hdf5_file, 'r', libver='latest') as f:
+            has_timings = 'timings' in f
+        if self._hdf5_timings and not has_timings:
+            self.logger.warning(f"No 'timings' dataset found in ...{os.sep}"
+                                f"{os.path.basename(self.hdf5_file)}; timings will not be exported")
+        self._hdf5_timings = has_timings
+
+    def _log_timings(self, kappa: int) -> None:
+        """Log the wall time and peak RSS of all stages of the **kappa**-th super-iteration.
+
+        See :class:`StageTimer<FOX.armc_functions.timer.StageTimer>`.
+        The statistics of all profiled PES evaluators are dumped afterwards,
+        :mod:`cProfile` statistics being stored next to :attr:`ARMC.hdf5_file`
+        (see :meth:`ARMC.dump_pes_profile`).
+
+        """
+        df = self._timer.summary()
+        self.logger.info(f"Timings of super-iteration {kappa}:\n"
+                         f"{df.to_string(float_format='{:.3f}'.format)}\n")
+
+        path = os.path.dirname(os.path.abspath(self.hdf5_file))
+        self.dump_pes_profile(os.path.join(path, f'pes_profile.{kappa}.{{}}.prof'))
+
     def _get_first_key(self) -> Tuple[np.ndarray, ...]:
         """Create a the ``history_dict`` variable and its first key.
 
@@ -439,6 +515,11 @@ class ARMC(MonteCarlo):
                 \frac{ \sum_{i}^{N} |r_{i}^{QM} - r_{i}^{MM}|^2 }
                 {r_{i}^{QM}}
 
+        The error of DataFrames is calculated per column and then summed.
+        All reference PES descriptors of identical shape are stacked into a single array
+        (see :meth:`ARMC._get_aux_blocks`), the auxiliary errors of each stack being calculated
+        in a single vectorized operation.
+
         Parameters
         ----------
         pes_dict : [|dict|_ [str, |np.ndarray|_ [|np.float64|_]]
@@ -450,19 +531,90 @@ class ARMC(MonteCarlo):
             An array with :math:`m*n` auxilary errors
 
         """
-        def norm_mean(key: str, mm: np.ndarray) -> float:
-            qm = self.pes[key].ref  # qm and mm should be array-like
-            delta = np.abs(qm - mm)**2
-            ret = delta.sum() / np.abs(qm).sum()
-            return np.asarray(ret, dtype=float).sum()
+        keys = tuple(pes_dict.keys())
+        length = 1 + max(int(k.rsplit('.')[-1]) for k in keys)
+
+        ret = np.empty(len(keys), dtype=float)
+        for idx, qm, denom, skipna in self._get_aux_blocks(keys):
+            shape = qm.shape[1:]
+            mm_list = [self._as_aux_array(pes_dict[keys[i]], shape, self.pes[keys[i]].ref) for
+                       i in idx]
+            if any(mm is None for mm in mm_list):  # Misaligned descriptors; fall back to pandas
+                ret[idx] = [self._norm_mean(self.pes[keys[i]].ref, pes_dict[keys[i]]) for
+                            i in idx]
+                continue
+
+            sum_func = np.nansum if skipna else np.sum
+            with np.errstate(divide='ignore', invalid='ignore'):
+                delta = sum_func((qm - np.array(mm_list))**2, axis=1)
+                ret[idx] = (delta / denom).sum(axis=1)
 
-        length = 1 + max(int(k.rsplit('.')[-1]) for k in pes_dict.keys())
-
-        generator = (norm_mean(k, v) for k, v in pes_dict.items())
-        ret = np.fromiter(generator, dtype=float, count=len(pes_dict))
         ret.shape = length, -1
         return ret
 
+    def _get_aux_blocks(self, keys: Sequence[str]) -> List[AuxBlock]:
+        """Return (and cache) the reference PES descriptors of **keys**, stacked by shape.
+
+        DataFrames are converted into 2D arrays; all other objects are
+        converted into arrays with a single column.
+        NaNs are skipped when summing over the rows of pandas objects.
+
+        """
+        refs = tuple(self.pes[k].ref for k in keys)
+        cached_keys, cached_refs, blocks = self._aux_ref
+        if cached_keys == keys and all(i is j for i, j in zip(cached_refs, refs)):
+            return blocks
+
+        groups: Dict[Tuple[Tuple[int, ...], bool], List[int]] = {}
+        for i, ref in enumerate(refs):
+            skipna = isinstance(ref, (pd.DataFrame, pd.Series))  # Mimic DataFrame.sum()
+            shape = ref.shape if isinstance(ref, pd.DataFrame) else (np.size(ref), 1)
+            groups.setdefault((shape, skipna), []).append(i)
+
+        blocks = []
+        for (shape, skipna), idx in groups.items():
+            qm = np.array([self._as_aux_array(refs[i], shape) for i in idx])
+            sum_func = np.nansum if skipna else np.sum
+            blocks.append((np.array(idx), qm, sum_func(np.abs(qm), axis=1), skipna))
+
+        self._aux_ref = keys, refs, blocks
+        return blocks
+
+    @staticmethod
+    def _as_aux_array(value: Any, shape: Tuple[int, int],
+                      ref: Any = None) -> Optional[np.ndarray]:
+        """Convert a PES descriptor into a 2D array of the given **shape**.
+
+        Scalars (*e.g.* ``np.inf`` for crashed jobs) are broadcasted;
+        return ``None`` if **value** cannot be aligned with the reference.
+        If the reference **ref** is specified then the labels of pandas objects
+        must be identical to those of **ref**, as pandas would otherwise align them.
+
+        """
+        if isinstance(value, pd.DataFrame):
+            if ref is not None and not (isinstance(ref, pd.DataFrame) and
+                                        value.index.equals(ref.index) and
+                                        value.columns.equals(ref.columns)):
+                return None
+            return value.values if value.shape == shape else None
+        elif isinstance(value, pd.Series) and ref is not None:
+            if not (isinstance(ref, pd.Series) and value.index.equals(ref.index)):
+                return None
+
+        ret = np.asarray(value, dtype=float)
+        if ret.ndim == 0:
+            return np.broadcast_to(ret, shape)
+        elif ret.size != shape[0] or shape[1] != 1:
+            return None
+        return ret.reshape(shape)
+
+    @staticmethod
+    def _norm_mean(qm: Any, mm: Any) -> float:
+        """Calculate the auxiliary error of a single (misaligned) PES descriptor with pandas."""
+        delta = np.abs(qm - mm)**2
+        ret = delta.sum() / np.abs(qm).sum()
+        return np.asarray(ret, dtype=float).sum()
+
     def update_phi(self, acceptance: np.ndarray) -> None:
         r"""Update the variable :math:`\phi`.
 
@@ -511,10 +663,13 @@ class ARMC(MonteCarlo):
                                 "file status was forcibly reset")
 
         # Finish the current set of sub-iterations
+        self._check_hdf5_timings()
+        self._timer.reset()
         j += 1
         for omega in range(j, self.sub_iter_len):
             key = self.do_inner(i, omega, acceptance, key)
         self.update_phi(acceptance)
+        self._log_timings(i)
         i += 1
 
         # And continue
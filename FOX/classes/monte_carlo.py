@@ -36,15 +36,23 @@ from typing import (
 import numpy as np
 import pandas as pd
 
-from scm.plams import Molecule, Settings, Cp2kJob, Cp2kResults, add_to_class
+from scm.plams import Molecule, Settings, Cp2kJob, Cp2kResults, JobManager, add_to_class, config
 from scm.plams.core.basejob import Job
 from assertionlib.dataclass import AbstractDataClass
 
 from .multi_mol import MultiMolecule
 from ..logger import get_logger
 from ..io.read_xyz import XYZError
-from ..functions.utils import _get_move_range
+from ..io.read_dcd import DCDError
+from ..io.cp2k_template import CP2KTemplate
+from ..armc_functions.watchdog import MDWatchdog
+from ..armc_functions.pes_stream import PESAccumulator
+from ..armc_functions.pes_cache import get_pes_cached
+from ..armc_functions.pes_profile import PESProfiler, get_profile_summary
+from ..armc_functions.timer import StageTimer
+from ..functions.utils import _get_move_range, group_by_values
 from ..functions.charge_utils import update_charge
+from ..functions.cp2k_utils import get_trajectory_format
 
 if version_info.minor < 7:
     from collections import OrderedDict  # noqa
@@ -63,6 +71,65 @@ def get_xyz_path(self):
     raise FileNotFoundError('No .xyz files found in ' + self.job.path)
 
 
+@add_to_class(Cp2kResults)
+def get_dcd_path(self):
+    """Return the path + filename to a .dcd file."""
+    for file in self.files:
+        if '-pos' in file and '.dcd' in file:
+            return self[file]
+    raise FileNotFoundError('No .dcd files found in ' + self.job.path)
+
+
+@add_to_class(Cp2kResults)
+def get_trajectory_path(self):
+    """Return the path + filename to either an .xyz or .dcd trajectory.
+
+    A .dcd file is returned if it has been requested in the job settings
+    (*i.e.* ``input.motion.print.trajectory.format = "DCD"``).
+
+    """
+    if get_trajectory_format(self.job.settings) == 'dcd':
+        return self.get_dcd_path()
+    return self.get_xyz_path()
+
+
+#: A dictionary with all scratch job managers; keys consist of a path and folder name.
+_SCRATCH_MANAGERS: Dict[Tuple[str, str], JobManager] = {}
+
+
+def _get_scratch_manager(path: str, folder: str) -> JobManager:
+    """Return a cached PLAMS job manager whose working directory is located in **path**.
+
+    The job manager is stored at the module level rather than in a :class:`MonteCarlo` instance,
+    as the latter must remain (deep) copyable.
+
+    """
+    try:
+        return _SCRATCH_MANAGERS[path, folder]
+    except KeyError:
+        os.makedirs(path, exist_ok=True)
+        ret = _SCRATCH_MANAGERS[path, folder] = JobManager(config.jobmanager, path=path,
+                                                           folder=folder)
+        return ret
+
+
+def _move_unique(src: str, dst_dir: str) -> str:
+    """Move the directory **src** into **dst_dir** and return its new path.
+
+    A numerical suffix is appended to the directory name (*e.g.* ``"job.002"``)
+    if **dst_dir** already contains a file or directory of the same name.
+
+    """
+    name = os.path.basename(os.path.normpath(src))
+    dst = os.path.join(dst_dir, name)
+    i = 2
+    while os.path.exists(dst):
+        dst = os.path.join(dst_dir, f'{name}.{i:03d}')
+        i += 1
+    shutil.move(src, dst)
+    return dst
+
+
 PostProcess = Callable[[Optional[Iterable[MultiMolecule]], Optional['MonteCarlo']], None]
 
 
@@ -91,6 +158,10 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         else:
             self._md_settings = tuple(Settings(i) for i in value)
 
+        # The cached input templates are constructed from the old settings
+        if hasattr(self, '_input_template'):
+            self._input_template.pop('md_settings', None)
+
     @property
     def preopt_settings(self) -> Tuple[Settings, ...]:
         """Get **value** or set **value** as a |plams.Settings| instance."""
@@ -105,6 +176,10 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         else:
             self._preopt_settings = tuple(Settings(i) for i in value)
 
+        # The cached input templates are constructed from the old settings
+        if hasattr(self, '_input_template'):
+            self._input_template.pop('preopt_settings', None)
+
     @property
     def move_range(self) -> np.ndarray:
         """Get **value** or set **value** as a |np.ndarray|_."""
@@ -153,7 +228,8 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         else:
             self._pes_post_process = (value,)
 
-    _PRIVATE_ATTR = frozenset({'_plams_molecule', 'job_cache'})
+    _PRIVATE_ATTR = frozenset({'_plams_molecule', 'job_cache', '_input_template', '_pes_stream',
+                               '_timer', '_pes_profiler'})
 
     def __init__(self, molecule: Union[MultiMolecule, Iterable[MultiMolecule]],
                  param: pd.DataFrame,
@@ -166,7 +242,11 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
                  move_range: Optional[np.ndarray] = None,
                  keep_files: bool = False,
                  logger: Optional[logging.Logger] = None,
-                 pes_post_process: Union[PostProcess, Iterable[PostProcess]] = None) -> None:
+                 pes_post_process: Union[PostProcess, Iterable[PostProcess]] = None,
+                 input_template: bool = False,
+                 scratch_dir: Optional[str] = None,
+                 watchdog: Optional[Mapping[str, Optional[float]]] = None,
+                 pes_cache: Optional[str] = None) -> None:
         """Initialize a :class:`MonteCarlo` instance."""
         super().__init__()
 
@@ -181,7 +261,14 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         self.preopt_settings: Optional[Settings] = preopt_settings
         self.rmsd_threshold: float = rmsd_threshold
         self.keep_files: bool = keep_files
+        self.scratch_dir: Optional[str] = scratch_dir
+        self.watchdog: Dict[str, Optional[float]] = dict(watchdog) if watchdog else {}
         self.pes_post_process: Tuple[PostProcess, ...] = pes_post_process
+        self.pes_cache: Optional[str] = pes_cache
+
+        # Compiled CP2K input templates; see MonteCarlo.get_input_template()
+        self.input_template: bool = input_template
+        self._input_template: Dict[str, Tuple[CP2KTemplate, ...]] = {}
 
         # HDF5 settings
         self.hdf5_file: str = hdf5_file
@@ -198,6 +285,15 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         self.pes: Dict[str, Callable[[np.ndarray], np.ndarray]] = OrderedDict()
         self.job_cache: List[Job] = []
 
+        # PES descriptors accumulated during the last MD simulation; see MonteCarlo._md()
+        self._pes_stream: Dict[str, PESAccumulator] = {}
+
+        # The wall time and peak RSS of the various stages of the current iteration
+        self._timer = StageTimer()
+
+        # Opt-in profilers of the PES evaluators; see MonteCarlo.add_pes_evaluator()
+        self._pes_profiler: Dict[str, PESProfiler] = {}
+
     @AbstractDataClass.inherit_annotations()
     def _str_iterator(self):
         iterator = ((k.strip('_'), v) for k, v in super()._str_iterator())
@@ -240,7 +336,8 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         return self.history_dict.values()
 
     def add_pes_evaluator(self, name: str, func: Callable, args: Sequence[Any] = (),
-                          kwargs: Mapping[str, Any] = MappingProxyType({})) -> None:
+                          kwargs: Mapping[str, Any] = MappingProxyType({}),
+                          stream: bool = False, profile: Union[bool, str] = False) -> None:
         r"""Add a callable to this instance for constructing PES-descriptors.
 
         Examples
@@ -278,6 +375,27 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
             Providing an iterable allows one to use a unique set of keyword arguments for each
             molecule in :attr:`MonteCarlo.molecule`.
 
+        stream : :class:`bool`
+            Whether or not the PES-descriptor should be accumulated, block by block,
+            while the MD simulation is still running
+            (see :class:`PESAccumulator<FOX.armc_functions.pes_stream.PESAccumulator>`).
+            Only applicable to PES-descriptors averaged over all frames,
+            *e.g.* :meth:`MultiMolecule.init_rdf` and :meth:`MultiMolecule.init_adf`.
+
+        profile : :class:`bool` or :class:`str`
+            Whether or not the PES-descriptor's construction should be profiled
+            (see :class:`PESProfiler<FOX.armc_functions.pes_profile.PESProfiler>`).
+            Accepted values are ``False``, ``True``, ``"cprofile"`` and ``"tracemalloc"``.
+            Profiling statistics are dumped by :meth:`MonteCarlo.dump_pes_profile`.
+
+        The reference PES-descriptor is loaded from :attr:`MonteCarlo.pes_cache` if possible
+        (see :func:`get_pes_cached()<FOX.armc_functions.pes_cache.get_pes_cached>`).
+
+        Raises
+        ------
+        ValueError
+            Raised if **stream** is ``True`` and a molecule subset is specified in **kwargs**.
+
         """
         mol_list = [m.copy() for m in self.molecule]
         for f in self.pes_post_process:
@@ -289,11 +407,56 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
             iterator = zip(mol_list, repeat(kwargs, len(self.molecule)))
 
         for i, (mol, kwarg) in enumerate(iterator):
+            if stream and kwarg.get('mol_subset') is not None:
+                raise ValueError("The 'mol_subset' keyword argument cannot be used for "
+                                 f"streamed PES-descriptors ({name!r})")
             partial = functools.partial(func, *args, **kwarg)
             partial.__doc__ = func.__doc__
             partial.__name__ = func.__name__
-            partial.ref = partial(mol)
+            partial.stream = stream
+            partial.profile = profile
+            if self.pes_cache is None:
+                partial.ref = partial(mol)
+            else:
+                partial.ref = get_pes_cached(partial, mol, self.pes_cache)
             self.pes[f'{name}.{i}'] = partial
+            if profile:
+                self._pes_profiler[f'{name}.{i}'] = PESProfiler(partial, mode=profile)
+            else:
+                self._pes_profiler.pop(f'{name}.{i}', None)
+
+    def dump_pes_profile(self, filename: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Log and reset the statistics collected by all PES evaluator profilers.
+
+        Profilers are enabled via the **profile** parameter of :meth:`MonteCarlo.add_pes_evaluator`.
+
+        Parameters
+        ----------
+        filename : :class:`str`, optional
+            A template for the names of the files wherein :mod:`cProfile` statistics are stored,
+            *e.g.* ``"pes_profile.{}.prof"``; the curly braces are substituted for
+            the name of the PES descriptor.
+            :mod:`cProfile` statistics are not stored if ``None``.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`, optional
+            A DataFrame summarizing the profiling statistics of each PES descriptor
+            (see :func:`get_profile_summary()<FOX.armc_functions.pes_profile.get_profile_summary>`).
+            Returns ``None`` if profiling is disabled for all PES descriptors.
+
+        """
+        if not self._pes_profiler:
+            return None
+
+        ret = get_profile_summary(self._pes_profiler)
+        self.logger.info(f"PES descriptor profiling summary:\n"
+                         f"{ret.to_string(float_format='{:.3f}'.format)}\n")
+        for k, profiler in self._pes_profiler.items():
+            if filename is not None and profiler.dump_stats(filename.format(k)):
+                self.logger.info(f"cProfile statistics of {k!r} written to {filename.format(k)!r}")
+            profiler.reset()
+        return ret
 
     def move(self) -> Tuple[float]:
         """Update a random parameter in **self.param** by a random value from **self.move.range**.
@@ -364,9 +527,10 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         with pd.option_context('mode.chained_assignment', None):
             update_charge(atom, value, param.loc[param_type], constraint_dict, charge=charge)
 
-        # Update the CP2K Settings
-        for k, v, fstring in param.loc[param_type, ('keys', 'param', 'unit')].values:
-            _update_settings(k, v, fstring)
+        # Update the CP2K Settings; not necessary if the input is rendered from a template
+        if not self.input_template:
+            for k, v, fstring in param.loc[param_type, ('keys', 'param', 'unit')].values:
+                _update_settings(k, v, fstring)
 
         return tuple(self.param['param'].values)
 
@@ -425,30 +589,31 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
 
         """
         name = f'{self.job_name}.preopt'
-        job_type = self.job_type
-        job_list = [job_type(name=name, molecule=mol, settings=s) for
-                    mol, s in zip(self._plams_molecule, self.preopt_settings)]
+        job_list = self._get_jobs(name, self._plams_molecule, 'preopt_settings')
 
         # Preoptimize
         mol_list = []
+        jobmanager = self.get_jobmanager()
         for job in job_list:
             job.name += '.opt'
             self.job_cache.append(job)
 
             try:
-                results = job.run()
+                with self._timer.span('md'):
+                    results = job.run(jobmanager=jobmanager)
             except FileNotFoundError:
                 return None  # Precaution against PLAMS unpickling old Jobs that don't exist
             if job.status in {'crashed', 'failed'}:
                 return None
 
             try:  # Construct and return a MultiMolecule object
-                path = results.get_xyz_path()
-                mol = MultiMolecule.from_xyz(path)
-                mol.round(3)
+                with self._timer.span('parse'):
+                    path = results.get_trajectory_path()
+                    mol = self._read_trajectory(path, job.molecule)
+                    mol.round(3)
             except TypeError:  # The geometry optimization crashed
                 return None
-            except XYZError:  # The .xyz file is unreadable for some reason
+            except (XYZError, DCDError):  # The trajectory is unreadable for some reason
                 self.logger.warning(f"Failed to parse ...{os.sep}{os.path.basename(path)}")
                 return None
 
@@ -459,6 +624,8 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         """Peform a molecular dynamics simulation (MD).
 
         Simulations are performed on all molecules in **mol_preopt**.
+        Diverging simulations are terminated early if :attr:`MonteCarlo.watchdog` contains
+        one or more thresholds (see :class:`MDWatchdog<FOX.armc_functions.watchdog.MDWatchdog>`).
 
         Parameters
         ----------
@@ -469,40 +636,136 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         -------
         |list|_ [|FOX.MultiMolecule|_], optional
             A list of :class:`.MultiMolecule` instance(s) constructed from the MD simulation.
-            Return ``None`` if the job crashes.
+            Return ``None`` if the job crashes or is terminated.
 
         """
-        name = self.job_name
-        job_type = self.job_type
-        jobs = [job_type(name=name, molecule=mol, settings=s) for
-                mol, s in zip(mol_preopt, self.md_settings)]
+        jobs = self._get_jobs(self.job_name, mol_preopt, 'md_settings')
+        self._pes_stream = {k: PESAccumulator(self._pes_profiler.get(k, func)) for
+                            k, func in self.pes.items() if getattr(func, 'stream', False)}
 
         # Run MD
         mol_list = []
-        for job in jobs:
+        jobmanager = self.get_jobmanager()
+        for i, job in enumerate(jobs):
             job.name += '.MD'
             self.job_cache.append(job)
 
+            callback = self._get_stream_callback(i)
             try:
-                results = job.run()
+                watchdog = MDWatchdog(job, callback=callback, logger=self.logger,
+                                      **self.watchdog)
+                with self._timer.span('md'), watchdog:
+                    results = job.run(jobmanager=jobmanager)
             except FileNotFoundError:
                 return None  # Precaution against PLAMS unpickling old Jobs that don't exist
             if job.status in {'crashed', 'failed'}:
                 return None
+            elif watchdog.tripped:
+                self.logger.warning(f"Terminated {job.name}: {watchdog.reason}")
+                return None
 
             try:  # Construct and return a MultiMolecule object
-                path = results.get_xyz_path()
-                mol = MultiMolecule.from_xyz(path)
-                mol.round(3)
+                with self._timer.span('parse'):
+                    path = results.get_trajectory_path()
+                    mol = self._read_trajectory(path, job.molecule)
+                    mol.round(3)
             except TypeError:  # The MD simulation crashed
                 return None
-            except XYZError:  # The .xyz file is unreadable for some reason
+            except (XYZError, DCDError):  # The trajectory is unreadable for some reason
                 self.logger.warning(f"Failed to parse ...{os.sep}{os.path.basename(path)}")
                 return None
 
             mol_list.append(mol)
         return mol_list
 
+    def _get_stream_callback(self, i: int) -> Optional[Callable[[np.ndarray], None]]:
+        """Return a callable for accumulating all streamed PES descriptors of the **i**-th molecule.
+
+        Returns ``None`` if there are no streamed PES descriptors for the **i**-th molecule.
+
+        """
+        accumulators = [v for k, v in self._pes_stream.items() if k.rsplit('.', 1)[1] == str(i)]
+        if not accumulators:
+            return None
+
+        # Ensure that the atoms are identical to those of the post-processed trajectory
+        mol_list = [m[:1].copy() for m in self.molecule]
+        for f in self.pes_post_process:
+            f(mol_list, self)
+        atoms = mol_list[i].atoms
+
+        def callback(xyz: np.ndarray) -> None:
+            mol = MultiMolecule(xyz, atoms=atoms)
+            mol.round(3)
+            for accumulator in accumulators:
+                accumulator.update(mol)
+        return callback
+
+    def _get_jobs(self, name: str, mol_list: Iterable[Molecule], settings_name: str) -> List[Job]:
+        """Construct a list of jobs using the settings stored in the **settings_name** attribute.
+
+        If :attr:`MonteCarlo.input_template` is ``True`` then the CP2K input of the jobs is
+        rendered from a template (see :meth:`MonteCarlo.get_input_template`).
+
+        """
+        settings_list = getattr(self, settings_name)
+        job_type = self.job_type
+        jobs = [job_type(name=name, molecule=mol, settings=s) for
+                mol, s in zip(mol_list, settings_list)]
+        if not self.input_template:
+            return jobs
+
+        values = [fstring.format(v) for v, fstring in self.param[['param', 'unit']].values]
+        for job, template in zip(jobs, self.get_input_template(settings_name)):
+            job.get_input = functools.partial(template.render, values, job.molecule)
+        return jobs
+
+    def get_input_template(self, settings_name: str = 'md_settings') -> Tuple[CP2KTemplate, ...]:
+        """Return (and cache) a tuple of CP2K input templates, one for each molecule.
+
+        The templates contain placeholders for all parameters in :attr:`MonteCarlo.param` and
+        are constructed from the settings stored in the **settings_name** attribute.
+        Note that the templates are constructed only once;
+        in-place changes made to the settings afterwards are not reflected in the templates,
+        while assigning new settings clears the respective templates.
+
+        Parameters
+        ----------
+        settings_name : :class:`str`
+            The name of the settings attribute;
+            accepted values are ``"md_settings"`` and ``"preopt_settings"``.
+
+        Returns
+        -------
+        :class:`tuple` [:class:`CP2KTemplate<FOX.io.cp2k_template.CP2KTemplate>`]
+            A tuple of CP2K input templates.
+
+        """
+        try:
+            return self._input_template[settings_name]
+        except KeyError:
+            pass
+
+        keys = self.param['keys'].tolist()
+        job_type = getattr(self.job_type, 'func', self.job_type)
+        iterator = zip(getattr(self, settings_name), self._plams_molecule)
+        ret = self._input_template[settings_name] = tuple(
+            CP2KTemplate(s, keys, molecule=mol, job_type=job_type) for s, mol in iterator
+        )
+        return ret
+
+    @staticmethod
+    def _read_trajectory(path: str, molecule: Molecule) -> MultiMolecule:
+        """Construct a :class:`.MultiMolecule` instance from an .xyz or .dcd trajectory.
+
+        Atomic symbols of .dcd trajectories are taken from **molecule**.
+
+        """
+        if not path.endswith('.dcd'):
+            return MultiMolecule.from_xyz(path)
+        atoms = group_by_values(enumerate(at.symbol for at in molecule))
+        return MultiMolecule.from_dcd(path, atoms=atoms)
+
     @staticmethod
     def _evaluate_rmsd(mol_preopt: Optional[Iterable[MultiMolecule]],
                        threshold: Optional[float] = None) -> bool:
@@ -539,11 +802,67 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
 
         return True
 
+    def get_jobmanager(self) -> Optional[JobManager]:
+        """Return the PLAMS job manager used for running all jobs.
+
+        Returns ``None``, *i.e.* the default PLAMS job manager, if
+        :attr:`MonteCarlo.scratch_dir` is ``None``.
+        Otherwise a (cached) job manager is returned whose working directory is
+        located in :attr:`MonteCarlo.scratch_dir`.
+
+        """
+        if self.scratch_dir is None:
+            return None
+        return _get_scratch_manager(*self._get_scratch_key())
+
+    def _get_scratch_key(self) -> Tuple[str, str]:
+        """Return the path and folder name of the scratch job manager."""
+        return os.path.abspath(self.scratch_dir), f'{self.job_name}.scratch'
+
+    def clear_scratch_dir(self) -> None:
+        """Delete the working directory of the scratch job manager.
+
+        Should be called once all jobs have been run, as the job manager creates
+        a new working directory (*e.g.* ``"ARMC.scratch.002"``) for every process.
+        Jobs remaining in :attr:`MonteCarlo.job_cache` (*e.g.* those kept for manual inspection
+        after a crash) are moved to the working directory of the default PLAMS job manager.
+        Does nothing if :attr:`MonteCarlo.scratch_dir` is ``None``.
+
+        """
+        if self.scratch_dir is None:
+            return None
+        jobmanager = _SCRATCH_MANAGERS.pop(self._get_scratch_key(), None)
+        if jobmanager is None:
+            return None
+
+        workdir = config.default_jobmanager.workdir
+        for job in self.job_cache:
+            if os.path.isdir(job.path):
+                _move_unique(job.path, workdir)
+        self.job_cache = []
+        shutil.rmtree(jobmanager.workdir, ignore_errors=True)
+
     def clear_job_cache(self) -> None:
-        """Clear :attr:`MonteCarlo.job_cache` and, optionally, delete all cp2k output files."""
+        """Clear :attr:`MonteCarlo.job_cache` and, optionally, delete all cp2k output files.
+
+        If :attr:`MonteCarlo.keep_files` is ``True`` and the jobs were run in
+        :attr:`MonteCarlo.scratch_dir` then their output files are
+        moved to the working directory of the default PLAMS job manager.
+
+        """
+        jobmanager = self.get_jobmanager()
         if not self.keep_files:
             for job in self.job_cache:
                 shutil.rmtree(job.path)
+        elif jobmanager is not None:
+            workdir = config.default_jobmanager.workdir
+            for job in self.job_cache:
+                _move_unique(job.path, workdir)
+
+        # Prevent the scratch job manager from accumulating (moved or deleted) jobs
+        if jobmanager is not None:
+            jobmanager.jobs.clear()
+            jobmanager.hashes.clear()
         self.job_cache = []
 
     def get_pes_descriptors(self, key: Tuple[float], get_first_key: bool = False,
@@ -554,6 +873,8 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         If ``False``, construct and return a new list of PES descriptors.
 
         * The PES descriptors are constructed by the provided settings in **self.pes**.
+        * Streamed PES descriptors are taken from the accumulators filled during the
+          MD simulation (see :meth:`MonteCarlo.add_pes_evaluator`).
 
         Parameters
         ----------
@@ -577,10 +898,19 @@ class MonteCarlo(AbstractDataClass, abc.Mapping):
         if mol_list is None:  # The MD simulation crashed
             ret = {key: np.inf for key in self.pes.keys()}
         else:
-            for func in self.pes_post_process:
-                func(mol_list, self)  # Post-process the MultiMolecules
-            iterator = zip(self.pes.items(), cycle(mol_list))
-            ret = {k: func(mol) for (k, func), mol in iterator}
+            with self._timer.span('pes_post_process'):
+                for func in self.pes_post_process:
+                    func(mol_list, self)  # Post-process the MultiMolecules
+
+            ret = {}
+            with self._timer.span('pes'):
+                for (k, func), mol in zip(self.pes.items(), cycle(mol_list)):
+                    # Use the streamed PES descriptor if it was accumulated over the entire MD
+                    accumulator = self._pes_stream.get(k)
+                    if accumulator is not None and accumulator.frame_count == len(mol):
+                        ret[k] = accumulator.result()
+                    else:
+                        ret[k] = self._pes_profiler.get(k, func)(mol)
 
         if not get_first_key:
             self.clear_job_cache()
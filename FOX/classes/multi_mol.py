@@ -42,11 +42,13 @@ from scm.plams import Molecule, Atom, Bond
 
 from .multi_mol_magic import _MultiMolecule
 from ..io.read_kf import read_kf
-from ..io.read_xyz import read_multi_xyz
+from ..io.read_dcd import read_dcd
+from ..io.read_xyz import read_multi_xyz, read_multi_xyz_cached
 from ..functions.rdf import get_rdf, get_rdf_lowmem, get_rdf_df
 from ..functions.adf import get_adf, get_adf_df
 from ..functions.utils import group_by_values
 from ..functions.molecule_utils import fix_bond_orders, separate_mod
+from ..functions.mem_utils import ALLOC_COUNTER
 
 try:
     import dask
@@ -353,7 +355,8 @@ class MultiMolecule(_MultiMolecule):
         j = self._get_atom_subset(atom_subset)
 
         # Remove translations
-        coords = self[i, j, :] - self[i, j, :].mean(axis=1)[:, None, :]
+        xyz = self[i, j, :]
+        coords = xyz - xyz.mean(axis=1)[:, None, :]
 
         # Peform a singular value decomposition on the covariance matrix
         H = np.swapaxes(coords[0:], 1, 2) @ coords[0]
@@ -505,8 +508,13 @@ class MultiMolecule(_MultiMolecule):
             A 2D array with the centres of mass of :math:`m` molecules with :math:`n` atoms.
 
         """
-        coords = self.as_mass_weighted(mol_subset, atom_subset)
-        return coords.sum(axis=1) / self.mass.sum()
+        # Prepare slices
+        i = self._get_mol_subset(mol_subset)
+        j = self._get_atom_subset(atom_subset)
+
+        # Contract the atomic axis directly, avoiding a mass-weighted copy of the coordinates
+        mass = self.mass
+        return np.einsum('ijk,j->ik', self[i, j, :], mass[j]) / mass.sum()
 
     def get_bonds_per_atom(self, atom_subset: AtomSubset = None) -> np.ndarray:
         """Get the number of bonds per atom in this instance.
@@ -609,6 +617,7 @@ class MultiMolecule(_MultiMolecule):
         columns = pd.Index(column_range, name='Atoms')
         return pd.DataFrame(data, columns=columns)
 
+    @ALLOC_COUNTER.track
     def init_average_velocity(self, timestep: float = 1.0,
                               rms: bool = False,
                               mol_subset: MolSubset = None,
@@ -650,6 +659,7 @@ class MultiMolecule(_MultiMolecule):
         df.index.name = 'Time / fs'
         return df
 
+    @ALLOC_COUNTER.track
     def init_time_averaged_velocity(self, timestep: float = 1.0,
                                     rms: bool = False,
                                     mol_subset: MolSubset = None,
@@ -686,6 +696,7 @@ class MultiMolecule(_MultiMolecule):
         kwargs = {'mol_subset': mol_subset, 'timestep': timestep, 'rms': rms}
         return self._get_time_averaged_prop(self.get_time_averaged_velocity, atom_subset, **kwargs)
 
+    @ALLOC_COUNTER.track
     def init_rmsd(self, mol_subset: MolSubset = None,
                   atom_subset: AtomSubset = None,
                   reset_origin: bool = True) -> pd.DataFrame:
@@ -724,6 +735,7 @@ class MultiMolecule(_MultiMolecule):
         df.index.name = 'XYZ frame number'
         return df
 
+    @ALLOC_COUNTER.track
     def init_rmsf(self, mol_subset: MolSubset = None,
                   atom_subset: AtomSubset = None,
                   reset_origin: bool = True) -> pd.DataFrame:
@@ -835,6 +847,7 @@ class MultiMolecule(_MultiMolecule):
             v = self.get_velocity(timestep, mol_subset=mol_subset, atom_subset=atom_subset)
             return MultiMolecule(v, self.atoms).get_rmsf(mol_subset)
 
+    @ALLOC_COUNTER.track
     def get_velocity(self, timestep: float = 1.0,
                      norm: bool = True,
                      mol_subset: MolSubset = None,
@@ -875,7 +888,10 @@ class MultiMolecule(_MultiMolecule):
         j = self._get_atom_subset(atom_subset)
 
         # Slice the XYZ array and reset the origin
+        # Basic slicing produces a view; translate it out-of-place so this instance is not altered
         xyz = self[i, j]
+        if np.may_share_memory(xyz, self):
+            xyz = xyz - xyz.mean(axis=1)[:, None, :]
         xyz.reset_origin()
 
         if norm:
@@ -941,8 +957,9 @@ class MultiMolecule(_MultiMolecule):
         j = self._get_atom_subset(atom_subset)
 
         # Calculate the RMSF per molecule in this instance
-        mean_coords = np.mean(self[i, j, :], axis=0)[None, ...]
-        displacement = np.linalg.norm(self[i, j, :] - mean_coords, axis=2)**2
+        xyz = self[i, j, :]
+        mean_coords = np.mean(xyz, axis=0)[None, ...]
+        displacement = np.linalg.norm(xyz - mean_coords, axis=2)**2
         return np.mean(displacement, axis=0)
 
     @staticmethod
@@ -1080,6 +1097,7 @@ class MultiMolecule(_MultiMolecule):
 
     """#############################  Determining shell structures  ##########################"""
 
+    @ALLOC_COUNTER.track
     def init_shell_search(self, mol_subset: MolSubset = None,
                           atom_subset: AtomSubset = None,
                           rdf_cutoff: float = 0.5
@@ -1129,11 +1147,15 @@ class MultiMolecule(_MultiMolecule):
         i = self._get_mol_subset(mol_subset)
         at_subset = atom_subset or tuple(self.atoms.keys())
 
+        # Allocate a single array for the sliced molecules and a dummy atom at the origin
+        xyz = self[i]
+        m, n, _ = xyz.shape
+        mol_cp = MultiMolecule(np.zeros((m, n + 1, 3)), atoms=self.atoms)
+        mol_cp.atoms['origin'] = [n]
+
         # Calculate the mean distance (per atom) with respect to the center of mass
         # Conceptually similar an RMSF, the "fluctuation" being with respect to the center of mass
-        dist_mean = []
-        mol_cp = self.copy()[i]
-        mol_cp -= mol_cp.get_center_of_mass()[:, None, :]
+        np.subtract(xyz, xyz.get_center_of_mass()[:, None, :], out=mol_cp[:, :n])
         at_idx, dist_mean = zip(*[_get_mean_dist(mol_cp, at) for at in at_subset])
 
         # Create Series containing the actual atomic indices
@@ -1151,9 +1173,6 @@ class MultiMolecule(_MultiMolecule):
         rmsf.index.name = 'Arbitrary atomic index'
 
         # Calculate the RDF with respect to the center of mass
-        at_dummy = np.zeros_like(mol_cp[:, 0, :])[:, None, :]
-        mol_cp = MultiMolecule(np.hstack((mol_cp, at_dummy)), atoms=mol_cp.atoms)
-        mol_cp.atoms['origin'] = [mol_cp.shape[1] - 1]
         at_subset = ('origin', ) + at_subset
         with np.errstate(divide='ignore', invalid='ignore'):
             rdf = mol_cp.init_rdf(atom_subset=at_subset)
@@ -1240,6 +1259,7 @@ class MultiMolecule(_MultiMolecule):
 
     """#############################  Radial Distribution Functions  ##########################"""
 
+    @ALLOC_COUNTER.track
     def init_rdf(self, mol_subset: MolSubset = None, atom_subset: AtomSubset = None,
                  dr: float = 0.05, r_max: float = 12.0, mem_level: int = 2):
         """Initialize the calculation of radial distribution functions (RDFs).
@@ -1405,6 +1425,7 @@ class MultiMolecule(_MultiMolecule):
 
     """####################################  Power spectrum  ###################################"""
 
+    @ALLOC_COUNTER.track
     def init_power_spectrum(self, mol_subset: MolSubset = None,
                             atom_subset: AtomSubset = None,
                             freq_max: int = 4000) -> pd.DataFrame:
@@ -1560,6 +1581,7 @@ class MultiMolecule(_MultiMolecule):
 
     """############################  Angular Distribution Functions  ##########################"""
 
+    @ALLOC_COUNTER.track
     def init_adf(self, mol_subset: MolSubset = None,
                  atom_subset: AtomSubset = None,
                  r_max: Union[float, str] = 8.0,
@@ -1624,9 +1646,11 @@ class MultiMolecule(_MultiMolecule):
         at_subset = self._get_atom_subset(atom_subset, as_array=True)
 
         # Slice this MultiMolecule instance based on **atom_subset** and **mol_subset**
-        del_atom = np.ones(self.shape[1], dtype=bool)
-        del_atom[at_subset] = False
-        mol = self.delete_atoms(del_atom)[m_subset]
+        # Slice the molecules first (a view) so only the selected frames and atoms are copied
+        keep_atom = np.zeros(self.shape[1], dtype=bool)
+        keep_atom[at_subset] = True
+        mol = self[m_subset][:, keep_atom]
+        mol.atoms = group_by_values(enumerate(self.symbol[keep_atom]))
 
         atom_pairs = mol.get_pair_dict(atom_subset or sorted(mol.atoms, key=str), r=3)
         for k, v in atom_pairs.items():
@@ -2228,12 +2252,23 @@ class MultiMolecule(_MultiMolecule):
     @classmethod
     def from_xyz(cls, filename: Union[AnyStr, PathLike],
                  bonds: Optional[np.ndarray] = None,
-                 properties: Optional[dict] = None) -> 'MultiMolecule':
+                 properties: Optional[dict] = None,
+                 cache: Union[bool, AnyStr, PathLike] = False) -> 'MultiMolecule':
         """Construct a :class:`.MultiMolecule` instance from a (multi) .xyz file.
 
         Comment lines extracted from the .xyz file are stored, as array, under
         ``MultiMolecule.properties["comments"]``.
 
+        Examples
+        --------
+        .. code:: python
+
+            >>> from FOX import MultiMolecule, example_xyz
+
+            # The first call parses the .xyz file and writes the cache,
+            # subsequent calls memory-map the cached coordinates
+            >>> mol = MultiMolecule.from_xyz(example_xyz, cache=True)
+
         Parameters
         ----------
         filename : str
@@ -2249,18 +2284,86 @@ class MultiMolecule(_MultiMolecule):
             miscellaneous user-defined (meta-)data. Is devoid of keys by default.
             Stored in the **MultiMolecule.properties** attribute.
 
+        cache : :class:`bool` or :class:`str`
+            Whether or not the parsed content of **filename** should be stored in,
+            and read from, a binary cache (see :func:`.read_multi_xyz_cached`).
+            The cache is stored next to **filename** if ``True``;
+            alternatively, the path to a cache directory can be provided.
+
         Returns
         -------
         |FOX.MultiMolecule|_:
             A :class:`.MultiMolecule` instance constructed from **filename**.
 
         """
-        coords, atoms, comments = read_multi_xyz(filename)
+        if not cache:
+            coords, atoms, comments = read_multi_xyz(filename)
+        else:
+            cache_dir = None if cache is True else cache
+            coords, atoms, comments = read_multi_xyz_cached(filename, cache_dir)
         ret = cls(coords, atoms, bonds, properties)
         ret.properties['comments'] = comments
         ret.properties['filename'] = filename
         return ret
 
+    @classmethod
+    def from_dcd(cls, filename: Union[AnyStr, PathLike],
+                 atoms: Optional[Dict[str, List[int]]] = None,
+                 bonds: Optional[np.ndarray] = None,
+                 properties: Optional[dict] = None,
+                 mol_subset: MolSubset = None) -> 'MultiMolecule':
+        """Construct a :class:`.MultiMolecule` instance from a binary .dcd file.
+
+        The .dcd file is memory-mapped and only the frames specified in **mol_subset**
+        are read (see :func:`.read_dcd`).
+        As .dcd files do not contain any atomic symbols these should be supplied via **atoms**.
+
+        Examples
+        --------
+        .. code:: python
+
+            >>> from FOX import MultiMolecule, example_xyz
+
+            >>> mol_ref = MultiMolecule.from_xyz(example_xyz)
+            >>> dcd_file = str(...)
+
+            >>> mol = MultiMolecule.from_dcd(dcd_file, atoms=mol_ref.atoms)
+
+        Parameters
+        ----------
+        filename : str
+            The path+filename of a .dcd file.
+
+        atoms : dict [str, list [int]]
+            An optional dictionary with atomic symbols as keys and
+            lists of matching atomic indices as values.
+            Stored in the **MultiMolecule.atoms** attribute.
+
+        bonds : :math:`k*3` |np.ndarray|_ [|np.int64|_]
+            An optional 2D array with indices of the atoms defining all :math:`k` bonds
+            (columns 1 & 2) and their respective bond orders multiplied by 10 (column 3).
+            Stored in the **MultieMolecule.bonds** attribute.
+
+        properties : dict
+            A Settings object (subclass of dictionary) intended for storing
+            miscellaneous user-defined (meta-)data. Is devoid of keys by default.
+            Stored in the **MultiMolecule.properties** attribute.
+
+        mol_subset : slice
+            Read only a subset of the molecules in **filename**.
+            All molecules are read if ``None``.
+
+        Returns
+        -------
+        |FOX.MultiMolecule|_:
+            A :class:`.MultiMolecule` instance constructed from **filename**.
+
+        """
+        coords = read_dcd(filename, mol_subset)
+        ret = cls(coords, atoms, bonds, properties)
+        ret.properties['filename'] = filename
+        return ret
+
     @classmethod
     def from_kf(cls, filename: Union[AnyStr, PathLike],
                 bonds: Optional[np.ndarray] = None,
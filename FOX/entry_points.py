@@ -28,17 +28,10 @@ API
 import os
 import argparse
 from os.path import isfile, join
-from typing import Optional
+from typing import Optional, Iterator, Tuple
 
-from .classes.armc import ARMC, run_armc
-from .armc_functions.csv_utils import dset_to_csv
-from .armc_functions.guess import guess_param
-from .armc_functions.plotting import plot_pes_descriptors, plot_param, plot_dset
-
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    pass
+# NOTE: The Auto-FOX modules are imported within the entry points themselves,
+# ensuring that each entry point only imports the (third party) packages it actually requires
 
 try:
     import h5py
@@ -77,6 +70,7 @@ def main_armc(args: Optional[list] = None) -> None:
     if not isfile(filename):
         raise FileNotFoundError("[Errno 2] No such file: '{}'".format(filename))
 
+    from .classes.armc import ARMC, run_armc
     armc, kwargs = ARMC.from_yaml(filename)
     run_armc(armc, restart=restart, **kwargs)
 
@@ -115,6 +109,8 @@ def main_armc2yaml(args: Optional[list] = None) -> None:
                 break
             i += 1
 
+    from .classes.armc import ARMC
+    from .armc_functions.guess import guess_param
     armc, kwargs = ARMC.from_yaml(filename)
 
     # Create the .psf files
@@ -163,12 +159,28 @@ def main_plot_pes(args: Optional[list] = None) -> None:
               'The provided dataset(s) should containing PES descriptors.')
     )
 
+    parser.add_argument(
+        '-w', '--watch', nargs=1, type=float, default=[None], required=False, metavar='interval',
+        help=('Optional: Keep refreshing the .png file(s) while the ARMC optimization is running, '
+              'polling the .hdf5 file for new iterations every "interval" seconds. '
+              'Only new iterations are read upon refreshing.')
+    )
+
+    parser.add_argument(
+        '-n', '--processes', nargs=1, type=int, default=[None], required=False,
+        metavar='processes',
+        help=('Optional: The number of processes used for creating the figures in parallel. '
+              'Set to the number of processors by default if "--watch" is specified.')
+    )
+
     # Unpack arguments
     args_parsed = parser.parse_args(args)
     input_ = args_parsed.input[0]
     output = args_parsed.output[0]
     iteration = args_parsed.iteration[0]
     datasets = args_parsed.datasets
+    watch = args_parsed.watch[0]
+    processes = args_parsed.processes[0]
     if not datasets:
         raise ValueError('The "--datasets" argument expects one or more PES descriptor names')
 
@@ -188,6 +200,22 @@ def main_plot_pes(args: Optional[list] = None) -> None:
                     except AssertionError:
                         i = -1
 
+    if watch is not None or processes is not None:
+        from concurrent.futures import ProcessPoolExecutor
+        from .armc_functions.plotting import plot_pes_descriptors_mp
+        if output is None:
+            filenames = [dset + '.png' for dset in datasets_]
+        else:
+            filenames = [str(i) + '_' + output for i, _ in enumerate(datasets_)]
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for _ in _iter_updates(input_, watch):
+                plot_pes_descriptors_mp(input_, datasets_, filenames,
+                                        iteration=iteration, executor=executor)
+        return None
+
+    import matplotlib.pyplot as plt
+    from .armc_functions.plotting import plot_pes_descriptors
     if output is None:
         for dset in datasets_:
             fig = plot_pes_descriptors(input_, dset, dset + '.png', iteration=iteration)
@@ -217,16 +245,29 @@ def main_plot_param(args: Optional[list] = None) -> None:
               'Set to "param.png" by default.')
     )
 
+    parser.add_argument(
+        '-w', '--watch', nargs=1, type=float, default=[None], required=False, metavar='interval',
+        help=('Optional: Keep refreshing the .png file(s) while the ARMC optimization is running, '
+              'polling the .hdf5 file for new iterations every "interval" seconds. '
+              'Only new iterations are read upon refreshing.')
+    )
+
     # Unpack arguments
     args_parsed = parser.parse_args(args)
     input_ = args_parsed.input[0]
-    output = args_parsed.output[0]
+    output = args_parsed.output[0] or 'param.png'
+    watch = args_parsed.watch[0]
 
-    if output is None:
-        fig = plot_param(input_, 'param.png')
-    else:
+    import matplotlib.pyplot as plt
+    from .armc_functions.plotting import plot_param
+    if watch is None:
         fig = plot_param(input_, output)
-    plt.show(block=True)
+        plt.show(block=True)
+        return None
+
+    fig, cache = None, {}
+    for _ in _iter_updates(input_, watch):
+        fig = plot_param(input_, output, fig=fig, cache=cache)
 
 
 def main_plot_dset(args: Optional[list] = None) -> None:
@@ -255,23 +296,36 @@ def main_plot_dset(args: Optional[list] = None) -> None:
         dest='datasets', help=('Required: One or more hdf5 dataset names.')
     )
 
+    parser.add_argument(
+        '-w', '--watch', nargs=1, type=float, default=[None], required=False, metavar='interval',
+        help=('Optional: Keep refreshing the .png file(s) while the ARMC optimization is running, '
+              'polling the .hdf5 file for new iterations every "interval" seconds. '
+              'Only new iterations are read upon refreshing.')
+    )
+
     # Unpack arguments
     args_parsed = parser.parse_args(args)
     input_ = args_parsed.input[0]
-    output = args_parsed.output[0]
+    output = args_parsed.output[0] or 'datasets.png'
     datasets = args_parsed.datasets
+    watch = args_parsed.watch[0]
     if not datasets:
         raise ValueError('The "--datasets" argument expects one or more dataset names')
 
-    if output is None:
-        fig = plot_dset(input_, datasets, 'datasets.png')
-    else:
+    import matplotlib.pyplot as plt
+    from .armc_functions.plotting import plot_dset
+    if watch is None:
         fig = plot_dset(input_, datasets, output)
-    plt.show(block=True)
+        plt.show(block=True)
+        return None
+
+    fig, cache = None, {}
+    for _ in _iter_updates(input_, watch):
+        fig = plot_dset(input_, datasets, output, fig=fig, cache=cache)
 
 
 def main_dset_to_csv(args: Optional[list] = None) -> None:
-    """Entrypoint for :func:`FOX.armc_functions.csv.dset_to_csv`."""
+    """Entrypoint for :func:`FOX.armc_functions.csv_utils.dset_to_file`."""
     parser = argparse.ArgumentParser(
          prog='FOX',
          usage='plot_pes input -o output -dset dset1 dset2 ...',
@@ -288,7 +342,28 @@ def main_dset_to_csv(args: Optional[list] = None) -> None:
     parser.add_argument(
         '-o', '--output', nargs=1, type=str, metavar='output', required=False, default=[None],
         help=('Optional: The path+name of the to-be created .png file. '
-              'Set to the dataset name (appended with ".csv") by default.')
+              'Set to the dataset name (appended with the file format) by default.')
+    )
+
+    parser.add_argument(
+        '-f', '--format', nargs=1, type=str, default=[None], required=False, metavar='format',
+        choices=['csv', 'parquet', 'feather'], dest='format',
+        help=('Optional: The file format; one of "csv", "parquet" or "feather". '
+              'Inferred from the output file extension by default, defaulting to "csv".')
+    )
+
+    parser.add_argument(
+        '-k', '--kappa', nargs=2, type=int, default=[None, None], required=False,
+        metavar=('start', 'stop'),
+        help=('Optional: The range of to-be exported super-iterations. '
+              'All super-iterations are exported by default.')
+    )
+
+    parser.add_argument(
+        '-c', '--chunksize', nargs=1, type=int, default=[None], required=False,
+        metavar='chunksize',
+        help=('Optional: The number of super-iterations read and written at a time. '
+              'Based on the size of a single super-iteration by default.')
     )
 
     parser.add_argument(
@@ -310,12 +385,38 @@ def main_dset_to_csv(args: Optional[list] = None) -> None:
     output = args_parsed.output[0]
     iteration = args_parsed.iteration[0]
     datasets = args_parsed.datasets
+    fmt = args_parsed.format[0]
+    kappa = slice(*args_parsed.kappa)
+    chunksize = args_parsed.chunksize[0]
     if not datasets:
         raise ValueError('The "--datasets" argument expects one or more dataset names')
 
+    from .armc_functions.csv_utils import dset_to_file
+    kwargs = {'fmt': fmt, 'kappa': kappa, 'iteration': iteration, 'chunksize': chunksize}
     if output is None:
         for dset in datasets:
-            dset_to_csv(input_, dset, dset + '.csv', iteration=iteration)
+            dset_to_file(input_, dset, None, **kwargs)
     else:
         for i, dset in enumerate(datasets):
-            dset_to_csv(input_, dset, str(i) + '_' + output, iteration=iteration)
+            dset_to_file(input_, dset, str(i) + '_' + output, **kwargs)
+
+
+def _iter_updates(filename: str, interval: Optional[float]) -> Iterator[Optional[Tuple[int, int]]]:
+    """Yield once if **interval** is ``None``; yield whenever **filename** is updated otherwise.
+
+    See :func:`FOX.io.hdf5_utils.iter_hdf5_updates`.
+    The iteration is stopped, rather than aborted, upon a :exc:`KeyboardInterrupt`.
+
+    """
+    if interval is None:
+        yield None
+        return None
+
+    from .io.hdf5_utils import iter_hdf5_updates
+    from .logger import DEFAULT_LOGGER as logger
+    try:
+        for kappa, omega in iter_hdf5_updates(filename, interval):
+            logger.info(f"Refreshing figures: super-iteration {kappa}, sub-iteration {omega}")
+            yield kappa, omega
+    except KeyboardInterrupt:
+        return None
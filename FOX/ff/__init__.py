@@ -20,10 +20,7 @@ API
 
 """
 
-from .bonded_calculate import get_bonded
-from .lj_calculate import get_non_bonded
-from .lj_intra_calculate import get_intra_non_bonded
-from .lj_param import estimate_lj, get_free_energy
+from ..functions.lazy import lazy_loader
 
 __all__ = [
     'get_bonded',
@@ -31,3 +28,10 @@ __all__ = [
     'get_intra_non_bonded',
     'estimate_lj', 'get_free_energy'
 ]
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    '.bonded_calculate': ['get_bonded'],
+    '.lj_calculate': ['get_non_bonded'],
+    '.lj_intra_calculate': ['get_intra_non_bonded'],
+    '.lj_param': ['estimate_lj', 'get_free_energy'],
+})
@@ -88,27 +88,27 @@ def get_bonded(mol: Union[str, MultiMolecule], psf: Union[str, PSFContainer],
 
     # Calculate the various potential energies
     if bonds is not None:
-        parse_wildcards(bonds, symbols, prm_type='bonds')
+        bonds = parse_wildcards(bonds, symbols, prm_type='bonds')
         bonds = get_V_bonds(bonds, mol, psf.bonds)
         bonds *= kcal2au
 
     if angles is not None:
-        parse_wildcards(angles, symbols, prm_type='angles')
+        angles = parse_wildcards(angles, symbols, prm_type='angles')
         angles = get_V_angles(angles, mol, psf.angles)
         angles *= kcal2au
 
     if urey_bradley is not None:
-        parse_wildcards(urey_bradley, symbols, prm_type='urey_bradley')
+        urey_bradley = parse_wildcards(urey_bradley, symbols, prm_type='urey_bradley')
         urey_bradley = get_V_UB(urey_bradley, mol, psf.angles)
         urey_bradley *= kcal2au
 
     if dihedrals is not None:
-        parse_wildcards(dihedrals, symbols, prm_type='dihedrals')
+        dihedrals = parse_wildcards(dihedrals, symbols, prm_type='dihedrals')
         dihedrals = get_V_dihedrals(dihedrals, mol, psf.dihedrals)
         dihedrals *= kcal2au
 
     if impropers is not None:
-        parse_wildcards(impropers, symbols, prm_type='impropers')
+        impropers = parse_wildcards(impropers, symbols, prm_type='impropers')
         impropers = get_V_impropers(impropers, mol, psf.impropers)
         impropers *= kcal2au
 
@@ -119,9 +119,8 @@ def process_prm(prm: Union[PRMContainer, str]) -> tuple:
     """Extract all bond, angle, dihedral and improper parameters from **prm**."""
     if not isinstance(prm, PRMContainer):
         prm = PRMContainer.read(prm)
-    else:
-        prm = prm.copy()
 
+    # All blocks are copied below; there is no need to copy the entire PRMContainer
     bonds = prm.bonds
     if bonds is not None:
         bonds = bonds[[2, 3]].copy()
@@ -248,10 +248,9 @@ class LJDataFrame(pd.DataFrame):
                  unit: Optional[str] = None) -> None:
         unit2au = 1 if unit is None else Units.conversion_ratio(unit, 'au')
         atom_pairs = combinations_with_replacement(sorted(atom_mapping.keys()), 2)
-        for at1, at2 in atom_pairs:
-            value = func([atom_mapping[at1], atom_mapping[at2]])
-            value *= unit2au
-            self.at[(at1, at2), key] = value
+        value_dict = {(at1, at2): func([atom_mapping[at1], atom_mapping[at2]]) * unit2au for
+                      at1, at2 in atom_pairs}
+        self._set_values(value_dict, key)
 
     def set_charge(self, charge_mapping: Mapping[str, float]) -> None:
         """Set :math:`q_{i} * q_{j}`."""
@@ -268,10 +267,30 @@ class LJDataFrame(pd.DataFrame):
     def _set_prm_pairs(self, atom_pair_mapping: Mapping[Tuple[str, str], float],
                        key: str, unit: Optional[str] = None) -> None:
         unit2au = 1 if unit is None else Units.conversion_ratio(unit, 'au')
-        for _at_tup, value in atom_pair_mapping.items():
-            at_tup = tuple(sorted(_at_tup))
-            value *= unit2au
-            self.at[at_tup, key] = value
+        value_dict = {tuple(sorted(at_tup)): value * unit2au for
+                      at_tup, value in atom_pair_mapping.items()}
+        self._set_values(value_dict, key)
+
+    def _set_values(self, value_dict: Mapping[Tuple[str, str], float], key: str) -> None:
+        """Assign all values in **value_dict** to the **key** column.
+
+        Values of existing atom pairs are set in a single operation;
+        missing atom pairs are appended one at a time.
+
+        """
+        if not value_dict:
+            return None
+
+        at_pairs = list(value_dict.keys())
+        values = np.fromiter(value_dict.values(), dtype=float, count=len(value_dict))
+        i = self.index.get_indexer(at_pairs)
+        is_present = i != -1
+
+        j = self.columns.get_loc(key)
+        self.iloc[i[is_present], j] = values[is_present]
+        for k in np.flatnonzero(~is_present):
+            self.at[at_pairs[k], key] = values[k]
+        return None
 
     def set_charge_pairs(self, charge_mapping: Mapping[Tuple[str, str], float]) -> None:
         """Set :math:`q_{ij}`."""
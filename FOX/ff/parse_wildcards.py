@@ -7,18 +7,22 @@ A module for parsing wildcards (``"X"``) specified in a CHARMM parameter set.
 """
 
 from types import MappingProxyType
-from typing import Collection, Mapping, Callable, Set
-from itertools import product, permutations
+from typing import Collection, Mapping, List, Tuple
+from itertools import product
 
-import numpy as np
 import pandas as pd
 
+from ..io.read_prm import PRMContainer
+
 __all__ = ['parse_wildcards']
 
 
-def parse_wildcards(df: pd.DataFrame, symbols: Collection[str], prm_type: str) -> None:
+def parse_wildcards(df: pd.DataFrame, symbols: Collection[str], prm_type: str) -> pd.DataFrame:
     """Replace any wildcards (``"X"``) in **df** with explicit references to atom types.
 
+    Duplicates are identified with :meth:`PRMContainer.normalize_key`,
+    *e.g.* a bond defined by ``("A", "B")`` is equivalent to ``("B", "A")``.
+
     Parameters
     ----------
     df : :class:`pandas.DataFrame`
@@ -30,50 +34,56 @@ def parse_wildcards(df: pd.DataFrame, symbols: Collection[str], prm_type: str) -
         Used for substituting ``"X"``.
 
     prm_type : :class:`str`
+        The type of parameter contained in **df**.
+        See :data:`BLOCK_MAPPING` for accepted values.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+        A DataFrame with all wildcard-expanded atom-pairs appended to **df**.
+        **df** itself is returned if it is devoid of wildcards.
 
     """
     # Check if a wildcard is present
     idx_list = df.index.tolist()
-    idx_array = np.array(idx_list)
-    if 'X' not in idx_array:
-        return
+    if not any('X' in tup for tup in idx_list):
+        return df
 
     try:
-        is_in_index = INTERSECTION_MAPPING[prm_type]
+        name = BLOCK_MAPPING[prm_type]
     except KeyError as ex:
         raise ValueError(f"Invalid value ({repr(prm_type)}) for 'prm_type'; allowed values: "
-                         f"{tuple(INTERSECTION_MAPPING.keys())} ").with_traceback(ex.__traceback__)
+                         f"{tuple(BLOCK_MAPPING.keys())} ").with_traceback(ex.__traceback__)
 
-    index = set(df.index)
-    for tup in idx_list:
+    normalize = PRMContainer.normalize_key
+    index = {normalize(tup, name) for tup in idx_list}
+    new_idx: List[Tuple[str, ...]] = []
+    new_pos: List[int] = []
+    for j, tup in enumerate(idx_list):
         if 'X' not in tup:  # Search for wildcards
             continue
 
         # Replace wildcards with explicit references to atom types
         seq = [([i] if i != 'X' else symbols) for i in tup]
-        seq_product = product(*seq)
-        for i in seq_product:
-            if not is_in_index(i, index):  # Do not add any duplicates
-                df.loc[i] = df.loc[tup]
-                index.add(i)
-
-
-def _invert(tup: tuple, tup_set: Set[tuple]) -> bool:
-    """Check if **tup_set** contains ``tup`` or ``tup[::-1]``."""
-    return bool(tup_set.intersection([tup, tup[::-1]]))
-
-
-def _all_comb(tup: tuple, tup_set: Set[tuple]) -> bool:
-    """Check if **tup_set** any combination of ``tup[0]`` and a permutation of ``tup[1:]``."""
-    i_0, *i_n = tup
-    iterable = ((i_0,) + i for i in permutations(i_n))
-    return bool(tup_set.intersection(iterable))
-
-
-INTERSECTION_MAPPING: Mapping[str, Callable[[tuple, Set[tuple]], None]] = MappingProxyType({
-    'bonds': _invert,
-    'angles': _invert,
-    'urey_bradley': _invert,
-    'dihedrals': _invert,
-    'impropers': _all_comb
+        for i in product(*seq):
+            i_norm = normalize(i, name)
+            if i_norm not in index:  # Do not add any duplicates
+                index.add(i_norm)
+                new_idx.append(i)
+                new_pos.append(j)
+
+    if not new_idx:
+        return df
+    df_new = df.iloc[new_pos]
+    df_new.index = pd.MultiIndex.from_tuples(new_idx, names=df.index.names)
+    return pd.concat([df, df_new])
+
+
+#: Map the accepted values of **prm_type** to :attr:`PRMContainer.KEY_NORMALIZER` keys.
+BLOCK_MAPPING: Mapping[str, str] = MappingProxyType({
+    'bonds': 'bonds',
+    'angles': 'angles',
+    'urey_bradley': 'angles',
+    'dihedrals': 'dihedrals',
+    'impropers': 'impropers'
 })
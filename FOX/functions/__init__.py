@@ -6,14 +6,18 @@ Various functions implemented in **Auto-FOX**.
 
 """
 
-from .rdf import get_rdf_lowmem, get_rdf
-from .adf import get_adf
-from .utils import get_template, assert_error, get_example_xyz, group_by_values
-from .charge_utils import update_charge
+from .lazy import lazy_loader
 
 __all__ = [
     'get_rdf_lowmem', 'get_rdf',
     'get_adf',
-    'get_template', 'assert_error', 'get_example_xyz', 'group_by_values'
+    'get_template', 'assert_error', 'get_example_xyz', 'group_by_values',
     'update_charge',
 ]
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    '.rdf': ['get_rdf_lowmem', 'get_rdf'],
+    '.adf': ['get_adf'],
+    '.utils': ['get_template', 'assert_error', 'get_example_xyz', 'group_by_values'],
+    '.charge_utils': ['update_charge'],
+})
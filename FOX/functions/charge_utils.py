@@ -122,14 +122,16 @@ def constrained_update(at1: str, df: pd.DataFrame,
 
     # Perform a constrained charge update
     func1 = invert_partial_ufunc(constrain_dict[at1])
-    for at2, func2 in constrain_dict.items():
-        if at2 == at1:
-            continue
-        exclude.add(at2)
-
-        # Update the charges
-        df.at[at2, 'param'] = func2(func1(charge))
+    value = func1(charge)
+    atoms = [at2 for at2 in constrain_dict if at2 != at1]
+    if not atoms:
+        return exclude
+    exclude.update(atoms)
 
+    # Update the charges
+    i = df.index.get_indexer(atoms)
+    j = df.columns.get_loc('param')
+    df.iloc[i, j] = [constrain_dict[at2](value) for at2 in atoms]
     return exclude
 
 
@@ -138,6 +140,9 @@ def unconstrained_update(net_charge: float, df: pd.DataFrame,
     """Perform an unconstrained update of atomic charges.
 
     The total charge in **df** is kept equal to **net_charge**.
+    All charges, except those in **exclude**, are scaled by a common factor and
+    clipped by the ``"min"`` and ``"max"`` columns.
+    Whenever a charge is clipped the scaling factor of all subsequent charges is recalculated.
 
     Performs an inplace update of the ``"param"`` column in **df**.
 
@@ -158,22 +163,31 @@ def unconstrained_update(net_charge: float, df: pd.DataFrame,
     if not include.any():
         return
 
-    i = net_charge - get_net_charge(df, ~include)
-    i /= get_net_charge(df, include)
+    param = df['param'].values.astype(float)
+    count = df['count'].values
+    prm_min = df['min'].values
+    prm_max = df['max'].values
 
-    iterator = enumerate(df[['param', 'min', 'max']].iterrows())
-    v_new = v_new_clip = 0
-    for j, (atom, (prm, prm_min, prm_max)) in iterator:
-        if atom in exclude:
-            continue
-        elif v_new != v_new_clip:
-            i = net_charge - get_net_charge(df, ~include)
-            i /= get_net_charge(df, include)
-
-        v_new = i * prm
-        v_new_clip = np.clip(v_new, prm_min, prm_max)
-        df.loc[atom, 'param'] = v_new_clip
-        include[j] = False
+    # Update all charges up to (and including) the next clipped charge per round
+    idx = np.flatnonzero(include)
+    start = 0
+    while start < len(idx):
+        idx_rest = idx[start:]
+        include[:] = False
+        include[idx_rest] = True
+
+        i = net_charge - np.nansum(param[~include] * count[~include])
+        i /= np.nansum(param[idx_rest] * count[idx_rest])
+
+        v_new = i * param[idx_rest]
+        v_new_clip = np.clip(v_new, prm_min[idx_rest], prm_max[idx_rest])
+        is_clipped = np.flatnonzero(v_new != v_new_clip)
+        stop = len(idx_rest) if not is_clipped.size else is_clipped[0] + 1
+
+        param[idx_rest[:stop]] = v_new_clip[:stop]
+        start += stop
+
+    df.iloc[idx, df.columns.get_loc('param')] = param[idx]
 
 
 def invert_partial_ufunc(ufunc: functools.partial) -> Callable:
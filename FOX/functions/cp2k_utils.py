@@ -11,7 +11,11 @@ from scm.plams import Settings, Units
 
 from .charge_utils import assign_constraints
 
-__all__ = ['set_keys', 'parse_cp2k_value']
+__all__ = ['set_keys', 'parse_cp2k_value', 'get_trajectory_format']
+
+# Newer PLAMS versions renamed Settings.supress_missing() into Settings.suppress_missing()
+if hasattr(Settings, 'suppress_missing'):
+    Settings.supress_missing = Settings.suppress_missing
 
 # Multiplicative factor for converting Hartree into Kelvin
 Units.energy['k'] = Units.energy['kelvin'] = (
@@ -226,6 +230,21 @@ def set_keys(settings: Settings, param: pd.DataFrame) -> None:
     _populate_keys(settings, param)
 
 
+def get_trajectory_format(settings: Settings) -> str:
+    """Return the format of the MD trajectory as specified in the CP2K job **settings**.
+
+    Returns ``"dcd"`` if ``input.motion.print.trajectory.format`` is set to ``"DCD"``
+    (or one of its variants) and ``"xyz"`` otherwise.
+
+    """
+    traj_format = settings
+    for key in ('input', 'motion', 'print', 'trajectory', 'format'):
+        if not isinstance(traj_format, Mapping) or key not in traj_format:
+            return 'xyz'  # Do not use __getitem__ here; Settings.__missing__ creates new keys
+        traj_format = traj_format[key]
+    return 'dcd' if str(traj_format).upper().startswith('DCD') else 'xyz'
+
+
 def _sort_index(index: pd.MultiIndex) -> pd.MultiIndex:
     ret = []
     for i, j in index:
@@ -0,0 +1,85 @@
+"""
+FOX.functions.lazy
+==================
+
+A module for lazily importing the public attributes of (sub-)packages.
+
+Index
+-----
+.. currentmodule:: FOX.functions.lazy
+.. autosummary::
+    lazy_loader
+
+API
+---
+.. autofunction:: lazy_loader
+
+"""
+
+import sys
+import importlib
+from typing import Mapping, Iterable, Callable, Tuple, List, Any
+
+__all__ = ['lazy_loader']
+
+
+def lazy_loader(name: str, attr_map: Mapping[str, Iterable[str]],
+                submodules: Iterable[str] = ()) -> Tuple[Callable[[str], Any],
+                                                         Callable[[], List[str]]]:
+    """Construct a module-level ``__getattr__()`` and ``__dir__()`` function (see :pep:`562`).
+
+    Attributes are imported and cached in the namespace of **name** upon first access.
+    Module-level ``__getattr__()`` is not available prior to Python 3.7,
+    in which case all attributes are imported immediately.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> __getattr__, __dir__ = lazy_loader(__name__, {
+        ...     '.multi_mol': ['MultiMolecule'],
+        ...     '.armc': ['ARMC', 'run_armc']
+        ... })
+
+    Parameters
+    ----------
+    name : :class:`str`
+        The name of the to-be populated (sub-)package, *i.e.* its ``__name__`` attribute.
+
+    attr_map : :class:`Mapping<collections.abc.Mapping>` [:class:`str`, :class:`Iterable<collections.abc.Iterable>` [:class:`str`]]
+        A mapping with the (relative) names of modules as keys and
+        the names of their to-be exported attributes as values.
+
+    submodules : :class:`Iterable<collections.abc.Iterable>` [:class:`str`]
+        The names of submodules which should be exported themselves.
+
+    Returns
+    -------
+    :class:`Callable<collections.abc.Callable>` and :class:`Callable<collections.abc.Callable>`
+        The module-level ``__getattr__()`` and ``__dir__()`` functions.
+
+    """  # noqa: E501
+    module = sys.modules[name]
+    attr_dict = {k: mod_name for mod_name, attr_list in attr_map.items() for k in attr_list}
+    attr_dict.update((k, None) for k in submodules)
+
+    def __getattr__(attr: str) -> Any:
+        try:
+            mod_name = attr_dict[attr]
+        except KeyError:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}") from None
+
+        if mod_name is None:
+            ret = importlib.import_module(f'.{attr}', name)
+        else:
+            ret = getattr(importlib.import_module(mod_name, name), attr)
+        setattr(module, attr, ret)
+        return ret
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)).union(attr_dict))
+
+    if sys.version_info < (3, 7):
+        for attr in attr_dict:
+            __getattr__(attr)
+    return __getattr__, __dir__
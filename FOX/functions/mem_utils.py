@@ -0,0 +1,130 @@
+"""
+FOX.functions.mem_utils
+=======================
+
+A module for keeping track of the memory allocated by (analysis) functions.
+
+Index
+-----
+.. currentmodule:: FOX.functions.mem_utils
+.. autosummary::
+    AllocationCounter
+    ALLOC_COUNTER
+
+API
+---
+.. autoclass:: AllocationCounter
+    :members:
+.. autodata:: ALLOC_COUNTER
+
+"""
+
+import tracemalloc
+from functools import wraps
+from typing import Dict, List, Callable, TypeVar, Optional, Any
+
+__all__ = ['AllocationCounter', 'ALLOC_COUNTER']
+
+FT = TypeVar('FT', bound=Callable[..., Any])
+
+
+class AllocationCounter:
+    """A class for counting the number of bytes allocated per function call.
+
+    Functions decorated with :meth:`AllocationCounter.track` will report
+    the peak amount of memory (in bytes) allocated during each call,
+    storing it in :attr:`AllocationCounter.records`.
+    Counting is disabled by default and is enabled by using
+    the counter as a context manager.
+
+    Only the outermost tracked call is recorded when decorated functions call each other.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX import MultiMolecule, example_xyz
+        >>> from FOX.functions.mem_utils import ALLOC_COUNTER
+
+        >>> mol = MultiMolecule.from_xyz(example_xyz)
+        >>> with ALLOC_COUNTER as counter:
+        ...     rdf = mol.init_rdf(atom_subset=['Cd', 'Se'])
+
+        >>> print(counter.records)
+        {'MultiMolecule.init_rdf': [...]}
+
+    Attributes
+    ----------
+    enabled : :class:`bool`
+        Whether or not allocations are currently being counted.
+
+    records : :class:`dict` [:class:`str`, :class:`list` [:class:`int`]]
+        A dictionary mapping the qualified names of tracked functions to a list
+        with the peak number of allocated bytes per call.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance."""
+        self.enabled: bool = False
+        self.records: Dict[str, List[int]] = {}
+        self._depth: int = 0
+        self._started: bool = False
+
+    def __repr__(self) -> str:
+        """Return a string representation of this instance."""
+        return f'{self.__class__.__name__}(enabled={self.enabled!r}, records={self.records!r})'
+
+    def __enter__(self) -> 'AllocationCounter':
+        """Enable the allocation counter, starting :mod:`tracemalloc` if required."""
+        self.enabled = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Disable the allocation counter."""
+        self.enabled = False
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def reset(self) -> None:
+        """Remove all previously recorded allocations."""
+        self.records.clear()
+
+    def peak(self, name: str) -> Optional[int]:
+        """Return the number of bytes allocated by the last call to **name**.
+
+        Returns ``None`` if no calls to **name** have been recorded.
+
+        """
+        try:
+            return self.records[name][-1]
+        except (KeyError, IndexError):
+            return None
+
+    def track(self, func: FT) -> FT:
+        """Decorate **func** such that its allocations are counted when this instance is enabled."""
+        name = func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled or self._depth:
+                return func(*args, **kwargs)
+
+            tracemalloc.clear_traces()  # This resets the peak as well
+            self._depth += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                _, peak = tracemalloc.get_traced_memory()
+                self.records.setdefault(name, []).append(peak)
+        return wrapper
+
+
+#: A global :class:`AllocationCounter` instance used for decorating the
+#: analysis methods of :class:`~FOX.classes.multi_mol.MultiMolecule`.
+ALLOC_COUNTER = AllocationCounter()
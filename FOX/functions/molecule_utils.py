@@ -12,6 +12,7 @@ Index
 
 API
 ---
+.. autofunction:: FOX.functions.molecule_utils.get_bond_matrix
 .. autofunction:: FOX.functions.molecule_utils.get_bonds
 .. autofunction:: FOX.functions.molecule_utils.get_angles
 .. autofunction:: FOX.functions.molecule_utils.get_dihedrals
@@ -19,13 +20,15 @@ API
 
 """
 
-from typing import List
+from typing import List, Optional, Tuple
+from itertools import chain
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from scm.plams import Molecule, Atom
 
-__all__ = ['get_bonds', 'get_angles', 'get_dihedrals', 'get_impropers']
+__all__ = ['get_bond_matrix', 'get_bonds', 'get_angles', 'get_dihedrals', 'get_impropers']
 
 
 def fix_bond_orders(mol: Molecule) -> None:
@@ -92,6 +95,72 @@ def separate_mod(mol: Molecule) -> List[List[int]]:
     return indices
 
 
+def get_bond_matrix(mol: Molecule) -> csr_matrix:
+    """Construct a sparse CSR bond matrix from **mol** with the bond orders as values.
+
+    In contrast to :func:`FOX.ff.degree_of_separation.sparse_bond_matrix`,
+    the (column) indices of each row are neither sorted nor are duplicate bonds summed;
+    the neighbours of each atom are stored in the same order as in :attr:`Atom.bonds`.
+
+    Parameters
+    ----------
+    mol : |plams.Molecule|_
+        A PLAMS molecule.
+
+    Returns
+    -------
+    :math:`n*n` :class:`csr_matrix<scipy.sparse.csr_matrix>` [|np.float64|_]:
+        A sparse bond matrix with the bond orders of all :math:`n` atoms in **mol**.
+
+    """
+    atom_count = len(mol.atoms)
+    bond_count = len(mol.bonds)
+
+    bonds = _get_bond_array(mol)
+    order = np.fromiter((b.order for b in mol.bonds), dtype=float, count=bond_count)
+
+    # Stable sort all bond permutations by their first atom
+    rows = bonds.ravel()
+    columns = bonds[:, ::-1].ravel()
+    idx = np.argsort(rows, kind='stable')
+
+    indptr = np.zeros(atom_count + 1, dtype=np.intp)
+    np.cumsum(np.bincount(rows, minlength=atom_count), out=indptr[1:])
+    data = np.repeat(order, 2)[idx]
+    return csr_matrix((data, columns[idx], indptr), shape=(atom_count, atom_count))
+
+
+def _get_bond_array(mol: Molecule) -> np.ndarray:
+    """Return a 2D array with the (0-based) atomic indices of all bonds in **mol**."""
+    mol.set_atoms_id(start=0)
+    iterator = chain.from_iterable((b.atom1.id, b.atom2.id) for b in mol.bonds)
+    ret = np.fromiter(iterator, dtype=int, count=2 * len(mol.bonds)).reshape(-1, 2)
+    mol.unset_atoms_id()
+    return ret
+
+
+def _get_mass(mol: Molecule) -> np.ndarray:
+    """Return a 1D array with the atomic masses of all atoms in **mol**."""
+    return np.fromiter((at.mass for at in mol.atoms), dtype=float, count=len(mol.atoms))
+
+
+def _get_bond_matrix(mol: Molecule, bond_mat: Optional[csr_matrix]) -> csr_matrix:
+    """Return **bond_mat** or, if ``None``, construct a new one with :func:`get_bond_matrix`."""
+    return get_bond_matrix(mol) if bond_mat is None else bond_mat
+
+
+def _expand(count: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Expand every element :math:`i` in **count** into the range :math:`[0, count_i)`.
+
+    Returns the index of the parent element and the position within the range
+    for all (concatenated) ranges.
+
+    """
+    parent = np.repeat(np.arange(len(count)), count)
+    offset = np.cumsum(count) - count
+    return parent, np.arange(len(parent)) - offset[parent]
+
+
 def get_bonds(mol: Molecule) -> np.ndarray:
     """Return an array with the atomic indices defining all bonds in **mol**.
 
@@ -106,152 +175,157 @@ def get_bonds(mol: Molecule) -> np.ndarray:
         A 2D array with atomic indices defining :math:`n` bonds.
 
     """
-    mol.set_atoms_id()
-    bonds = [(b.atom1.id, b.atom2.id) for b in mol.bonds]
+    if not mol.bonds:  # If no bonds are found
+        return np.array([], dtype=int, ndmin=2)
 
-    ret = np.array(bonds, dtype=int, ndmin=2)
-    mol.unset_atoms_id()
-    if not bonds:  # If no angles are found
-        return ret
+    ret = _get_bond_array(mol)
 
     # Sort horizontally
-    mass = np.array([[mol[j].mass for j in i] for i in ret])
+    mass = _get_mass(mol)[ret]
     idx1 = np.argsort(mass, axis=1)[:, ::-1]
     ret[:] = np.take_along_axis(ret, idx1, axis=1)
+    ret += 1
 
     # Sort and return vertically
     idx2 = np.argsort(ret, axis=0)[:, 0]
     return ret[idx2]
 
 
-def get_angles(mol: Molecule) -> np.ndarray:
+def get_angles(mol: Molecule, bond_mat: Optional[csr_matrix] = None) -> np.ndarray:
     """Return an array with the atomic indices defining all angles in **mol**.
 
+    Angles are constructed by expanding all pairs of neighbours of every atom
+    in the sparse bond matrix.
+
     Parameters
     ----------
     mol : |plams.Molecule|_
         A PLAMS molecule.
 
+    bond_mat : :class:`csr_matrix<scipy.sparse.csr_matrix>`, optional
+        The bond matrix of **mol** as constructed by :func:`get_bond_matrix`.
+        Will be constructed if ``None``.
+
     Returns
     -------
     :math:`n*3` |np.ndarray|_ [|np.int64|_]:
         A 2D array with atomic indices defining :math:`n` angles.
 
     """
-    mol.set_atoms_id()
-    angle = []
-    angle_append = angle.append
+    bond_mat = _get_bond_matrix(mol, bond_mat)
+    indptr, indices = bond_mat.indptr, bond_mat.indices
 
-    for at2 in mol.atoms:
-        if len(at2.bonds) < 2:
-            continue
+    # Pair every neighbour with all subsequent neighbours of the same central atom
+    center = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    pos = np.arange(len(indices)) - indptr[center]
+    count = np.diff(indptr)[center] - 1 - pos
+    i, k = _expand(count)
+    j = i + 1 + k
 
-        at_other = [bond.other_end(at2) for bond in at2.bonds]
-        for i, at1 in enumerate(at_other, 1):
-            for at3 in at_other[i:]:
-                angle_append((at1.id, at2.id, at3.id))
-
-    ret = np.array(angle, dtype=int, ndmin=2)
-    mol.unset_atoms_id()
-    if not angle:  # If no angles are found
-        return ret
+    if not len(i):  # If no angles are found
+        return np.array([], dtype=int, ndmin=2)
+    ret = np.stack([indices[i], center[i], indices[j]], axis=1).astype(int)
 
     # Sort horizontally
-    mass = np.array([[mol[j].mass for j in i] for i in ret[:, 0::2]])
+    mass = _get_mass(mol)[ret[:, 0::2]]
     idx1 = np.argsort(mass, axis=1)[:, ::-1]
     ret[:, ::2] = np.take_along_axis(ret[:, ::2], idx1, axis=1)
+    ret += 1
 
     # Sort and return vertically
     idx2 = np.argsort(ret, axis=0)[:, 0]
     return ret[idx2]
 
 
-def get_dihedrals(mol: Molecule) -> np.ndarray:
+def get_dihedrals(mol: Molecule, bond_mat: Optional[csr_matrix] = None) -> np.ndarray:
     """Return an array with the atomic indices defining all proper dihedral angles in **mol**.
 
+    Dihedrals are constructed by expanding, for every bond, all combinations of
+    the neighbours of its two atoms in the sparse bond matrix.
+
     Parameters
     ----------
     mol : |plams.Molecule|_
         A PLAMS molecule.
 
+    bond_mat : :class:`csr_matrix<scipy.sparse.csr_matrix>`, optional
+        The bond matrix of **mol** as constructed by :func:`get_bond_matrix`.
+        Will be constructed if ``None``.
+
     Returns
     -------
     :math:`n*4` |np.ndarray|_ [|np.int64|_]:
         A 2D array with atomic indices defining :math:`n` proper dihedrals.
 
     """
-    mol.set_atoms_id()
-    dihed = []
-    dihed_append = dihed.append
-
-    for b1 in mol.bonds:
-        if not (len(b1.atom1.bonds) > 1 and len(b1.atom2.bonds) > 1):
-            continue
-
-        at2, at3 = b1
-        for b2 in at2.bonds:
-            at1 = b2.other_end(at2)
-            if at1 == at3:
-                continue
-
-            for b3 in at3.bonds:
-                at4 = b3.other_end(at3)
-                if at4 != at2:
-                    dihed_append((at1.id, at2.id, at3.id, at4.id))
-
-    ret = np.array(dihed, dtype=int, ndmin=2)
-    mol.unset_atoms_id()
-    if not dihed:  # If no dihedrals are found
-        return ret
+    bond_mat = _get_bond_matrix(mol, bond_mat)
+    indptr, indices = bond_mat.indptr, bond_mat.indices
+    degree = np.diff(indptr)
+
+    # Combine all neighbours of atom 2 with all neighbours of atom 3
+    at2, at3 = _get_bond_array(mol).T
+    i, k = _expand(degree[at2] * degree[at3])
+    at2, at3 = at2[i], at3[i]
+    at1 = indices[indptr[at2] + k // degree[at3]]
+    at4 = indices[indptr[at3] + k % degree[at3]]
+
+    valid = (at1 != at3) & (at4 != at2)
+    if not valid.any():  # If no dihedrals are found
+        return np.array([], dtype=int, ndmin=2)
+    ret = np.stack([at1, at2, at3, at4], axis=1)[valid].astype(int)
 
     # Sort horizontally
-    mass = np.array([[mol[j].mass for j in i] for i in ret[:, 1:3]])
+    mass = _get_mass(mol)[ret[:, 1:3]]
     idx1 = np.argsort(mass, axis=1)
     ret[:, ::3] = np.take_along_axis(ret[:, ::3], idx1, axis=1)
     ret[:, 1:3] = np.take_along_axis(ret[:, 1:3], idx1, axis=1)
+    ret += 1
 
     # Sort and return vertically
     idx2 = np.argsort(ret, axis=0)[:, 0]
     return ret[idx2]
 
 
-def get_impropers(mol: Molecule) -> np.ndarray:
+def get_impropers(mol: Molecule, bond_mat: Optional[csr_matrix] = None) -> np.ndarray:
     """Return an array with the atomic indices defining all improper dihedral angles in **mol**.
 
+    Impropers are defined for all atoms with three neighbours,
+    at least one of them connected by a double or aromatic bond.
+
     Parameters
     ----------
     mol : |plams.Molecule|_
         A PLAMS molecule.
 
+    bond_mat : :class:`csr_matrix<scipy.sparse.csr_matrix>`, optional
+        The bond matrix of **mol** as constructed by :func:`get_bond_matrix`.
+        Will be constructed if ``None``.
+
     Returns
     -------
     :math:`n*4` |np.ndarray|_ [|np.int64|_]:
         A 2D array with atomic indices defining :math:`n` improper dihedrals.
 
     """
-    mol.set_atoms_id()
-    impropers = []
-    impropers_append = impropers.append
+    bond_mat = _get_bond_matrix(mol, bond_mat)
+    indptr, indices, order = bond_mat.indptr, bond_mat.indices, bond_mat.data
 
-    for at1 in mol.atoms:
-        order = [bond.order for bond in at1.bonds]
-        if len(order) != 3:
-            continue
+    at1 = np.nonzero(np.diff(indptr) == 3)[0]
+    neighbours = indptr[at1, None] + np.arange(3)
+    valid = np.isin(order[neighbours], (2.0, 1.5)).any(axis=1)
+    if not valid.any():  # If no impropers are found
+        return np.array([], dtype=int, ndmin=2)
 
-        if 2.0 in order or 1.5 in order:
-            at2, at3, at4 = [bond.other_end(at1) for bond in at1.bonds]
-            impropers_append((at1.id, at2.id, at3.id, at4.id))
-
-    ret = np.array(impropers, dtype=int, ndmin=2)
-    mol.unset_atoms_id()
-    if not impropers:  # If no impropers are found
-        return ret
+    ret = np.empty((valid.sum(), 4), dtype=int)
+    ret[:, 0] = at1[valid]
+    ret[:, 1:] = indices[neighbours[valid]]
 
     # Sort along the rows of columns 2, 3 & 4 based on atomic mass in descending order
-    mass = np.array([[mol[j].mass for j in i] for i in ret[:, 1:]])
+    mass = _get_mass(mol)[ret[:, 1:]]
     idx1 = np.argsort(mass, axis=1)
     idx1[:, 1:] = idx1[:, 1:][::-1]
     ret[:, 1:] = np.take_along_axis(ret[:, 1:], idx1, axis=1)
+    ret += 1
 
     # Sort vertically
     idx2 = np.argsort(ret, axis=0)[:, 0]
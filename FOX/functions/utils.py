@@ -4,18 +4,14 @@ import warnings
 from collections import abc
 from os.path import join, isfile
 from functools import wraps
-from pkg_resources import resource_filename
 from typing import (
     Iterable, Tuple, Callable, Hashable, Sequence, Optional, List, Any, TypeVar, Dict,
     Type, Mapping, Union
 )
 
-import yaml
 import numpy as np
 import pandas as pd
 
-from scm.plams import (Settings, add_to_class)
-
 __all__ = ['get_template', 'template_to_df', 'get_example_xyz']
 
 T = TypeVar('T')
@@ -104,9 +100,9 @@ def assert_error(error_msg: Optional[str] = None) -> Callable:
                      error_msg: str) -> Callable:
         """Process classes fed into :func:`assert_error`."""
         if error_msg:
-            @add_to_class(f_type)
             def __init__(self, *arg, **kwarg):
                 raise ModuleNotFoundError(error_msg.format(f_type.__name__))
+            f_type.__init__ = __init__
         return f_type
 
     type_dict = {'function': _function_error, 'type': _class_error}
@@ -139,9 +135,12 @@ def get_template(name: str,
         A settings object or dictionary as constructed from the template file.
 
     """
+    import yaml
+    from scm.plams import Settings
+
     if path is None:
         if not isfile(name):
-            path = resource_filename('FOX', join('data', name))
+            path = _get_data_path(name)
     else:
         path = join(path, name)
 
@@ -182,6 +181,8 @@ def serialize_array(array: np.ndarray, items_per_row: int = 4) -> str:
     """Serialize an array into a single string.
 
     Newlines are placed for every **items_per_row** rows in **array**.
+    Every value is right-aligned in a field of 10 characters;
+    the entire array is formatted at once as a fixed-width array of ASCII characters.
 
     Parameters
     ----------
@@ -197,20 +198,51 @@ def serialize_array(array: np.ndarray, items_per_row: int = 4) -> str:
         A serialized array.
 
     """
+    array = np.asarray(array)
     if len(array) == 0:
         return ''
 
-    ret = ''
-    k = 0
-    for i in array:
-        for j in i:
-            ret += '{:>10d}'.format(j)
-        k += 1
-        if k == items_per_row:
-            k = 0
-            ret += '\n'
+    ar = array.reshape(len(array), -1)
+    char_array = _int_to_ascii(ar.ravel(), width=10)
+    if char_array is None:  # Negative, very large or non-integer values
+        row_list = [('{:>10d}' * ar.shape[1]).format(*row) for row in ar.tolist()]
+        for i in range(items_per_row - 1, len(row_list), items_per_row):
+            row_list[i] += '\n'
+        return ''.join(row_list)
+
+    # Append a newline to every completely filled line
+    width = 10 * ar.shape[1] * items_per_row  # The number of characters per line
+    i = (len(ar) // items_per_row) * width
+    body = char_array[:i].reshape(-1, width)
+    newline = np.full((len(body), 1), ord('\n'), dtype=np.uint8)
+    ret = np.hstack([body, newline]).tobytes() + char_array[i:].tobytes()
+    return ret.decode('ascii')
 
-    return ret
+
+def _int_to_ascii(array: np.ndarray, width: int = 10) -> Optional[np.ndarray]:
+    """Convert a 1D integer array into a 1D array of right-aligned ASCII characters.
+
+    The returned uint8 array contains **width** characters for every element in **array**.
+    Returns ``None`` if **array** is empty, contains negative or non-integer values or
+    values too large to fit in **width** characters.
+
+    """
+    if array.dtype.kind == 'b':
+        array = array.astype(np.int64)
+    if array.dtype.kind not in 'iu' or not array.size:
+        return None
+    elif array.min() < 0 or array.max() >= 10**width:
+        return None
+
+    powers = 10**np.arange(width - 1, -1, -1, dtype=np.int64)
+    value = array.astype(np.int64)[:, None]
+    ret = (value // powers) % 10 + ord('0')
+
+    # Replace leading zeros with spaces
+    is_padding = value < powers
+    is_padding[:, -1] = False
+    ret[is_padding] = ord(' ')
+    return ret.astype(np.uint8).ravel()
 
 
 def read_str_file(filename: str) -> Optional[Tuple[Sequence, Sequence]]:
@@ -336,6 +368,8 @@ def dict_to_pandas(input_dict: dict, name: Hashable = 0,
         A pandas series or dataframe created fron **input_dict**.
 
     """
+    from scm.plams import Settings
+
     # Construct a MultiIndex
     if not isinstance(input_dict, Settings):
         flat_dict = Settings(input_dict).flatten(flatten_list=False)
@@ -406,6 +440,12 @@ def get_example_xyz(name: str = 'Cd68Se55_26COO_MD_trajec.xyz') -> str:
     """Return the path + name of the example multi-xyz file."""
     err = "'FOX.get_example_xyz()' has been deprecated in favour of 'FOX.example_xyz'"
     warnings.warn(err, FutureWarning)
+    return _get_data_path(name)
+
+
+def _get_data_path(name: str) -> str:
+    """Return the path+name of a file in the :mod:`FOX.data` directory."""
+    from pkg_resources import resource_filename
     return resource_filename('FOX', join('data', name))
 
 
@@ -6,12 +6,16 @@ Various io-related functions implemented in Auto-FOX.
 
 """
 
-from .read_psf import PSFContainer
-from .read_prm import PRMContainer
-from .hdf5_utils import (create_hdf5, create_xyz_hdf5, to_hdf5, from_hdf5)
+from ..functions.lazy import lazy_loader
 
 __all__ = [
     'PSFContainer',
     'PRMContainer',
     'create_hdf5', 'create_xyz_hdf5', 'to_hdf5', 'from_hdf5',
 ]
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    '.read_psf': ['PSFContainer'],
+    '.read_prm': ['PRMContainer'],
+    '.hdf5_utils': ['create_hdf5', 'create_xyz_hdf5', 'to_hdf5', 'from_hdf5'],
+})
@@ -0,0 +1,150 @@
+"""
+FOX.io.cp2k_template
+====================
+
+A module for compiling CP2K input files into reusable templates.
+
+Index
+-----
+.. currentmodule:: FOX.io.cp2k_template
+.. autosummary::
+    CP2KTemplate
+    CP2KTemplate.render
+
+API
+---
+.. autoclass:: CP2KTemplate
+.. automethod:: CP2KTemplate.render
+
+"""
+
+import re
+import copy
+from typing import Sequence, Hashable, Optional, List, Tuple, Type
+
+from scm.plams import Settings, Molecule, Cp2kJob
+
+__all__ = ['CP2KTemplate']
+
+#: The placeholders inserted into the CP2K input; "\x00" never appears in actual CP2K input
+_TOKEN = '\x00{}\x00'
+_TOKEN_PATTERN = re.compile('\x00(\\d+|coord)\x00')
+
+
+class CP2KTemplate:
+    """A CP2K input file which has been rendered once, with placeholders for all parameters.
+
+    The input is split into a tuple of static fragments, interleaved with
+    the parameters and (optionally) the cartesian coordinates of a molecule.
+    Constructing a new input file with :meth:`CP2KTemplate.render` thus only requires
+    substituting the placeholders rather than re-serializing the entire CP2K settings.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from scm.plams import Settings, Molecule
+        >>> from FOX.io.cp2k_template import CP2KTemplate
+
+        >>> settings = Settings(...)
+        >>> mol = Molecule(...)
+        >>> keys = [('input', 'force_eval', 'mm', 'forcefield', 'charge', 0, 'charge')]
+
+        >>> template = CP2KTemplate(settings, keys, molecule=mol)
+        >>> inp: str = template.render(['-1.000000'], molecule=mol)
+
+    Parameters
+    ----------
+    settings : |plams.Settings|_
+        The CP2K job settings.
+        Changes made to **settings** after constructing the template are *not* reflected
+        in the template.
+
+    keys : :class:`Sequence<collections.abc.Sequence>` [:class:`Sequence<collections.abc.Sequence>` [:class:`Hashable<collections.abc.Hashable>`]]
+        A sequence of nested keys, each one pointing to a parameter in **settings**.
+        The :math:`i`-th key will be substituted by the :math:`i`-th value
+        passed to :meth:`CP2KTemplate.render`.
+
+    molecule : |plams.Molecule|_, optional
+        A PLAMS molecule used for setting the lattice vectors.
+        If not ``None``, the coordinates of the molecule are replaced with a placeholder.
+
+    job_type : :class:`type` [|plams.Cp2kJob|_]
+        The job type used for serializing the CP2K settings.
+
+    Attributes
+    ----------
+    fragments : :class:`tuple` [:class:`str`]
+        A tuple with all static fragments of the input file.
+
+    index : :class:`tuple` [:class:`int`]
+        The index of the substituted value following every fragment (except the last one).
+        An index of ``-1`` is used for the cartesian coordinates.
+
+    """  # noqa: E501
+
+    __slots__ = ('fragments', 'index')
+
+    def __init__(self, settings: Settings, keys: Sequence[Sequence[Hashable]],
+                 molecule: Optional[Molecule] = None,
+                 job_type: Type[Cp2kJob] = Cp2kJob) -> None:
+        """Initialize a :class:`CP2KTemplate` instance."""
+        # Settings.copy() does not copy lists, hence the deepcopy
+        s = Settings(copy.deepcopy(settings))
+        for i, key in enumerate(keys):
+            s.set_nested(key, _TOKEN.format(i))
+
+        job = job_type(settings=s, molecule=molecule)
+        if molecule:
+            job._parsemol()
+            job.settings.input.force_eval.subsys.coord._h = _TOKEN.format('coord')
+        job.settings.ignore_molecule = True
+
+        fragments, index = self._split(job.get_input())
+        self.fragments: Tuple[str, ...] = fragments
+        self.index: Tuple[int, ...] = index
+
+    @staticmethod
+    def _split(inp: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+        """Split **inp** into a tuple of fragments and a tuple of indices."""
+        split = _TOKEN_PATTERN.split(inp)
+        fragments = tuple(split[::2])
+        index = tuple((-1 if i == 'coord' else int(i)) for i in split[1::2])
+        return fragments, index
+
+    def __repr__(self) -> str:
+        """Implement :func:`repr(self)<repr>`."""
+        return f'{self.__class__.__name__}(<{len(self.index)} placeholders>)'
+
+    def render(self, values: Sequence[str], molecule: Optional[Molecule] = None) -> str:
+        """Construct a CP2K input file.
+
+        Parameters
+        ----------
+        values : :class:`Sequence<collections.abc.Sequence>` [:class:`str`]
+            A sequence of pre-formatted parameters, *e.g.* ``"[kjmol] 0.500000"``.
+            Its length should be equal to the number of keys used for constructing the template.
+
+        molecule : |plams.Molecule|_, optional
+            A PLAMS molecule whose coordinates will be inserted in the
+            ``FORCE_EVAL/SUBSYS/COORD`` block.
+            Required if the template was constructed with a molecule.
+
+        Returns
+        -------
+        :class:`str`
+            The CP2K input file.
+
+        """
+        if -1 in self.index:
+            if not molecule:
+                raise TypeError("The 'molecule' parameter is required for templates "
+                                "with coordinates")
+            coord = ''.join('\n' + (' {:}' * 4).format(at.symbol, *at.coords) for at in molecule)
+        else:
+            coord = None
+
+        ret: List[Optional[str]] = [None] * (2 * len(self.fragments) - 1)
+        ret[::2] = self.fragments
+        ret[1::2] = [(coord if i == -1 else values[i]) for i in self.index]
+        return ''.join(ret)
@@ -10,43 +10,62 @@ Index
 .. autosummary::
     create_hdf5
     create_xyz_hdf5
+    get_xyz_chunks
     index_to_hdf5
     _get_kwarg_dict
     hdf5_availability
     to_hdf5
     _xyz_to_hdf5
     from_hdf5
+    LazyDataset
+    IncrementalDataset
+    iter_hdf5_updates
     _get_dset
+    _read_dset
+    _get_iter_index
     _get_xyz_dset
     _get_filename_xyz
     _attr_to_array
     dset_to_series
     dset_to_df
+    mol_from_hdf5
 
 API
 ---
 .. autofunction:: FOX.io.hdf5_utils.create_hdf5
 .. autofunction:: FOX.io.hdf5_utils.create_xyz_hdf5
+.. autofunction:: FOX.io.hdf5_utils.get_xyz_chunks
 .. autofunction:: FOX.io.hdf5_utils.index_to_hdf5
 .. autofunction:: FOX.io.hdf5_utils._get_kwarg_dict
 .. autofunction:: FOX.io.hdf5_utils.hdf5_availability
 .. autofunction:: FOX.io.hdf5_utils.to_hdf5
 .. autofunction:: FOX.io.hdf5_utils._xyz_to_hdf5
 .. autofunction:: FOX.io.hdf5_utils.from_hdf5
+.. autoclass:: FOX.io.hdf5_utils.LazyDataset
+    :members:
+.. autoclass:: FOX.io.hdf5_utils.IncrementalDataset
+    :members:
+.. autofunction:: FOX.io.hdf5_utils.iter_hdf5_updates
 .. autofunction:: FOX.io.hdf5_utils._get_dset
+.. autofunction:: FOX.io.hdf5_utils._read_dset
+.. autofunction:: FOX.io.hdf5_utils._get_iter_index
 .. autofunction:: FOX.io.hdf5_utils._get_xyz_dset
 .. autofunction:: FOX.io.hdf5_utils._get_filename_xyz
 .. autofunction:: FOX.io.hdf5_utils._attr_to_array
 .. autofunction:: FOX.io.hdf5_utils.dset_to_series
 .. autofunction:: FOX.io.hdf5_utils.dset_to_df
+.. autofunction:: FOX.io.hdf5_utils.mol_from_hdf5
 
 """
 
+import operator
 import warnings
 import subprocess
 from os import remove, PathLike
 from time import sleep
-from typing import Dict, Iterable, Optional, Union, Hashable, List, Tuple, AnyStr
+from typing import (
+    Dict, Iterable, Optional, Union, Hashable, List, Tuple, AnyStr, Any, Iterator
+)
 from os.path import isfile
 from collections import abc
 
@@ -54,13 +73,12 @@ import numpy as np
 import pandas as pd
 from pandas.core.generic import NDFrame
 
-from scm.plams import Settings
-
 from ..functions.utils import get_shape, assert_error, array_to_index, group_by_values
 
 try:
     import h5py
-    __all__ = ['create_hdf5', 'create_xyz_hdf5', 'to_hdf5', 'from_hdf5']
+    __all__ = ['create_hdf5', 'create_xyz_hdf5', 'to_hdf5', 'from_hdf5', 'LazyDataset',
+               'IncrementalDataset', 'iter_hdf5_updates']
     H5pyFile: Union[type, str] = h5py.File
     H5PY_ERROR: Optional[str] = None
 except ImportError:
@@ -72,6 +90,15 @@ except ImportError:
         "\n\tconda install --name FOX -y -c conda-forge h5py"
     )
 
+try:
+    import hdf5plugin  # Registers the blosc filter (among others) with h5py
+    HDF5PLUGIN_EX: Optional[ImportError] = None
+except ImportError as ex:
+    HDF5PLUGIN_EX = ex
+
+#: The (approximate) size of a single chunk in the ``"xyz"`` datasets, in bytes.
+XYZ_CHUNK_SIZE: int = 2**18
+
 
 """################################### Creating .hdf5 files ####################################"""
 
@@ -88,6 +115,7 @@ def create_hdf5(filename: Union[AnyStr, PathLike], armc: 'FOX.ARMC') -> None:
     * The acceptance rate (dataset: ``"acceptance"``)
     * The unmodified auxiliary error (dataset: ``"aux_error"``)
     * The modifications to the auxiliary error (dataset: ``"aux_error_mod"``)
+    * The wall time and peak RSS of the ARMC stages (dataset: ``"timings"``)
     * User-specified PES descriptors (dataset(s): user-specified name(s))
 
     Cartesian coordinates (``"xyz"``) collected over the course of the current super-iteration are
@@ -120,7 +148,8 @@ def create_hdf5(filename: Union[AnyStr, PathLike], armc: 'FOX.ARMC') -> None:
         'param': armc.param['param'],
         'phi': pd.Series(np.nan, index=np.arange(kappa), name='phi'),
         'aux_error': pd.Series(np.nan, index=aux_error_idx, name='aux_error'),
-        'aux_error_mod': pd.Series(np.nan, index=idx, name='aux_error_mod')
+        'aux_error_mod': pd.Series(np.nan, index=idx, name='aux_error_mod'),
+        'timings': pd.Series(np.nan, index=armc._timer.index, name='timings')
     }
 
     for key, partial in armc.pes.items():
@@ -132,12 +161,18 @@ def create_hdf5(filename: Union[AnyStr, PathLike], armc: 'FOX.ARMC') -> None:
 
 @assert_error(H5PY_ERROR)
 def create_xyz_hdf5(filename: Union[AnyStr, PathLike],
-                    mol_list: Iterable['FOX.MultiMolecule'], iter_len: int) -> None:
+                    mol_list: Iterable['FOX.MultiMolecule'], iter_len: int,
+                    compression: Optional[str] = 'gzip',
+                    frame_chunk: Optional[int] = None) -> None:
     """Create the ``"xyz"`` datasets for :func:`create_hdf5` in the hdf5 file ``filename+".xyz"``.
 
     The ``"xyz"`` dataset is to contain Cartesian coordinates collected over the course of the
     current ARMC super-iteration.
 
+    Every chunk contains a block of frames belonging to a single ARMC sub-iteration
+    (see :func:`get_xyz_chunks`), so individual trajectories and frames can be read
+    without decompressing those of neighbouring sub-iterations (see :func:`mol_from_hdf5`).
+
     Parameters
     ----------
     filename : str
@@ -151,7 +186,21 @@ def create_xyz_hdf5(filename: Union[AnyStr, PathLike],
         The length of an ARMC sub-iterations.
         Determines how many MD trajectories can be stored in the .hdf5 file.
 
+    compression : :class:`str`, optional
+        The compression filter; accepted values are ``"gzip"``, ``"lzf"``, ``"blosc"`` and ``None``.
+        ``"lzf"`` is considerably faster than ``"gzip"`` at the cost of a lower compression ratio.
+        ``"blosc"`` requires the hdf5plugin_ package;
+        ``"lzf"`` is used as fallback if it is not installed.
+
+    frame_chunk : :class:`int`, optional
+        The number of frames per chunk.
+        If ``None``, determine the number of frames based on :data:`XYZ_CHUNK_SIZE`.
+
+    .. _hdf5plugin: https://github.com/silx-kit/hdf5plugin
+
     """
+    compression_kwargs = _get_compression_kwargs(compression)
+
     # Remove previous hdf5 xyz files
     filename_xyz = _get_filename_xyz(filename)
     if isfile(filename_xyz):
@@ -163,16 +212,78 @@ def create_xyz_hdf5(filename: Union[AnyStr, PathLike],
             key = f'xyz.{i}'
             f.create_dataset(
                 name=key,
-                compression='gzip',
                 shape=(iter_len, 0, mol.shape[1], 3),
                 dtype=np.dtype('float16'),
                 maxshape=(iter_len, None, mol.shape[1], 3),
-                fillvalue=np.nan
+                chunks=get_xyz_chunks(mol.shape[1], frame_chunk),
+                fillvalue=np.nan,
+                **compression_kwargs
             )
             f[key].attrs['atoms'] = mol.symbol.astype('S')
             f[key].attrs['bonds'] = mol.bonds
 
 
+def get_xyz_chunks(atom_count: int, frame_chunk: Optional[int] = None,
+                   itemsize: int = 2) -> Tuple[int, int, int, int]:
+    """Return the chunk shape of the ``"xyz"`` datasets created by :func:`create_xyz_hdf5`.
+
+    Chunks are of the shape :math:`(1, m, n, 3)`, consisting of :math:`m` frames
+    of a single ARMC sub-iteration with :math:`n` atoms each.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX.io.hdf5_utils import get_xyz_chunks
+
+        >>> get_xyz_chunks(atom_count=1000)
+        (1, 43, 1000, 3)
+
+        >>> get_xyz_chunks(atom_count=1000, frame_chunk=10)
+        (1, 10, 1000, 3)
+
+    Parameters
+    ----------
+    atom_count : int
+        The number of atoms, :math:`n`, per frame.
+
+    frame_chunk : int, optional
+        The number of frames, :math:`m`, per chunk.
+        If ``None``, determine the number of frames based on :data:`XYZ_CHUNK_SIZE`.
+
+    itemsize : int
+        The size of a single coordinate in bytes.
+
+    Returns
+    -------
+    |tuple|_ [|int|_]
+        The chunk shape.
+
+    """
+    atom_count = max(1, atom_count)
+    if frame_chunk is None:
+        frame_chunk = XYZ_CHUNK_SIZE // (3 * itemsize * atom_count)
+    return 1, max(1, int(frame_chunk)), atom_count, 3
+
+
+def _get_compression_kwargs(compression: Optional[str]) -> Dict[str, Any]:
+    """Return the compression-related keyword arguments for :meth:`h5py.Group.create_dataset`."""
+    if compression is None:
+        return {}
+    elif compression in {'gzip', 'lzf'}:
+        return {'compression': compression, 'shuffle': True}
+    elif compression != 'blosc':
+        raise ValueError(f"Invalid 'compression' value: {compression!r}")
+
+    if HDF5PLUGIN_EX is not None:
+        warning = ImportWarning("Blosc compression requires the 'hdf5plugin' package; "
+                                "falling back to lzf compression")
+        warning.__cause__ = HDF5PLUGIN_EX
+        warnings.warn(warning)
+        return {'compression': 'lzf', 'shuffle': True}
+    return dict(hdf5plugin.Blosc(cname='lz4', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+
+
 @assert_error(H5PY_ERROR)
 def index_to_hdf5(filename: Union[AnyStr, PathLike], pd_dict: Dict[str, NDFrame]) -> None:
     """Store the ``index`` and ``columns`` / ``name`` attributes of **pd_dict** in hdf5 format.
@@ -215,7 +326,7 @@ def index_to_hdf5(filename: Union[AnyStr, PathLike], pd_dict: Dict[str, NDFrame]
                 f[key].attrs.create(attr_name, i)
 
 
-def _get_kwarg_dict(armc: 'FOX.ARMC') -> Settings:
+def _get_kwarg_dict(armc: 'FOX.ARMC') -> 'Settings':
     """Create a Settings instance with keyword arguments for h5py.Group.create_dataset.
 
     .. _h5py.Group.create_dataset: http://docs.h5py.org/en/stable/high/group.html#Group.create_dataset  # noqa
@@ -249,8 +360,9 @@ def _get_kwarg_dict(armc: 'FOX.ARMC') -> Settings:
         A Settings instance with keyword arguments for h5py.Group.create_dataset_.
 
     """
-    shape = armc.iter_len // armc.sub_iter_len, armc.sub_iter_len
+    from scm.plams import Settings
 
+    shape = armc.iter_len // armc.sub_iter_len, armc.sub_iter_len
     ret = Settings()
     ret.phi.shape = (shape[0], )
     ret.phi.dtype = float
@@ -270,6 +382,10 @@ def _get_kwarg_dict(armc: 'FOX.ARMC') -> Settings:
     ret.aux_error_mod.dtype = float
     ret.aux_error_mod.fillvalue = np.nan
 
+    ret.timings.shape = shape + (len(armc._timer.index), )
+    ret.timings.dtype = float
+    ret.timings.fillvalue = np.nan
+
     for key, partial in armc.pes.items():
         ref = partial.ref
 
@@ -352,7 +468,7 @@ def to_hdf5(filename: Union[AnyStr, PathLike], dset_dict: Dict[str, np.ndarray],
     r"""Export results from **dset_dict** to the hdf5 file **filename**.
 
     All items in **dset_dict**, except ``"xyz"``, are exported to **filename**.
-    The float or :class:`MultiMolecule` instance stored under the ``"xyz"`` key are
+    The float or :class:`MultiMolecule` instance stored under the (optional) ``"xyz"`` key are
     exported to a seperate .hdf5 file (see :func:`._xyz_to_hdf5`).
 
     Parameters
@@ -394,8 +510,9 @@ def to_hdf5(filename: Union[AnyStr, PathLike], dset_dict: Dict[str, np.ndarray],
                 raise ex
 
     # Update the second hdf5 file with Cartesian coordinates
-    filename_xyz = _get_filename_xyz(filename)
-    _xyz_to_hdf5(filename_xyz, omega, dset_dict['xyz'])
+    if 'xyz' in dset_dict:
+        filename_xyz = _get_filename_xyz(filename)
+        _xyz_to_hdf5(filename_xyz, omega, dset_dict['xyz'])
 
 
 @assert_error(H5PY_ERROR)
@@ -434,11 +551,14 @@ def _xyz_to_hdf5(filename: Union[AnyStr, PathLike], omega: int,
                 dset[omega] = mol if mol is not None else np.nan
                 continue
 
-            if len(mol) <= dset.shape[1]:
-                dset[omega, 0:len(mol)] = mol
+            # Cast with NumPy; the float64 -> float16 conversion of HDF5 mishandles values
+            # which are rounded up to the next power of 2 (e.g. 31.999 -> 16.0)
+            xyz = np.asarray(mol, dtype=dset.dtype)
+            if len(xyz) <= dset.shape[1]:
+                dset[omega, 0:len(xyz)] = xyz
             else:  # Resize and try again
-                dset.resize(len(mol), axis=1)
-                dset[omega] = mol
+                dset.resize(len(xyz), axis=1)
+                dset[omega] = xyz
 
     return None
 
@@ -446,23 +566,64 @@ def _xyz_to_hdf5(filename: Union[AnyStr, PathLike], omega: int,
 """#################################### Reading .hdf5 files ####################################"""
 
 DataSets = Union[None, Hashable, Iterable[Hashable]]
+IterSlice = Union[None, int, slice]
+
+#: The (approximate) maximum size of a single block of data, in bytes,
+#: read by :meth:`LazyDataset.iter_chunks`.
+READ_CHUNK_SIZE: int = 2**26
 
 
 @assert_error(H5PY_ERROR)
-def from_hdf5(filename: Union[AnyStr, PathLike],
-              datasets: DataSets = None) -> Union[NDFrame, Dict[Hashable, NDFrame]]:
+def from_hdf5(filename: Union[AnyStr, PathLike], datasets: DataSets = None,
+              kappa: IterSlice = None, omega: IterSlice = None,
+              columns: Optional[Iterable[Hashable]] = None,
+              lazy: bool = False) -> Union[NDFrame, Dict[Hashable, NDFrame]]:
     """Retrieve all user-specified datasets from **name**.
 
     Values are returned in dictionary of DataFrames and/or Series.
+    Only the requested sub-set of ARMC iterations and columns is read from the .hdf5 file.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX import from_hdf5
+
+        >>> hdf5_file = str(...)
+
+        # Read the parameters of every 10th sub-iteration of the first 5 super-iterations
+        >>> param = from_hdf5(hdf5_file, 'param', kappa=slice(0, 5), omega=slice(None, None, 10))
+
+        # Create a lazy dataset; data is only read upon calling LazyDataset.read()
+        >>> rdf = from_hdf5(hdf5_file, 'rdf.0', lazy=True)
+        >>> rdf_list = rdf.read(kappa=0, omega=slice(0, 10))
 
     Parameters
     ----------
     filename : str
         The path+name of the hdf5 file.
+
     datasets : list [str]
         A list of to be retrieved dataset names.
         All datasets will be retrieved if ``None``.
 
+    kappa : int or slice, optional
+        The to-be retrieved super-iteration(s), :math:`\\kappa`.
+        Slices must have a positive step.
+
+    omega : int or slice, optional
+        The to-be retrieved sub-iteration(s), :math:`\\omega`.
+        Slices must have a positive step.
+        Ignored for the per super-iteration ``"phi"`` dataset.
+
+    columns : list, optional
+        The to-be retrieved columns, *e.g.* a set of parameters or atom pairs.
+        Ignored for datasets without columns.
+
+    lazy : bool
+        If ``True``, return one or more :class:`LazyDataset` instances instead
+        of reading the data.
+
     Returns
     -------
     |dict|_ [|str|_, (|pd.DataFrame|_ and/or |pd.Series|_)]:
@@ -470,12 +631,6 @@ def from_hdf5(filename: Union[AnyStr, PathLike],
 
     """
     with h5py.File(filename, 'r', libver='latest') as f:
-        # Retrieve all values up to and including the current iteration
-        kappa = f.attrs['super-iteration']
-        omega = f.attrs['sub-iteration']
-        omega_max = f['param'].shape[1]
-        i = kappa * omega_max + omega
-
         # Identify the to-be returned datasets
         if isinstance(datasets, str):
             datasets = (datasets, )
@@ -484,7 +639,10 @@ def from_hdf5(filename: Union[AnyStr, PathLike],
 
         # Retrieve the datasets
         try:
-            ret = {key: _get_dset(f, key)[:i+1] for key in datasets}
+            if lazy:
+                ret = {key: LazyDataset(filename, key, f) for key in datasets}
+            else:
+                ret = {key: _get_dset(f, key, kappa, omega, columns) for key in datasets}
         except KeyError as ex:
             err = "No dataset '{}' in '{}'. The following datasets are available: {}"
             arg = str(ex).split("'")[1], str(filename), list(f.keys())
@@ -497,8 +655,394 @@ def from_hdf5(filename: Union[AnyStr, PathLike],
     return ret
 
 
+class LazyDataset:
+    """A lazily-evaluated dataset in an ARMC .hdf5 file.
+
+    Data is only read upon calling :meth:`LazyDataset.read` or :meth:`LazyDataset.iter_chunks`,
+    the file is (re-)opened for each call.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX.io.hdf5_utils import LazyDataset
+
+        >>> hdf5_file = str(...)
+        >>> param = LazyDataset(hdf5_file, 'param')
+
+        >>> print(len(param))  # The number of completed ARMC iterations
+        1000
+
+        >>> df = param.read(kappa=slice(0, 2), columns=[('charge', 'Cd'), ('charge', 'Se')])
+
+        >>> for index, data in param.iter_chunks():
+        ...     ...
+
+    Attributes
+    ----------
+    filename : :class:`str`
+        The path+name of the hdf5 file.
+
+    key : :class:`str`
+        The name of the dataset.
+
+    shape : :class:`tuple` [:class:`int`]
+        The shape of the dataset.
+
+    dtype : :class:`numpy.dtype`
+        The data type of the dataset.
+
+    """
+
+    def __init__(self, filename: Union[AnyStr, PathLike], key: str,
+                 file: Optional[H5pyFile] = None) -> None:
+        """Initialize a new instance; an already opened hdf5 **file** can optionally be passed."""
+        self.filename = filename
+        self.key = key
+        if file is None:
+            with h5py.File(filename, 'r', libver='latest') as f:
+                self._set_attr(f)
+        else:
+            self._set_attr(file)
+
+    def _set_attr(self, f: H5pyFile) -> None:
+        dset = f[self.key]
+        self.shape: Tuple[int, ...] = dset.shape
+        self.dtype: np.dtype = dset.dtype
+        self._len = len(_get_iter_index(f, self.key)[-1])
+
+    def __repr__(self) -> str:
+        """Return a string representation of this instance."""
+        return (f'{self.__class__.__name__}(filename={self.filename!r}, key={self.key!r}, '
+                f'shape={self.shape!r}, dtype={self.dtype!r})')
+
+    def __len__(self) -> int:
+        """Return the number of completed ARMC iterations in this dataset."""
+        return self._len
+
+    @assert_error(H5PY_ERROR)
+    def read(self, kappa: IterSlice = None, omega: IterSlice = None,
+             columns: Optional[Iterable[Hashable]] = None) -> Union[NDFrame, List[pd.DataFrame]]:
+        """Read and return the dataset; see :func:`from_hdf5` for a description of all parameters."""  # noqa
+        with h5py.File(self.filename, 'r', libver='latest') as f:
+            return _get_dset(f, self.key, kappa, omega, columns)
+
+    @assert_error(H5PY_ERROR)
+    def iter_chunks(self, chunksize: Optional[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:  # noqa
+        """Iterate over the completed ARMC iterations in blocks of super-iterations.
+
+        Yields the flat ARMC iteration indices (:math:`\\kappa \\omega_{max} + \\omega`)
+        and the matching block of raw data;
+        the first axis of the latter corresponds to the ARMC iteration.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            The number of super-iterations per block.
+            If ``None``, determine the number of super-iterations based on :data:`READ_CHUNK_SIZE`.
+
+        Yields
+        ------
+        |np.ndarray|_ [|np.int64|_] and |np.ndarray|_
+            The flat ARMC iteration indices and the matching data.
+
+        """
+        with h5py.File(self.filename, 'r', libver='latest') as f:
+            dset = f[self.key]
+            k_slice, *_ = _get_iter_index(f, self.key)
+            if self.key.endswith('.ref'):
+                data, index = _read_dset(f, self.key)
+                yield index, data
+                return
+
+            row_size = dset.dtype.itemsize * int(np.prod(dset.shape[1:], dtype=int))
+            if chunksize is None:
+                chunksize = READ_CHUNK_SIZE // max(1, row_size)
+            chunksize = max(1, int(chunksize))
+
+            start, stop, step = k_slice.start, k_slice.stop, k_slice.step
+            for i in range(start, stop, chunksize * step):
+                kappa = slice(i, min(i + chunksize * step, stop), step)
+                data, index = _read_dset(f, self.key, kappa)
+                yield index, data
+
+    @assert_error(H5PY_ERROR)
+    def iter_frames(self, kappa: Optional[slice] = None,
+                    columns: Optional[Iterable[Hashable]] = None,
+                    chunksize: Optional[int] = None) -> Iterator[NDFrame]:
+        """Iterate over the completed ARMC iterations in labeled blocks of super-iterations.
+
+        The blocks are of the same type as the data returned by :meth:`LazyDataset.read`.
+
+        Parameters
+        ----------
+        kappa : slice, optional
+            The to-be retrieved super-iterations, :math:`\\kappa`; see :func:`from_hdf5`.
+
+        columns : list, optional
+            The to-be retrieved columns, *e.g.* a set of parameters or atom pairs.
+
+        chunksize : int, optional
+            The number of super-iterations per block.
+            If ``None``, determine the number of super-iterations based on :data:`READ_CHUNK_SIZE`.
+
+        Yields
+        ------
+        |pd.DataFrame|_, |pd.Series|_ or |list|_ [|pd.DataFrame|_]
+            A block of (labeled) data.
+            A single empty block is yielded if no super-iterations are selected.
+
+        """
+        with h5py.File(self.filename, 'r', libver='latest') as f:
+            dset = f[self.key]
+            if self.key == 'phi' or self.key.endswith('.ref'):
+                yield _get_dset(f, self.key, kappa, columns=columns)
+                return
+
+            row_size = dset.dtype.itemsize * int(np.prod(dset.shape[1:], dtype=int))
+            if chunksize is None:
+                chunksize = READ_CHUNK_SIZE // max(1, row_size)
+            chunksize = max(1, int(chunksize))
+
+            k_slice, *_ = _get_iter_index(f, self.key, kappa)
+            start, stop, step = k_slice.start, k_slice.stop, k_slice.step
+            if start >= stop:  # Yield a single empty (but labeled) block
+                yield _get_dset(f, self.key, k_slice, columns=columns)
+                return
+
+            for i in range(start, stop, chunksize * step):
+                kappa_ = slice(i, min(i + chunksize * step, stop), step)
+                yield _get_dset(f, self.key, kappa_, columns=columns)
+
+
+class IncrementalDataset(LazyDataset):
+    """A :class:`LazyDataset` which incrementally reads the ARMC iterations of its dataset.
+
+    Every call to :meth:`IncrementalDataset.update` only reads the ARMC iterations
+    completed since the previous call, appending them to :attr:`IncrementalDataset.data`.
+    The last previously read iteration is always re-read,
+    as :func:`to_hdf5` might not have finished writing it.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX.io.hdf5_utils import IncrementalDataset
+
+        >>> hdf5_file = str(...)
+        >>> param = IncrementalDataset(hdf5_file, 'param')
+
+        >>> param.update()  # Read all currently completed ARMC iterations
+        True
+        >>> param.update()  # Nothing has changed since the previous call
+        False
+        >>> df = param.data
+
+    Attributes
+    ----------
+    columns : :class:`list`, optional
+        The to-be retrieved columns; see :func:`from_hdf5`.
+
+    data : :class:`pandas.DataFrame`, :class:`pandas.Series` or :class:`list` [:class:`pandas.DataFrame`], optional
+        All ARMC iterations read thus far; ``None`` if :meth:`IncrementalDataset.update`
+        has not yet been called.
+
+    index : :class:`numpy.ndarray` [:class:`int`]
+        The flat ARMC iteration indices (:math:`\\kappa \\omega_{max} + \\omega`)
+        of all iterations in :attr:`IncrementalDataset.data`.
+
+    """  # noqa: E501
+
+    def __init__(self, filename: Union[AnyStr, PathLike], key: str,
+                 file: Optional[H5pyFile] = None,
+                 columns: Optional[Iterable[Hashable]] = None) -> None:
+        """Initialize a new instance; an already opened hdf5 **file** can optionally be passed."""
+        super().__init__(filename, key, file)
+        self.columns = columns
+        self.data: Union[None, NDFrame, List[pd.DataFrame]] = None
+        self.index: np.ndarray = np.zeros(0, dtype=int)
+
+    @assert_error(H5PY_ERROR)
+    def update(self) -> bool:
+        """Read all ARMC iterations completed since the previous call.
+
+        Returns ``True`` if new iterations have been read and ``False`` otherwise.
+
+        """
+        with h5py.File(self.filename, 'r', libver='latest') as f:
+            self._set_attr(f)
+            index = _get_iter_index(f, self.key)[-1]
+            if self.data is not None and np.array_equal(index[-1:], self.index[-1:]):
+                return False
+
+            # These datasets are either constant or tiny; simply read them in their entirety
+            if self.key == 'phi' or self.key.endswith('.ref'):
+                self.data = _get_dset(f, self.key, columns=self.columns)
+                self.index = index
+                return True
+
+            start = self.index[-1] if len(self.index) else 0
+            kappa = slice(start // f['param'].shape[1], None)
+            new_index = _get_iter_index(f, self.key, kappa)[-1]
+            new_data = _get_dset(f, self.key, kappa, columns=self.columns)
+
+        keep = self.index < start
+        is_new = new_index >= start
+        if isinstance(new_data, list):
+            old_data = self.data or []
+            self.data = [df for df, i in zip(old_data, keep) if i]
+            self.data += [df for df, i in zip(new_data, is_new) if i]
+        elif self.data is None:
+            self.data = new_data.iloc[is_new]
+        else:
+            self.data = pd.concat([self.data.iloc[keep], new_data.iloc[is_new]])
+
+        self.index = np.concatenate([self.index[keep], new_index[is_new]])
+        return True
+
+
+@assert_error(H5PY_ERROR)
+def iter_hdf5_updates(filename: Union[AnyStr, PathLike],
+                      interval: float = 5.0) -> Iterator[Tuple[int, int]]:
+    r"""Poll the ARMC .hdf5 file **filename** and yield its latest iteration whenever it changes.
+
+    Yields the super- and sub-iteration, :math:`\kappa` and :math:`\omega`,
+    of the last iteration written by :func:`to_hdf5`, the first iteration being yielded
+    immediately.
+    The generator is exhausted once the final ARMC iteration has been written.
+    Polls wherein **filename** is unavailable (*e.g.* because it is opened by :func:`to_hdf5`)
+    are skipped.
+
+    Parameters
+    ----------
+    filename : str
+        The path+name of the hdf5 file.
+
+    interval : float
+        The time, in seconds, between subsequent polls.
+
+    Yields
+    ------
+    |int|_ and |int|_
+        The super- and sub-iteration of the last ARMC iteration.
+
+    """
+    last = None
+    while True:
+        try:
+            with h5py.File(filename, 'r', libver='latest') as f:
+                kappa_max, omega_max = f['param'].shape[:2]
+                kappa, omega = f.attrs['super-iteration'], f.attrs['sub-iteration']
+        except OSError:  # The .hdf5 file is currently opened by another process
+            sleep(interval)
+            continue
+
+        if (kappa, omega) != last:
+            last = kappa, omega
+            yield last
+        if kappa + 1 >= kappa_max and omega + 1 >= omega_max:
+            return None
+        sleep(interval)
+
+
+def _iter_slice(value: IterSlice, length: int, stop: Optional[int] = None) -> slice:
+    """Convert **value** into a slice with a positive step; **stop** is an optional upper bound."""
+    if value is None:
+        value = slice(None)
+    elif not isinstance(value, slice):
+        i = operator.index(value)
+        i_ = i + length if i < 0 else i
+        if not 0 <= i_ < length:
+            raise IndexError(f'index {i} is out of bounds for axis with size {length}')
+        value = slice(i_, i_ + 1)
+
+    start, stop_, step = value.indices(length)
+    if step < 1:
+        raise ValueError(f'slice step must be positive; observed value: {step}')
+    if stop is not None:
+        stop_ = min(stop_, max(stop, 0))
+    return slice(start, max(start, stop_), step)
+
+
+def _get_iter_index(f: H5pyFile, key: Hashable, kappa: IterSlice = None,
+                    omega: IterSlice = None) -> Tuple[slice, slice, np.ndarray]:
+    """Return the super- and sub-iteration slices and flat ARMC iteration indices of **key**.
+
+    Only completed ARMC iterations are included.
+    Datasets which do not depend on the ARMC iteration (*e.g.* ``"rdf.0.ref"``)
+    are treated as a single iteration.
+
+    """
+    dset = f[key]
+    omega_max = f['param'].shape[1]
+    kappa_cur = f.attrs['super-iteration']
+    i = kappa_cur * omega_max + f.attrs['sub-iteration']
+
+    if key.endswith('.ref'):
+        return slice(None), slice(None), np.zeros(1, dtype=int)
+
+    elif key == 'phi':
+        k_slice = _iter_slice(kappa, len(dset), i + 1)
+        return k_slice, slice(None), np.arange(len(dset))[k_slice]
+
+    kappa_max, omega_max = dset.shape[:2]
+    k_slice = _iter_slice(kappa, kappa_max, kappa_cur + 1)
+    o_slice = _iter_slice(omega, omega_max)
+    index = np.arange(kappa_max * omega_max).reshape(kappa_max, omega_max)[k_slice, o_slice]
+    index = index.ravel()
+    return k_slice, o_slice, index[index <= i]
+
+
+def _get_column_idx(labels: pd.Index, columns: Optional[Iterable[Hashable]],
+                    ncols: int) -> Optional[np.ndarray]:
+    """Return the (sorted) indices of **columns** in **labels** or ``None`` if not applicable."""
+    if columns is None or len(labels) != ncols:
+        return None
+
+    if isinstance(labels, pd.MultiIndex):
+        columns = [tuple(i) if not isinstance(i, str) else i for i in columns]
+    else:
+        columns = list(columns)
+    idx = labels.get_indexer(columns)
+    if (idx == -1).any():
+        missing = [i for i, j in zip(columns, idx) if j == -1]
+        raise KeyError(f'{missing!r} not in the available columns')
+    return np.unique(idx)
+
+
+@assert_error(H5PY_ERROR)
+def _read_dset(f: H5pyFile, key: Hashable, kappa: IterSlice = None, omega: IterSlice = None,
+               col_idx: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Read (a subset of) the dataset **key** from **f**.
+
+    Returns the data, with its super- and sub-iteration axes flattened into a single axis,
+    and the matching flat ARMC iteration indices (see :func:`_get_iter_index`).
+    Columns are selected along the last axis of the dataset using **col_idx**.
+
+    """
+    dset = f[key]
+    k_slice, o_slice, index = _get_iter_index(f, key, kappa, omega)
+    col = (Ellipsis, col_idx) if col_idx is not None else ()
+
+    if key.endswith('.ref'):
+        return dset[col] if col else dset[()], index
+    elif key == 'phi':
+        return dset[k_slice], index
+    elif k_slice.start == k_slice.stop or o_slice.start == o_slice.stop:
+        shape = (0,) + dset.shape[2:]
+        if col_idx is not None:
+            shape = shape[:-1] + (len(col_idx),)
+        return np.empty(shape, dtype=dset.dtype), index
+
+    data = dset[(k_slice, o_slice) + col]
+    data.shape = (-1,) + data.shape[2:]
+    return data[:len(index)], index
+
+
 @assert_error(H5PY_ERROR)
-def _get_dset(f: H5pyFile, key: Hashable) -> Union[pd.Series, pd.DataFrame, List[pd.DataFrame]]:
+def _get_dset(f: H5pyFile, key: Hashable, kappa: IterSlice = None, omega: IterSlice = None,
+              columns: Optional[Iterable[Hashable]] = None
+              ) -> Union[pd.Series, pd.DataFrame, List[pd.DataFrame]]:
     """Take a h5py dataset and convert it into either a Series or DataFrame.
 
     See :func:`FOX.dset_to_df` and :func:`FOX.dset_to_series` for more details.
@@ -511,6 +1055,9 @@ def _get_dset(f: H5pyFile, key: Hashable) -> Union[pd.Series, pd.DataFrame, List
     key : str
         The dataset name.
 
+    kappa, omega, columns
+        See :func:`from_hdf5`.
+
     Returns
     -------
     |pd.DataFrame|_, |pd.Series|_ or |np.ndarray|_:
@@ -518,25 +1065,25 @@ def _get_dset(f: H5pyFile, key: Hashable) -> Union[pd.Series, pd.DataFrame, List
 
     """
     if key == 'phi':
-        return dset_to_series(f, key).T
+        return dset_to_series(f, key, kappa).T
 
     if key == 'aux_error':
-        return _aux_err_to_df(f, key)
+        return _aux_err_to_df(f, key, kappa, omega, columns)
 
     elif 'columns' in f[key].attrs.keys():
-        return dset_to_df(f, key)
+        return dset_to_df(f, key, kappa, omega, columns)
 
     elif 'name' in f[key].attrs.keys():
-        return dset_to_series(f, key)
+        return dset_to_series(f, key, kappa, omega, columns)
 
     elif f[key].ndim == 2:
-        return pd.Series(f[key][:].flatten(), name=key)
+        data, index = _read_dset(f, key, kappa, omega)
+        return pd.Series(data, index=index, name=key)
 
     elif f[key].ndim == 3:
-        data = f[key][:]
-        data.shape = np.product(data.shape[:-1]), -1
-        columns = pd.MultiIndex.from_product([[key], np.arange(data.shape[-1])])
-        return pd.DataFrame(data, columns=columns)
+        data, index = _read_dset(f, key, kappa, omega)
+        columns_ = pd.MultiIndex.from_product([[key], np.arange(data.shape[-1])])
+        return pd.DataFrame(data, index=index, columns=columns_)
 
     raise ValueError(key, f[key].ndim)
 
@@ -645,7 +1192,9 @@ def _attr_to_array(index: Union[str, pd.Index]) -> np.ndarray:
 
 
 @assert_error(H5PY_ERROR)
-def dset_to_series(f: H5pyFile, key: Hashable) -> Union[pd.Series, pd.DataFrame]:
+def dset_to_series(f: H5pyFile, key: Hashable, kappa: IterSlice = None, omega: IterSlice = None,
+                   columns: Optional[Iterable[Hashable]] = None
+                   ) -> Union[pd.Series, pd.DataFrame]:
     """Take a h5py dataset and convert it into a Pandas Series (if 1D) or Pandas DataFrame (if 2D).
 
     Parameters
@@ -656,6 +1205,9 @@ def dset_to_series(f: H5pyFile, key: Hashable) -> Union[pd.Series, pd.DataFrame]
     key : str
         The dataset name.
 
+    kappa, omega, columns
+        See :func:`from_hdf5`.
+
     Returns
     -------
     |pd.Series|_ or |pd.DataFrame|_:
@@ -663,26 +1215,33 @@ def dset_to_series(f: H5pyFile, key: Hashable) -> Union[pd.Series, pd.DataFrame]
 
     """
     name = f[key].attrs['name'][0].decode()
-    index = array_to_index(f[key].attrs['index'][:])
-    data = f[key][:]
-    data.shape = np.product(data.shape[:-1], dtype=int), -1
+    labels = array_to_index(f[key].attrs['index'][:])
+    if key == 'phi':  # A 1D dataset with a single value per super-iteration
+        data, index = _read_dset(f, key, kappa)
+        return pd.DataFrame(data[None, :], index=pd.Index([0], name=name),
+                            columns=labels[index])
 
-    # Return a Series or DataFrame
-    if data.ndim == 1:
-        return pd.Series(f[key][:], index=index, name=name)
-    else:
-        columns = index
-        index = pd.Index(np.arange(data.shape[0]), name=name)
-        df = pd.DataFrame(data, index=index, columns=columns)
-        if key == 'aux_error_mod':
-            df.set_index(list(df.columns[0:-1]), inplace=True)
-            df.columns = pd.Index(['phi'])
-            return df['phi']
-        return df
+    col_idx = None
+    if key != 'aux_error_mod':
+        col_idx = _get_column_idx(labels, columns, f[key].shape[-1])
+        if col_idx is not None:
+            labels = labels[col_idx]
+
+    data, index = _read_dset(f, key, kappa, omega, col_idx)
+    data.shape = len(index), int(np.prod(data.shape[1:], dtype=int))
+
+    df = pd.DataFrame(data, index=pd.Index(index, name=name), columns=labels)
+    if key == 'aux_error_mod':
+        df.set_index(list(df.columns[0:-1]), inplace=True)
+        df.columns = pd.Index(['phi'])
+        return df['phi']
+    return df
 
 
 @assert_error(H5PY_ERROR)
-def dset_to_df(f: H5pyFile, key: Hashable) -> Union[pd.DataFrame, List[pd.DataFrame]]:
+def dset_to_df(f: H5pyFile, key: Hashable, kappa: IterSlice = None, omega: IterSlice = None,
+               columns: Optional[Iterable[Hashable]] = None
+               ) -> Union[pd.DataFrame, List[pd.DataFrame]]:
     """Take a h5py dataset and create a DataFrame (if 2D) or list of DataFrames (if 3D).
 
     Parameters
@@ -693,26 +1252,30 @@ def dset_to_df(f: H5pyFile, key: Hashable) -> Union[pd.DataFrame, List[pd.DataFr
     key : str
         The dataset name.
 
+    kappa, omega, columns
+        See :func:`from_hdf5`.
+
     Returns
     -------
     |pd.DataFrame|_ or |list|_ [|pd.DataFrame|_]:
         A Pandas DataFrame retrieved from **key** in **f**.
 
     """
-    columns = array_to_index(f[key].attrs['columns'][:])
+    labels = array_to_index(f[key].attrs['columns'][:])
     index = array_to_index(f[key].attrs['index'][:])
-    data = f[key][:]
-    data.shape = np.product(data.shape[:-2], dtype=int), data.shape[-2], -1
 
-    # Return a DataFrame or list of DataFrames
-    if data.ndim == 2:
-        return pd.DataFrame(data, index=index, columns=columns)
-    else:
-        return [pd.DataFrame(i, index=index, columns=columns) for i in data]
+    col_idx = _get_column_idx(labels, columns, f[key].shape[-1])
+    if col_idx is not None:
+        labels = labels[col_idx]
+
+    data, iter_index = _read_dset(f, key, kappa, omega, col_idx)
+    data.shape = len(iter_index), len(index), len(labels)
+    return [pd.DataFrame(i, index=index, columns=labels) for i in data]
 
 
 @assert_error(H5PY_ERROR)
-def _aux_err_to_df(f: H5pyFile, key: Hashable) -> Union[pd.DataFrame, List[pd.DataFrame]]:
+def _aux_err_to_df(f: H5pyFile, key: Hashable, kappa: IterSlice = None, omega: IterSlice = None,
+                   columns: Optional[Iterable[Hashable]] = None) -> pd.DataFrame:
     """Take a h5py dataset and create a DataFrame (if 2D) or list of DataFrames (if 3D).
 
     Parameters
@@ -723,18 +1286,23 @@ def _aux_err_to_df(f: H5pyFile, key: Hashable) -> Union[pd.DataFrame, List[pd.Da
     key : str
         The dataset name.
 
+    kappa, omega, columns
+        See :func:`from_hdf5`.
+
     Returns
     -------
     |pd.DataFrame|_ or |list|_ [|pd.DataFrame|_]:
         A Pandas DataFrame retrieved from **key** in **f**.
 
     """
-    columns = array_to_index(f[key].attrs['index'][:])
-    data = f[key][:]
-    data.shape = np.product(data.shape[:-2], dtype=int), -1
+    labels = array_to_index(f[key].attrs['index'][:])
+    data, index = _read_dset(f, key, kappa, omega)
+    data.shape = len(index), int(np.prod(data.shape[1:], dtype=int))
 
-    ret = pd.DataFrame(data, columns=columns)
+    ret = pd.DataFrame(data, index=index, columns=labels)
     ret.index.name = f[key].attrs['name'][0].decode()
+    if columns is not None:
+        return ret[list(columns)]
     return ret
 
 
@@ -742,10 +1310,25 @@ Tuple3 = Tuple[np.ndarray, Dict[str, List[int]], np.ndarray]
 
 
 @assert_error(H5PY_ERROR)
-def mol_from_hdf5(filename: Union[AnyStr, PathLike], i: int = -1, j: int = 0) -> Tuple3:
+def mol_from_hdf5(filename: Union[AnyStr, PathLike], i: int = -1, j: int = 0,
+                  mol_subset: Union[None, int, slice] = None) -> Tuple3:
     """Read a single dataset from a (multi) .xyz.hdf5 file.
 
     Returns values for the :class:`MultiMolecule` ``coords``, ``atoms`` and ``bonds`` parameters.
+    Only the chunks containing the requested frames are read and decompressed.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX import MultiMolecule
+        >>> from FOX.io.hdf5_utils import mol_from_hdf5
+
+        >>> filename = str(...)
+
+        # Read the last 10 frames of the 5th sub-iteration
+        >>> coords, atoms, bonds = mol_from_hdf5(filename, i=5, mol_subset=slice(-10, None))
+        >>> mol = MultiMolecule(coords, atoms, bonds)
 
     Parameters
     ----------
@@ -759,6 +1342,10 @@ def mol_from_hdf5(filename: Union[AnyStr, PathLike], i: int = -1, j: int = 0) ->
         The index of the to-be returned dataset.
         For example: :code:`j=0`is equivalent to the :code:`'xyz.0'` dataset.
 
+    mol_subset : :class:`int` or :class:`slice`, optional
+        The to-be returned frames of the trajectory.
+        All frames are returned if ``None``.
+
     Returns
     -------
     :class:`numpy.ndarray`, :class:`dict` [:class:`str`, :class:`list` [:class:`int`]] and :class:`numpy.ndarray`.
@@ -767,10 +1354,15 @@ def mol_from_hdf5(filename: Union[AnyStr, PathLike], i: int = -1, j: int = 0) ->
         * A 2D array of bonds and bond-orders.
 
     """  # noqa
+    if mol_subset is None:
+        mol_subset = slice(None)
+    elif not isinstance(mol_subset, slice):
+        mol_subset = slice(mol_subset, (mol_subset + 1) or None)
+
     with h5py.File(filename, 'r', libver='latest') as f:
         dset = f[f'xyz.{j}']
         return (
-            dset[i],
+            dset[i, mol_subset],
             group_by_values(enumerate(dset.attrs['atoms'].astype(str).tolist())),
             dset.attrs['bonds']
         )
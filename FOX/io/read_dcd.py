@@ -0,0 +1,174 @@
+"""
+FOX.io.read_dcd
+===============
+
+A module for reading binary CHARMM/CP2K .dcd trajectories.
+
+Index
+-----
+.. currentmodule:: FOX.io.read_dcd
+.. autosummary::
+    DCDError
+    read_dcd
+    get_dcd_dtype
+
+API
+---
+.. autoexception:: FOX.io.read_dcd.DCDError
+.. autofunction:: FOX.io.read_dcd.read_dcd
+.. autofunction:: FOX.io.read_dcd.get_dcd_dtype
+
+"""
+
+import os
+from typing import Tuple, Union, AnyStr, Sequence, Optional
+
+import numpy as np
+
+__all__ = ['read_dcd']
+
+MolSubset = Union[None, slice, int, Sequence[int]]
+
+
+class DCDError(OSError):
+    """Raise when there are issues related to parsing .dcd files."""
+
+
+def read_dcd(filename: Union[AnyStr, os.PathLike], mol_subset: MolSubset = None) -> np.ndarray:
+    """Read a (multi-frame) .dcd file and return its cartesian coordinates.
+
+    The file is memory-mapped as an array of fixed-size frames (see :func:`get_dcd_dtype`);
+    only the frames specified in **mol_subset** are read from the disk.
+    Incomplete frames at the end of the file,
+    *e.g.* produced by a simulation which is still running, are ignored.
+
+    Note that .dcd files contain neither atomic symbols nor bonds.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from FOX.io.read_dcd import read_dcd
+
+        >>> filename = str(...)
+        >>> xyz = read_dcd(filename, mol_subset=slice(0, None, 10))
+
+    Parameters
+    ----------
+    filename : str
+        The path+filename of the .dcd file.
+
+    mol_subset : slice, int or sequence [int], optional
+        The indices of the to-be read frames.
+        Set to ``None`` to read all frames.
+
+    Returns
+    -------
+    :math:`m*n*3` |np.ndarray|_ [|np.float64|_]:
+        A 3D array with the cartesian coordinates of :math:`m` molecules
+        consisting of :math:`n` atoms.
+
+    Raises
+    ------
+    DCDError
+        Raised if **filename** is not a (supported) .dcd file.
+
+    """
+    dtype, offset = get_dcd_dtype(filename)
+    atom_count = dtype['x'].shape[0]
+
+    frame_count = (os.path.getsize(filename) - offset) // dtype.itemsize
+    if frame_count <= 0:
+        return np.zeros((0, atom_count, 3), dtype=float)
+
+    frames = np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(frame_count,))
+    if isinstance(mol_subset, (int, np.integer)):
+        mol_subset = [mol_subset]
+    elif mol_subset is None:
+        mol_subset = slice(None)
+
+    frames = frames[mol_subset]
+    marker = 4 * atom_count
+    for i in ('x', 'y', 'z'):
+        if (frames[f'{i}_head'] != marker).any() or (frames[f'{i}_tail'] != marker).any():
+            raise DCDError(f"Corrupted {i}-coordinate record in '{os.fsdecode(filename)}'")
+
+    ret = np.empty((len(frames), atom_count, 3), dtype=float)
+    ret[..., 0] = frames['x']
+    ret[..., 1] = frames['y']
+    ret[..., 2] = frames['z']
+    return ret
+
+
+def get_dcd_dtype(filename: Union[AnyStr, os.PathLike]) -> Tuple[np.dtype, int]:
+    """Parse the header of a .dcd file.
+
+    Returns a structured dtype describing a single trajectory frame and
+    the size of the header in bytes (*i.e.* the offset of the first frame).
+
+    Every Fortran record is enclosed by two 4-byte markers containing the record size.
+    The fields of the dtype are named after the records they represent:
+    ``"cell"`` (only if the file contains unit cell information),
+    ``"x"``, ``"y"``, ``"z"`` and ``"w"`` (only if the file contains a 4th dimension).
+    The record markers are stored in the ``"<name>_head"`` and ``"<name>_tail"`` fields.
+
+    Parameters
+    ----------
+    filename : str
+        The path+filename of the .dcd file.
+
+    Returns
+    -------
+    |np.dtype|_ and |int|_:
+        A structured dtype describing a single frame and
+        the size of the .dcd header in bytes.
+
+    Raises
+    ------
+    DCDError
+        Raised if **filename** is not a (supported) .dcd file.
+
+    """
+    with open(filename, 'rb') as f:
+        header = f.read(92)
+        if len(header) != 92:
+            raise DCDError(f"'{os.fsdecode(filename)}' is not a valid .dcd file")
+
+        # Determine the endianness based on the size of the first record
+        for endian in ('<', '>'):
+            if np.frombuffer(header, dtype=f'{endian}i4', count=1)[0] == 84:
+                break
+        else:
+            raise DCDError(f"'{os.fsdecode(filename)}' is not a valid .dcd file")
+
+        i4 = f'{endian}i4'
+        if header[4:8] != b'CORD':
+            raise DCDError(f"'{os.fsdecode(filename)}' is not a coordinate .dcd file")
+        icntrl = np.frombuffer(header, dtype=i4, count=20, offset=8)
+
+        # The title record
+        title_size = np.frombuffer(f.read(4), dtype=i4)[0]
+        f.seek(title_size + 4, os.SEEK_CUR)
+
+        # The atom count record
+        natom_record = np.frombuffer(f.read(12), dtype=i4)
+        if len(natom_record) != 3 or natom_record[0] != 4:
+            raise DCDError(f"Failed to parse the atom count of '{os.fsdecode(filename)}'")
+        atom_count = int(natom_record[1])
+        offset = f.tell()
+
+    # Files containing fixed atoms have a first frame with a different layout
+    if icntrl[8] != 0:
+        raise DCDError(f"'{os.fsdecode(filename)}' contains fixed atoms, "
+                       "which are currently not supported")
+
+    # CHARMM-specific extensions; only relevant if a CHARMM version is specified
+    has_cell = bool(icntrl[19] and icntrl[10])
+    has_4dim = bool(icntrl[19] and icntrl[11])
+
+    fields = []
+    if has_cell:
+        fields += [('cell_head', i4), ('cell', f'{endian}f8', (6,)), ('cell_tail', i4)]
+    for name in ('x', 'y', 'z', 'w')[:3 + has_4dim]:
+        fields += [(f'{name}_head', i4), (name, f'{endian}f4', (atom_count,)), (f'{name}_tail', i4)]
+    return np.dtype(fields), offset
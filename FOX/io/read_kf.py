@@ -58,19 +58,91 @@ def read_kf(filename: str) -> Tuple[np.ndarray, Dict[str, List[int]]]:
     atom_count = kf.read('Molecule', 'nAtoms')
     mol_count = kf.read('History', 'nEntries')
 
-    # Create an empty m*(n*3) xyz array
-    shape = mol_count, atom_count, 3
-    count = mol_count * atom_count * 3
-
-    # Fill the xyz array with cartesian coordinates
-    mol_range = range(1, 1+mol_count)
-    iterator = chain.from_iterable(kf.read('History', f'Coords({i})') for i in mol_range)
-    xyz = np.fromiter(iterator, dtype=float, count=count)
-    xyz.shape = shape
+    try:
+        xyz = _read_coords(kf, mol_count, atom_count)
+    except (AttributeError, KeyError, ValueError, TypeError, IndexError):
+        # Fall back to the (slower) public API; _read_coords() relies on PLAMS internals
+        mol_range = range(1, 1+mol_count)
+        iterator = chain.from_iterable(kf.read('History', f'Coords({i})') for i in mol_range)
+        xyz = np.fromiter(iterator, dtype=float, count=mol_count * atom_count * 3)
+    xyz.shape = mol_count, atom_count, 3
 
     return xyz, _get_idx_dict(kf)
 
 
+def _read_coords(kf: KFReader, mol_count: int, atom_count: int) -> np.ndarray:
+    """Read all ``"History%Coords(i)"`` variables from **kf** into a single array.
+
+    Contrary to :meth:`KFReader.read<scm.plams.tools.kftools.KFReader.read>`,
+    which opens and parses the KF file once per variable, the file is herein opened only once
+    and every data block is converted into an array of floats with a single NumPy call.
+
+    Parameters
+    ----------
+    kf : |plams.KFReader|_
+        A KFReader instance constructed from a KF binary file.
+
+    mol_count : int
+        The number of molecules (*i.e.* ``"History%nEntries"``).
+
+    atom_count : int
+        The number of atoms per molecule.
+
+    Returns
+    -------
+    :math:`m*n*3` |np.ndarray|_ [|np.float64|_]:
+        A flattened array with cartesian coordinates.
+
+    """
+    if kf._sections is None:
+        kf._create_index()
+    variables = kf._sections['History']
+    section_data = kf._data['History']
+
+    word_size = kf._sizes[kf.word]
+    int_type = np.dtype(kf.endian + kf.word)
+    float_type = np.dtype(kf.endian + 'f8')
+    header_size = 4 * word_size
+
+    def get_floats(f, block: int) -> np.ndarray:
+        """Return all floats stored in the data **block**."""
+        data = kf._read_block(f, block)
+        int_count, float_count = np.frombuffer(data, dtype=int_type, count=2)
+        offset = header_size + int(int_count) * word_size
+        return np.frombuffer(data, dtype=float_type, count=float_count, offset=offset)
+
+    stride = 3 * atom_count
+    ret = np.empty(mol_count * stride, dtype=float)
+    block_cache: Dict[int, np.ndarray] = {}
+
+    with open(kf.path, 'rb') as f:
+        for i in range(mol_count):
+            vtype, vlb, vstart, vlen = variables[f'Coords({i + 1})']
+            if vtype != 2 or vlen != stride:
+                raise ValueError(f'Invalid type or size of "History%Coords({i + 1})"')
+
+            j = i * stride
+            j_end = j + stride
+            start = vstart - 1
+            for block in KFReader._datablocks(section_data, vlb):
+                try:
+                    floats = block_cache[block]
+                except KeyError:
+                    # Consecutive variables share at most one data block; keep just the last one
+                    block_cache.clear()
+                    floats = block_cache[block] = get_floats(f, block)
+
+                chunk = floats[start:start + j_end - j]
+                ret[j:j + len(chunk)] = chunk
+                j += len(chunk)
+                start = 0
+                if j >= j_end:
+                    break
+            if j < j_end:
+                raise ValueError(f'Insufficient data blocks for "History%Coords({i + 1})"')
+    return ret
+
+
 def _get_idx_dict(kf: KFReader) -> Dict[str, List[int]]:
     """Extract atomic symbols and matching atomic indices from **kf**.
 
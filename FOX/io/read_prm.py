@@ -13,6 +13,8 @@ Index
     PRMContainer.write
     PRMContainer.overlay_mapping
     PRMContainer.overlay_cp2k_settings
+    PRMContainer.get_row_map
+    PRMContainer.normalize_key
 
 API
 ---
@@ -21,12 +23,14 @@ API
 .. automethod:: PRMContainer.write
 .. automethod:: PRMContainer.overlay_mapping
 .. automethod:: PRMContainer.overlay_cp2k_settings
+.. automethod:: PRMContainer.get_row_map
+.. automethod:: PRMContainer.normalize_key
 
 """
 import inspect
 from types import MappingProxyType
 from typing import (Any, Iterator, Dict, Tuple, FrozenSet, Mapping, List, Union, Iterable, Sequence,
-                    Hashable, Optional, ClassVar, MutableSequence)
+                    Hashable, Optional, ClassVar, MutableSequence, Callable)
 from itertools import chain, repeat
 from collections import abc
 
@@ -51,6 +55,18 @@ __all__ = ['PRMContainer']
 
 SeriesIdx = Mapping[str, float]  # e.g. a Pandas.Series with an Index
 SeriesMultiIdx = Mapping[Tuple[str, ...], float]  # e.g. a Pandas.Series with a MultiIndex
+RowMap = Mapping[Tuple[str, ...], Tuple[int, ...]]
+
+
+def _reverse_key(key: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalize a key which is invariant with respect to reversal, *e.g.* a bond."""
+    key_rev = key[::-1]
+    return key if key <= key_rev else key_rev
+
+
+def _improper_key(key: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalize an improper dihedral key; the last three atoms can be freely permutated."""
+    return key[:1] + tuple(sorted(key[1:]))
 
 
 class PRMContainer(AbstractDataClass, AbstractFileContainer):
@@ -70,7 +86,7 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
 
     #: A :class:`frozenset` with the names of private instance attributes.
     #: These attributes will be excluded whenever calling :meth:`PRMContainer.as_dict`.
-    _PRIVATE_ATTR: ClassVar[FrozenSet[str]] = frozenset({'_pd_printoptions'})
+    _PRIVATE_ATTR: ClassVar[FrozenSet[str]] = frozenset({'_pd_printoptions', '_row_map'})
 
     CP2K_TO_PRM: ClassVar[Mapping[str, PRMMappingType]] = _CP2K_TO_PRM
 
@@ -104,6 +120,16 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
         'impropers': (None, None, None, None, np.nan, 0, np.nan)
     })
 
+    #: Functions for normalizing the (symmetry-equivalent) atom-type tuples of each block.
+    KEY_NORMALIZER: Mapping[str, Callable[[Tuple[str, ...]], Tuple[str, ...]]] = MappingProxyType({
+        'bonds': _reverse_key,
+        'angles': _reverse_key,
+        'dihedrals': _reverse_key,
+        'nbfix': _reverse_key,
+        'improper': _improper_key,
+        'impropers': _improper_key
+    })
+
     @property
     def improper(self) -> Optional[pd.DataFrame]:
         """Alias for :attr:`PRMContainer.impropers`."""
@@ -133,6 +159,9 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
         # Print options for Pandas DataFrames
         self.pd_printoptions: Dict[str, Any] = {'display.max_rows': 20}
 
+        # A cache with the row maps of all blocks; see PRMContainer.get_row_map()
+        self._row_map: Dict[str, Tuple[pd.Index, RowMap]] = {}
+
     @property
     def pd_printoptions(self) -> Iterator[Union[Hashable, Any]]:
         return chain.from_iterable(self._pd_printoptions.items())
@@ -282,8 +311,6 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
 
     @AbstractFileContainer.inherit_annotations()
     def _write_iterate(self, write, **kwargs) -> None:
-        isnull = pd.isnull
-
         for key in self.HEADERS[:-2]:
             key_low = key.lower()
             df = getattr(self, key_low)
@@ -303,9 +330,11 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
             else:
                 header = '-\n'.join(i for i in self.nonbonded_header.split('-'))
                 write(f'\n{key} {header}\n')
-            for _, row_value in df.iterrows():
-                write_str = df_str.format(*(('' if isnull(i) else i) for i in row_value))
-                write(write_str)
+
+            # Replace all null values with empty strings and write the block column-wise
+            columns = [series.astype(object).where(series.notnull(), '').tolist() for
+                       _, series in df.items()]
+            write(''.join(df_str.format(*row) for row in zip(*columns)))
 
         write('\nEND\n')
 
@@ -397,9 +426,7 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
             param_df[k] = series_new
 
         # Updated the DataFrame
-        columns = param_df.columns
-        for index, values in param_df.iterrows():
-            df.loc[index, columns] = values
+        self._set_rows(name, param_df.index, param_df.columns, param_df.values)
 
     def overlay_cp2k_settings(self, cp2k_settings: Mapping) -> None:
         """Extract forcefield information from PLAMS-style CP2K settings.
@@ -478,7 +505,9 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
             setattr(self, name, df)
             self._process_df(df, name)
 
-        # Extract, parse and write the values
+        # Extract and parse the values
+        index_list = []
+        value_array = []
         for i, prm_dict in enumerate(prm_iter):
             try:  # Extract the appropiate values
                 index = prm_dict['atoms']
@@ -496,5 +525,140 @@ class PRMContainer(AbstractDataClass, AbstractFileContainer):
                 if func is not None:
                     value_list[i] = func(prm)
 
-            # Assign the values
-            df.loc[index, columns] = value_list
+            index_list.append(index.split() if isinstance(index, str) else index)
+            value_array.append(value_list)
+
+        # Assign the values
+        self._set_rows(name, index_list, columns, np.array(value_array, ndmin=2))
+
+    def _set_rows(self, name: str, index: Iterable[Union[str, Sequence[str]]],
+                  columns: Sequence[int], values: np.ndarray) -> None:
+        """Assign the 2D array **values** to the rows in the **name** block matching **index**.
+
+        Rows are looked up with :meth:`PRMContainer.get_row_map`;
+        rows absent from the block are appended to it.
+
+        """
+        df = getattr(self, name)
+        row_map = self.get_row_map(name)
+        col_idx = df.columns.get_indexer(columns)
+
+        rows: List[int] = []
+        src: List[int] = []
+        new: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], int]] = {}
+        for j, key in enumerate(index):
+            key = (key,) if isinstance(key, str) else tuple(key)
+            key_norm = self.normalize_key(key, name)
+            try:
+                i_tup = row_map[key_norm]
+            except KeyError:  # Keep the spelling of the first occurrence
+                new[key_norm] = new.get(key_norm, (key,))[:1] + (j,)
+            else:
+                rows += i_tup
+                src += len(i_tup) * [j]
+
+        if rows:
+            df.iloc[rows, col_idx] = values[src]
+        if not new:
+            return None
+
+        keys, src = zip(*new.values())
+        if df.index.nlevels == 1:
+            idx = pd.Index([k[0] for k in keys], name=df.index.name)
+        else:
+            idx = pd.MultiIndex.from_tuples(keys, names=df.index.names)
+        df_new = pd.DataFrame(values[list(src)], index=idx, columns=df.columns[col_idx])
+        setattr(self, name, pd.concat([df, df_new]))
+        return None
+
+    @classmethod
+    def normalize_key(cls, key: Union[str, Sequence[str]], name: str) -> Tuple[str, ...]:
+        """Normalize **key**, a tuple of atom types, such that symmetry-equivalent keys are equal.
+
+        The normalization functions are stored in :attr:`PRMContainer.KEY_NORMALIZER`.
+
+        Examples
+        --------
+        .. code:: python
+
+            >>> from FOX import PRMContainer
+
+            >>> PRMContainer.normalize_key(('Se', 'Cd'), 'bonds')
+            ('Cd', 'Se')
+
+            >>> PRMContainer.normalize_key(('C', 'O', 'H', 'C'), 'impropers')
+            ('C', 'C', 'H', 'O')
+
+        Parameters
+        ----------
+        key : :class:`str` or :class:`Sequence<collections.abc.Sequence>` [:class:`str`]
+            One or more atom types.
+
+        name : :class:`str`
+            The name of the block of interest, *e.g.* ``"bonds"``.
+            Keys belonging to a block without normalization function are returned as tuple.
+
+        Returns
+        -------
+        :class:`tuple` [:class:`str`]
+            The normalized key.
+
+        """
+        key_tup = (key,) if isinstance(key, str) else tuple(key)
+        try:
+            func = cls.KEY_NORMALIZER[name]
+        except KeyError:
+            return key_tup
+        return func(key_tup)
+
+    def get_row_map(self, name: str) -> RowMap:
+        """Return a mapping with the row positions of all normalized keys in the **name** block.
+
+        The mapping is cached and only recomputed once the index of the block has changed.
+        See :meth:`PRMContainer.normalize_key` for more details about the normalization.
+
+        Examples
+        --------
+        .. code:: python
+
+            >>> from FOX import PRMContainer
+
+            >>> prm = PRMContainer.read(...)
+
+            >>> row_map = prm.get_row_map('bonds')
+            >>> i = row_map[prm.normalize_key(('H', 'C'), 'bonds')]
+            >>> print(i)
+            (3,)
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the block of interest, *e.g.* ``"bonds"``.
+
+        Returns
+        -------
+        :class:`Mapping<collections.abc.Mapping>` [:class:`tuple` [:class:`str`], :class:`tuple` [:class:`int`]]
+            A read-only mapping with normalized keys and the (0-based) positions of their rows.
+
+        """  # noqa: E501
+        df = getattr(self, name)
+        if df is None:
+            return MappingProxyType({})
+
+        index = df.index
+        try:
+            index_cached, ret = self._row_map[name]
+        except KeyError:
+            pass
+        else:
+            if index is index_cached:
+                return ret
+
+        row_map: Dict[Tuple[str, ...], Tuple[int, ...]] = {}
+        for i, key in enumerate(index):
+            key_norm = self.normalize_key(key, name)
+            row_map[key_norm] = row_map.get(key_norm, ()) + (i,)
+
+        ret = MappingProxyType(row_map)
+        self._row_map[name] = (index, ret)
+        return ret
@@ -23,20 +23,21 @@ import sys
 import reprlib
 import inspect
 from os import PathLike
-from io import TextIOBase
+from io import TextIOBase, StringIO
 from typing import (Dict, Optional, Any, Set, Iterator, Iterable, Callable,
                     AnyStr, List, Mapping, Hashable, Union, Collection)
-from itertools import chain
+from itertools import chain, islice
 from types import MappingProxyType
 
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
 
 from scm.plams import Molecule, Atom, Bond
 from assertionlib.dataclass import AbstractDataClass
 
 from .file_container import AbstractFileContainer
-from ..functions.utils import read_str_file, read_rtf_file, group_by_values
+from ..functions.utils import read_str_file, read_rtf_file, group_by_values, serialize_array
 from ..functions.molecule_utils import get_bonds, get_angles, get_dihedrals, get_impropers
 
 try:
@@ -206,6 +207,9 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         'no_nonbonded': {'shape': 2, 'row_len': 4, 'header': '{:>10d} !NNB'}
     })
 
+    #: The maximum number of lines serialized at once by :meth:`PSFContainer.write`
+    _WRITE_CHUNK: int = 2**16
+
     #: A dictionary mapping .psf headers to :class:`PSFContainer` attribute names
     _HEADER_DICT: Mapping[str, str] = MappingProxyType({
         '!NTITLE': 'title',
@@ -503,9 +507,12 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         ret = {}
 
         next(iterator)  # Skip the first line
-        for i in iterator:
+        while True:
             # Search for psf blocks
-            if i == '\n':
+            i = next(iterator, None)
+            if i is None:
+                break
+            elif i == '\n':
                 continue
 
             # Read the psf block header
@@ -514,40 +521,59 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
             except KeyError as ex:
                 err = f'Failed to parse file; invalid header: {reprlib.repr(i)}'
                 raise OSError(err).with_traceback(ex.__traceback__)
-            ret[key] = value = []
 
-            # Read the actual psf blocks
+            # Read the actual psf blocks; the header specifies the number of lines
+            ret[key] = value = list(islice(iterator, cls._get_line_count(key, i)))
             try:
-                j = next(iterator)
-            except StopIteration:
-                break
+                j = value.index('\n')
+            except ValueError:
+                pass
+            else:  # The header overestimated the size of the block
+                iterator = chain(value[j+1:], iterator)
+                del value[j:]
+                continue
 
-            while j != '\n':
-                value.append(j.split())
-                try:
-                    j = next(iterator)
-                except StopIteration:
+            # Read any remaining lines not accounted for by the header
+            for j in iterator:
+                if j == '\n':
                     break
+                value.append(j)
 
         return cls._post_process_psf(ret)
 
+    @classmethod
+    def _get_line_count(cls, key: str, header: str) -> int:
+        """Return the number of lines in the **key** block based on the count in its **header**."""
+        try:
+            count = int(header.split()[0])
+        except ValueError:
+            return 0
+
+        if key in ('title', 'atoms'):
+            return count
+        items_per_line = cls._SHAPE_DICT[key]['row_len']
+        return -(-count // items_per_line)  # Round up
+
     @AbstractFileContainer.inherit_annotations()
     def _read_postprocess(self, filename, encoding=None, **kwargs):
         if isinstance(filename, str):
             self.filename = filename
 
     @classmethod
-    def _post_process_psf(cls, psf_dict: dict) -> Dict[str, np.ndarray]:
+    def _post_process_psf(cls, psf_dict: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
         """Post-process the output of :meth:`PSF.read`, casting the values into appropiat objects.
 
         * The title block is converted into a 1D array of strings.
         * The atoms block is converted into a Pandas DataFrame.
         * All other blocks are converted into 2D arrays of integers.
 
+        All blocks, except the title, are parsed with a single call to
+        :func:`pandas.read_csv` or :func:`numpy.fromstring`.
+
         Parameters
         ----------
-        psf_dict : :class:`dict` [:class:`str`, :class:`numpy.ndarray`]
-            A dictionary holding the content of a .psf file (see :func:`PSFContainer.read_psf`).
+        psf_dict : :class:`dict` [:class:`str`, :class:`list` [:class:`str`]]
+            A dictionary holding the (unparsed) lines of each .psf block.
 
         Returns
         -------
@@ -558,30 +584,49 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         for key, value in psf_dict.items():  # Post-process the output
             # Cast the atoms block into a dataframe
             if key == 'atoms':
-                df = pd.DataFrame(value)
-                df[0] = df[0].astype(int, copy=False)
-                df.set_index(0, inplace=True)
-                df.index.name = 'ID'
-                df.columns = ['segment name', 'residue ID', 'residue name',
-                              'atom name', 'atom type', 'charge', 'mass', '0']
-                df['residue ID'] = df['residue ID'].astype(int, copy=False)
-                df['charge'] = df['charge'].astype(float, copy=False)
-                df['mass'] = df['mass'].astype(float, copy=False)
-                df['0'] = df['0'].astype(int, copy=False)
-                psf_dict[key] = df
+                psf_dict[key] = cls._parse_atoms(value)
 
             # Cast the title in a list of strings
             elif key == 'title':
-                psf_dict[key] = np.array([' '.join(i).strip('REMARKS ') for i in value])
+                psf_dict[key] = np.array([' '.join(i.split()).strip('REMARKS ') for i in value])
 
             # Cast into a flattened array of indices
             else:
-                ar = np.fromiter(chain.from_iterable(value), dtype=int)
+                ar = np.fromstring(''.join(value), dtype=int, sep=' ')
                 ar.shape = len(ar) // cls._SHAPE_DICT[key]['shape'], cls._SHAPE_DICT[key]['shape']
                 psf_dict[key] = ar
 
         return psf_dict
 
+    #: The names and data types of the columns in the !NATOM block.
+    _ATOMS_DTYPE: Mapping[str, type] = MappingProxyType({
+        'ID': int,
+        'segment name': str,
+        'residue ID': int,
+        'residue name': str,
+        'atom name': str,
+        'atom type': str,
+        'charge': float,
+        'mass': float,
+        '0': int
+    })
+
+    @classmethod
+    def _parse_atoms(cls, value: List[str]) -> pd.DataFrame:
+        """Parse the lines of the !NATOM block into a DataFrame."""
+        names = list(cls._ATOMS_DTYPE)
+        if not value:
+            df = pd.DataFrame({k: pd.Series(dtype=v) for k, v in cls._ATOMS_DTYPE.items()})
+            return df.set_index('ID')
+
+        df = pd.read_csv(
+            StringIO(''.join(value)), sep=r'\s+', header=None, names=names,
+            usecols=range(len(names)), index_col=0, dtype=dict(cls._ATOMS_DTYPE),
+            na_filter=False, float_precision='round_trip', engine='c'
+        )
+        df.columns = names[1:]  # Ensure the '0' column label is a string
+        return df
+
     """########################### methods for writing .psf files. ##############################"""
 
     @AbstractFileContainer.inherit_annotations()
@@ -629,9 +674,10 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         # Prepare the !NATOM block
         write('\n\n{:>10d} !NATOM\n'.format(self.atoms.shape[0]))
         string = '{:>10d} {:8.8} {:<8d} {:8.8} {:8.8} {:6.6} {:>9f} {:>15f} {:>8d}\n'
-        for i, j in self.atoms.iterrows():
-            args = [i] + j.values.tolist()
-            write(string.format(*args))
+        columns = [self.atoms.index.tolist()] + [v.tolist() for _, v in self.atoms.items()]
+        for i in range(0, len(self.atoms), self._WRITE_CHUNK):
+            chunk = zip(*(col[i:i+self._WRITE_CHUNK] for col in columns))
+            write(''.join([string.format(*args) for args in chunk]))
 
     def _write_bottom(self, write: Callable[[AnyStr], None]) -> None:
         """Write the bottom-most section of the to-be create .psf file.
@@ -667,14 +713,19 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
 
             value = getattr(self, attr)
             item_count = len(value) if value.shape[-1] != 0 else 0
-            write('\n\n' + header.format(item_count) +
-                  '\n' + self._serialize_array(value, row_len))
+            write('\n\n' + header.format(item_count) + '\n')
+
+            # Serialize large blocks in chunks consisting of complete lines
+            step = row_len * self._WRITE_CHUNK
+            for i in range(0, len(value), step):
+                write(self._serialize_array(value[i:i+step], row_len))
 
     @staticmethod
     def _serialize_array(array: np.ndarray, items_per_row: int = 4) -> str:
         """Serialize an array into a single string; used for creating .psf files.
 
         Newlines are placed for every **items_per_row** rows in **array**.
+        An alias for :func:`FOX.functions.utils.serialize_array`.
 
         Parameters
         ----------
@@ -695,20 +746,7 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
             The main method for writing .psf files.
 
         """
-        if len(array) == 0:
-            return ''
-
-        ret = ''
-        k = 0
-        for i in array:
-            for j in i:
-                ret += '{:>10d}'.format(j)
-            k += 1
-            if k == items_per_row:
-                k = 0
-                ret += '\n'
-
-        return ret
+        return serialize_array(array, items_per_row)
 
     """################### methods for altering atomic/molecular information. ###################"""
 
@@ -760,7 +798,7 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         """  # noqa
         self.bonds = get_bonds(mol)
 
-    def generate_angles(self, mol: Molecule) -> None:
+    def generate_angles(self, mol: Molecule, bond_mat: Optional[csr_matrix] = None) -> None:
         """Update :attr:`PSFContainer.angles` with the indices of all angle-defining atoms from **mol**.
 
         Parameters
@@ -768,10 +806,15 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         mol : |plams.Molecule|
             A PLAMS Molecule.
 
+        bond_mat : :class:`csr_matrix<scipy.sparse.csr_matrix>`, optional
+            The bond matrix of **mol** as constructed by
+            :func:`get_bond_matrix()<FOX.functions.molecule_utils.get_bond_matrix>`.
+            Will be constructed from **mol** if ``None``.
+
         """  # noqa
-        self.angles = get_angles(mol)
+        self.angles = get_angles(mol, bond_mat)
 
-    def generate_dihedrals(self, mol: Molecule) -> None:
+    def generate_dihedrals(self, mol: Molecule, bond_mat: Optional[csr_matrix] = None) -> None:
         """Update :attr:`PSFContainer.dihedrals` with the indices of all proper dihedral angle-defining atoms from **mol**.
 
         Parameters
@@ -779,10 +822,15 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         mol : |plams.Molecule|
             A PLAMS Molecule.
 
+        bond_mat : :class:`csr_matrix<scipy.sparse.csr_matrix>`, optional
+            The bond matrix of **mol** as constructed by
+            :func:`get_bond_matrix()<FOX.functions.molecule_utils.get_bond_matrix>`.
+            Will be constructed from **mol** if ``None``.
+
         """  # noqa
-        self.dihedrals = get_dihedrals(mol)
+        self.dihedrals = get_dihedrals(mol, bond_mat)
 
-    def generate_impropers(self, mol: Molecule) -> None:
+    def generate_impropers(self, mol: Molecule, bond_mat: Optional[csr_matrix] = None) -> None:
         """Update :attr:`PSFContainer.impropers` with the indices of all improper dihedral angle-defining atoms from **mol**.
 
         Parameters
@@ -790,8 +838,13 @@ class PSFContainer(AbstractDataClass, AbstractFileContainer):
         mol : |plams.Molecule|
             A PLAMS Molecule.
 
+        bond_mat : :class:`csr_matrix<scipy.sparse.csr_matrix>`, optional
+            The bond matrix of **mol** as constructed by
+            :func:`get_bond_matrix()<FOX.functions.molecule_utils.get_bond_matrix>`.
+            Will be constructed from **mol** if ``None``.
+
         """  # noqa
-        self.impropers = get_impropers(mol)
+        self.impropers = get_impropers(mol, bond_mat)
 
     def generate_atoms(self, mol: Molecule,
                        id_map: Optional[Mapping[int, Hashable]] = None) -> None:
@@ -985,27 +1038,35 @@ def overlay_rtf_file(psf: PSFContainer, filename: str,
 def _overlay(psf: PSFContainer, atom_list: Collection[str],
              charge_list: Collection[float],
              id_range: Optional[Iterable[int]] = None) -> None:
-    id_range = range(2, 1 + max(psf.residue_id)) if id_range is None else id_range
-    try:
-        for i in id_range:
-            j = psf.residue_id == i
-            psf.atoms.loc[j, 'atom type'] = atom_list
-            psf.atoms.loc[j, 'charge'] = charge_list
-
-    except ValueError as ex:
-        try:
-            ligand_size = np.count_nonzero(j)
-            at_len = len(atom_list)
-            charge_len = len(charge_list)
-        except Exception as ex2:  # Plan B in case something goes wrong here
-            raise ex from ex2
-
+    res_id = psf.residue_id.values
+    if id_range is None:
+        id_range = range(2, 1 + max(res_id))
+    id_list = list(dict.fromkeys(id_range))  # Remove duplicates while preserving the order
+    if not id_list:
+        return
+
+    # Find the indices of all to-be updated atoms, grouped by residue
+    idx = np.nonzero(np.isin(res_id, id_list))[0]
+    idx = idx[np.argsort(res_id[idx], kind='stable')]
+
+    # Validate the size of all residues
+    at_len = len(atom_list)
+    charge_len = len(charge_list)
+    ligand_size_dict = dict(zip(*np.unique(res_id[idx], return_counts=True)))
+    for i in id_list:
+        ligand_size = ligand_size_dict.get(i, 0)
         if ligand_size != at_len:
             raise ValueError(f"Residue {i} in the passed {psf.__class__.__name__} contains "
                              f"{ligand_size} atoms while the passed 'atom_list' "
-                             f"contains {at_len}") from ex
+                             f"contains {at_len}")
         elif ligand_size != charge_len:
             raise ValueError(f"Residue {i} in the passed {psf.__class__.__name__} contains "
                              f"{ligand_size} atoms while the passed 'charge_list' "
-                             f"contains {charge_len}") from ex
-        raise ex
+                             f"contains {charge_len}")
+
+    # Update all residues at once
+    columns = psf.atoms.columns
+    atom_type = np.tile(np.array(atom_list, dtype=object), len(id_list))
+    charge = np.tile(np.asarray(charge_list, dtype=float), len(id_list))
+    psf.atoms.iloc[idx, columns.get_loc('atom type')] = atom_type
+    psf.atoms.iloc[idx, columns.get_loc('charge')] = charge
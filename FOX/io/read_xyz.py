@@ -10,6 +10,8 @@ Index
 .. autosummary::
     XYZError
     read_multi_xyz
+    read_multi_xyz_cached
+    get_xyz_cache_path
     get_comments
     validate_xyz
     _get_atom_count
@@ -20,6 +22,8 @@ API
 ---
 .. autoexception:: FOX.io.read_xyz.XYZError
 .. autofunction:: FOX.io.read_xyz.read_multi_xyz
+.. autofunction:: FOX.io.read_xyz.read_multi_xyz_cached
+.. autofunction:: FOX.io.read_xyz.get_xyz_cache_path
 .. autofunction:: FOX.io.read_xyz.get_comments
 .. autofunction:: FOX.io.read_xyz.validate_xyz
 .. autofunction:: FOX.io.read_xyz._get_atom_count
@@ -30,6 +34,8 @@ API
 
 import os
 import reprlib
+import hashlib
+import warnings
 from typing import Tuple, Dict, Iterable, List, Union, Iterator, Generator, AnyStr
 from itertools import islice, chain
 
@@ -37,7 +43,10 @@ import numpy as np
 
 from ..functions.utils import group_by_values
 
-__all__ = ['read_multi_xyz']
+__all__ = ['read_multi_xyz', 'read_multi_xyz_cached']
+
+#: The version of the binary .xyz cache layout; bump whenever the layout is changed.
+_CACHE_VERSION = '1'
 
 
 class XYZError(OSError):
@@ -103,6 +112,128 @@ def read_multi_xyz(filename: Union[AnyStr, os.PathLike], return_comment: bool =
         return xyz, idx_dict
 
 
+def read_multi_xyz_cached(filename: Union[AnyStr, os.PathLike],
+                          cache_dir: Union[None, AnyStr, os.PathLike] = None
+                          ) -> Tuple[np.ndarray, Dict[str, List[int]], np.ndarray]:
+    r"""Read a (multi) .xyz file, storing and reusing its content in a binary sidecar cache.
+
+    The Cartesian coordinates are cached in an uncompressed .npy file,
+    while the atomic symbols and comments are stored in a matching .npz file.
+    Cached coordinates are loaded as a copy-on-write memory-map, *i.e.* no text parsing is
+    required and changes to the returned array are never written back to the cache.
+
+    The cache is keyed by the absolute path, size and modification time of **filename**
+    and is automatically invalidated (and rewritten) when any of these change.
+    Issues encountered while writing the cache (*e.g.* a read-only directory)
+    are reported with a warning, the content of **filename** being returned regardless.
+
+    Parameters
+    ----------
+    filename : str
+        The path+filename of a (multi) .xyz file.
+
+    cache_dir : str, optional
+        The directory for storing the cache files.
+        If ``None``, store the cache as hidden files in the directory of **filename**.
+
+    Returns
+    -------
+    :math:`m*n*3` |np.ndarray|_ [|np.float64|_], |dict|_ [|str|_, |list|_ [|int|_]] and\
+    :math:`m` |np.ndarray|_ [|str|_]:
+        * A 3D array with Cartesian coordinates of :math:`m` molecules with :math:`n` atoms.
+        * A dictionary with atomic symbols as keys and lists of matching atomic indices as values.
+        * A 1D array with :math:`m` comments.
+
+    Raises
+    ------
+    :exc:`.XYZError`
+        Raised when issues are encountered related to parsing .xyz files.
+
+    See Also
+    --------
+    :func:`read_multi_xyz`
+        Read a (multi) .xyz file.
+
+    """
+    coords_file, meta_file = get_xyz_cache_path(filename, cache_dir)
+    key = _get_cache_key(filename)
+
+    # Plan A: Read the cache
+    try:
+        with np.load(meta_file) as f:
+            if f['key'].tolist() == key:
+                symbols, comments = f['symbols'], f['comments']
+                xyz = np.load(coords_file, mmap_mode='c')
+                if xyz.shape == (len(comments), len(symbols), 3):
+                    return xyz, group_by_values(enumerate(symbols.tolist())), comments
+    except (OSError, KeyError, ValueError):  # The cache is absent or corrupted
+        pass
+
+    # Plan B: Parse the .xyz file and (re-)write the cache
+    xyz, idx_dict, comments = read_multi_xyz(filename)
+    if key != _get_cache_key(filename):  # The file was modified while it was being parsed
+        return xyz, idx_dict, comments
+
+    symbols = np.empty(xyz.shape[1], dtype=object)
+    for at, idx in idx_dict.items():
+        symbols[idx] = at
+    try:
+        _atomic_save(coords_file, np.save, xyz)
+        _atomic_save(meta_file, np.savez, key=np.array(key),
+                     symbols=symbols.astype(str), comments=comments)
+    except OSError as ex:
+        warnings.warn(f"Failed to write the .xyz cache {coords_file!r}: {ex}", RuntimeWarning)
+    return xyz, idx_dict, comments
+
+
+def get_xyz_cache_path(filename: Union[AnyStr, os.PathLike],
+                       cache_dir: Union[None, AnyStr, os.PathLike] = None) -> Tuple[str, str]:
+    """Return the paths of the coordinate (.npy) and metadata (.npz) caches of **filename**.
+
+    Parameters
+    ----------
+    filename : str
+        The path+filename of a (multi) .xyz file.
+
+    cache_dir : str, optional
+        The directory for storing the cache files.
+        If ``None``, use the directory of **filename**.
+
+    Returns
+    -------
+    |str|_ and |str|_:
+        The path+filenames of the .npy and .npz cache files.
+
+    """
+    filename = os.path.abspath(os.fsdecode(filename))
+    if cache_dir is None:
+        head, tail = os.path.split(filename)
+        stem = os.path.join(head, f'.{tail}.foxcache')
+    else:
+        digest = hashlib.sha1(filename.encode()).hexdigest()
+        stem = os.path.join(os.fsdecode(cache_dir), digest)
+    return f'{stem}.npy', f'{stem}.npz'
+
+
+def _get_cache_key(filename: Union[AnyStr, os.PathLike]) -> List[str]:
+    """Return a list of strings identifying the current state of **filename**."""
+    stat = os.stat(filename)
+    path = os.path.abspath(os.fsdecode(filename))
+    return [_CACHE_VERSION, path, str(stat.st_size), str(stat.st_mtime_ns)]
+
+
+def _atomic_save(filename: str, save_func, *args, **kwargs) -> None:
+    """Write **filename** via a temporary file, ensuring no partially written files remain."""
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            save_func(f, *args, **kwargs)
+        os.replace(tmp, filename)
+    finally:
+        if os.path.isfile(tmp):
+            os.remove(tmp)
+
+
 def _xyz_generator(f: Iterable[str], atom_count: int) -> Generator[Iterator[int], None, None]:
     """Create a Cartesian coordinate generator for :func:`.read_multi_xyz`."""
     stop = 1 + atom_count
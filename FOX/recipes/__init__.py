@@ -6,12 +6,16 @@ A number of Auto-FOX recipes.
 
 """
 
-from .param import get_best, overlay_descriptor, plot_descriptor
-from .psf import generate_psf, generate_psf2, extract_ligand
-from .ligands import get_lig_center, get_multi_lig_center
+from ..functions.lazy import lazy_loader
 
 __all__ = [
     'get_best', 'overlay_descriptor', 'plot_descriptor',
     'generate_psf', 'generate_psf2', 'extract_ligand',
-    'get_lig_center', 'get_multi_lig_center'
+    'get_lig_center', 'get_multi_lig_center', 'analyze_lig_center'
 ]
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    '.param': ['get_best', 'overlay_descriptor', 'plot_descriptor'],
+    '.psf': ['generate_psf', 'generate_psf2', 'extract_ligand'],
+    '.ligands': ['get_lig_center', 'get_multi_lig_center', 'analyze_lig_center'],
+})
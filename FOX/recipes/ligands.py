@@ -109,27 +109,55 @@ A .psf file will herein be used as starting point.
     >>> rdf = mol_new.init_rdf(atom_subset=set(symbols))
 
 
+Examples
+--------
+An example for characterizing the ligand shell with a ligand-ligand RDF, ADF and
+the ligand coordination numbers.
+Contrary to :meth:`MultiMolecule.init_rdf()<FOX.classes.multi_mol.MultiMolecule.init_rdf>`
+and :meth:`MultiMolecule.init_adf()<FOX.classes.multi_mol.MultiMolecule.init_adf>`,
+no dense distance or angle matrices are constructed.
+
+.. code:: python
+
+    >>> import pandas as pd
+    >>> from FOX.recipes import get_lig_center, analyze_lig_center
+
+    >>> mol = MultiMolecule.from_xyz(example_xyz)
+    >>> lig_centra: np.ndarray = get_lig_center(mol, 123, 4)
+
+    >>> rdf, adf, cn = analyze_lig_center(lig_centra, adf_r_max=8.0, cn_r_max=6.0)
+    >>> cn_mean: pd.Series = cn.mean(axis=0)  # The mean coordination number per ligand
+
+
 Index
 -----
 .. currentmodule:: FOX.recipes.ligands
 .. autosummary::
     get_lig_center
     get_multi_lig_center
+    analyze_lig_center
 
 API
 ---
 .. autofunction:: get_lig_center
 .. autofunction:: get_multi_lig_center
+.. autofunction:: analyze_lig_center
 
 """
 
-from typing import Optional, Iterable, Sequence
+from typing import Optional, Iterable, Sequence, Callable, Tuple
 
 import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree, ConvexHull
+from scipy.spatial.distance import pdist
 
 from FOX import MultiMolecule
+from FOX.classes.multi_mol import neg_exp
+from FOX.functions.rdf import get_rdf_df
+from FOX.functions.adf import get_adf, get_adf_df
 
-__all__ = ['get_lig_center', 'get_multi_lig_center']
+__all__ = ['get_lig_center', 'get_multi_lig_center', 'analyze_lig_center']
 
 
 def get_lig_center(mol: MultiMolecule, start: int, step: int, stop: Optional[int] = None,
@@ -177,12 +205,17 @@ def get_lig_center(mol: MultiMolecule, start: int, step: int, stop: Optional[int
 
 
 def get_multi_lig_center(mol: MultiMolecule, idx_iter: Iterable[Sequence[int]],
-                         mass_weighted: bool = True) -> np.ndarray:
+                         mass_weighted: bool = True,
+                         chunksize: Optional[int] = None) -> np.ndarray:
     """Return an array with the (mass-weighted) mean position of each ligands in **mol**.
 
     Contrary to :func:`get_lig_center`, this function can handle molecules with multiple
     non-unique ligands.
 
+    The indices of all ligands are concatenated into a single array,
+    the centra of all ligands being computed in a single (vectorized) pass with
+    :data:`numpy.add.reduceat`.
+
     Parameters
     ----------
     mol : :class:`MultiMolecule<FOX.classes.multi_mol.MultiMolecule>`
@@ -196,6 +229,10 @@ def get_multi_lig_center(mol: MultiMolecule, idx_iter: Iterable[Sequence[int]],
         If ``True``, return the mass-weighted mean ligand position rather than
         its unweighted counterpart.
 
+    chunksize : :class:`int`, optional
+        If not ``None``, process the frames of **mol** in chunks of at most **chunksize** frames,
+        thus limiting the size of the intermediate arrays.
+
     Returns
     -------
     :class:`numpy.ndarray`
@@ -203,19 +240,176 @@ def get_multi_lig_center(mol: MultiMolecule, idx_iter: Iterable[Sequence[int]],
         If ``mol.shape == (m, n, 3)`` then, given ``k`` new ligands (aka the length of **idx_iter**)
         , the to-be returned array's shape is ``(m, k, 3)``.
 
+    Raises
+    ------
+    ValueError
+        Raised if one of the ligands in **idx_iter** is empty.
+
     """  # noqa
-    mass_ = mol.mass
-    ret = []
-    ret_append = ret.append
+    idx_list = [np.asarray(idx, dtype=np.intp).ravel() for idx in idx_iter]
+    count = np.array([len(idx) for idx in idx_list], dtype=np.intp)
+    if not len(idx_list):
+        return np.empty((len(mol), 0, 3), dtype=float)
+    elif not count.all():
+        raise ValueError("Ligands should consist of at least one atom")
+
+    # The (concatenated) atomic indices and the offset of each ligand therein
+    idx = np.concatenate(idx_list)
+    offset = np.zeros_like(count)
+    np.cumsum(count[:-1], out=offset[1:])
+
+    # The (normalized) weight of each atom
+    weight = mol.mass[idx] if mass_weighted else np.ones(len(idx), dtype=float)
+    weight /= np.repeat(np.add.reduceat(weight, offset), count)
+    weight = weight[None, :, None]
+
+    m = len(mol)
+    chunksize = m if chunksize is None else max(1, int(chunksize))
+    xyz = np.asarray(mol)
+    ret = np.empty((m, len(count), 3), dtype=float)
+    for i in range(0, m, chunksize):
+        j = slice(i, i + chunksize)
+        ret[j] = np.add.reduceat(xyz[j, idx] * weight, offset, axis=1)
+    return ret
+
+
+def analyze_lig_center(lig_centra: np.ndarray, dr: float = 0.05, r_max: float = 12.0,
+                       adf_r_max: float = 8.0, cn_r_max: float = 8.0,
+                       weight: Optional[Callable[[np.ndarray], np.ndarray]] = neg_exp,
+                       symbol: str = 'Xx') -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    r"""Construct the ligand-ligand RDF, ADF and coordination numbers from the ligand centra.
+
+    A single neighbor list is constructed for every frame (using a
+    :class:`cKDTree<scipy.spatial.cKDTree>`), which is then used for
+    constructing all three descriptors.
+    The RDF is normalized identically to
+    :meth:`MultiMolecule.init_rdf()<FOX.classes.multi_mol.MultiMolecule.init_rdf>`
+    and the ADF is, contrary to
+    :meth:`MultiMolecule.init_adf()<FOX.classes.multi_mol.MultiMolecule.init_adf>`,
+    exclusively normalized with respect to angles between two (distinct) neighbors.
+
+    Parameters
+    ----------
+    lig_centra : :class:`numpy.ndarray`
+        An array of shape :math:`(m, k, 3)` with the Cartesian coordinates of
+        :math:`k` ligand centra in :math:`m` frames (see :func:`get_lig_center`).
+
+    dr : :class:`float`
+        The integration step-size of the RDF in Ångström.
 
-    for idx in idx_iter:
-        ligand = mol[:, idx]
-        if not mass_weighted:
-            ret_append(ligand.mean(axis=1))
-            continue
+    r_max : :class:`float`
+        The maximum to-be evaluated inter-ligand distance of the RDF in Ångström.
 
-        mass = mass_[idx][None, ..., None]
-        ligand *= mass
-        ret_append(ligand.sum(axis=1) / mass.sum(axis=1))
+    adf_r_max : :class:`float`
+        The maximum inter-ligand distance (in Ångström) for which angles are constructed.
 
-    return np.array(ret)
+    cn_r_max : :class:`float`
+        The radius (in Ångström) of the coordination shell.
+
+    weight : :data:`Callable<typing.Callable>` [[:class:`numpy.ndarray`], :class:`numpy.ndarray`], optional
+        A callable for creating a weighting factor from inter-ligand distances.
+        Given an angle :math:`\phi_{ijk}`, to the distance :math:`r_{ijk}` is defined
+        as :math:`max[r_{ij}, r_{jk}]`.
+        Set to ``None`` to disable distance weighting.
+
+    symbol : :class:`str`
+        The symbol used for constructing the column names of the RDF and ADF.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`, :class:`pandas.DataFrame` and :class:`pandas.DataFrame`
+        The ligand-ligand RDF and ADF, both averaged over all frames,
+        and a :math:`m` by :math:`k` DataFrame with the coordination number of each ligand
+        in each frame.
+
+    """  # noqa: E501
+    xyz = np.asarray(lig_centra, dtype=float)
+    if xyz.ndim == 2:  # A single frame
+        xyz = xyz[None, ...]
+    elif xyz.ndim != 3:
+        raise ValueError("'lig_centra' expected a 2D or 3D array; "
+                         f"observed dimensionality: {xyz.ndim!r}")
+    m, k, _ = xyz.shape
+
+    idx_max = 1 + int(r_max / dr)
+    r = np.arange(0, r_max + dr, dr)[:idx_max]
+    r_query = max(idx_max * dr, adf_r_max, cn_r_max)
+
+    rdf = np.zeros(idx_max, dtype=float)
+    adf = np.zeros(180, dtype=float)
+    cn = np.zeros((m, k), dtype=int)
+    for i, frame in enumerate(xyz):
+        # Construct the neighbor list; contains the indices of all unique ligand pairs
+        pairs = cKDTree(frame).query_pairs(r_query, output_type='ndarray')
+        vec = frame[pairs[:, 1]] - frame[pairs[:, 0]]
+        dist = np.linalg.norm(vec, axis=1)
+
+        rdf += _get_lig_rdf(dist, r, dr, k, _get_max_dist(frame))
+        adf += _get_lig_adf(pairs, vec, dist, k, adf_r_max, weight)
+        cn[i] = np.bincount(pairs[dist <= cn_r_max].ravel(), minlength=k)
+
+    key = f'{symbol} {symbol}'
+    rdf_df = get_rdf_df([key], dr, r_max)
+    rdf_df[key] = rdf / m
+    adf_df = get_adf_df([f'{symbol} {symbol} {symbol}'])
+    adf_df.iloc[:, 0] = adf / m
+    cn_df = pd.DataFrame(cn, index=pd.RangeIndex(m, name='Frame'),
+                         columns=pd.RangeIndex(k, name='Ligand'))
+    return rdf_df, adf_df, cn_df
+
+
+def _get_max_dist(xyz: np.ndarray) -> float:
+    """Return the largest inter-ligand distance in **xyz**; only the convex hull is considered."""
+    try:
+        xyz = xyz[ConvexHull(xyz).vertices]
+    except (ValueError, RuntimeError):  # Too few or (nearly) coplanar points
+        pass
+    return pdist(xyz).max() if len(xyz) > 1 else 0.0
+
+
+def _get_lig_rdf(dist: np.ndarray, r: np.ndarray, dr: float, k: int,
+                 max_dist: float) -> np.ndarray:
+    """Construct the RDF of a single frame; see :func:`get_rdf_lowmem<FOX.functions.rdf.get_rdf_lowmem>`."""  # noqa: E501
+    idx_max = len(r)
+    dist_int = (dist / dr).astype(int)
+    dens = 2 * np.bincount(dist_int[dist_int < idx_max], minlength=idx_max).astype(float)
+    if k < 2 or max_dist == 0:  # There are no ligand pairs, and thus no volume to normalize by
+        return dens
+
+    # Correct for the number of reference ligands and the volume of each concentric shell
+    dens_mean = k / ((4/3) * np.pi * (0.5 * max_dist)**3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dens /= k * 4 * np.pi * r**2 * dr * dens_mean
+    dens[0] = 0.0
+    return dens
+
+
+def _get_lig_adf(pairs: np.ndarray, vec: np.ndarray, dist: np.ndarray, k: int,
+                 r_max: float, weight: Optional[Callable[[np.ndarray], np.ndarray]]
+                 ) -> np.ndarray:
+    """Construct the ADF of a single frame from its neighbor list."""
+    keep = dist <= r_max
+    pairs, vec, dist = pairs[keep], vec[keep], dist[keep]
+
+    # Construct all directed edges, grouped by their central ligand
+    center = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    order = np.argsort(center, kind='stable')
+    center = center[order]
+    unit_vec = (np.concatenate([vec, -vec]) / np.concatenate([dist, dist])[:, None])[order]
+    dist = np.concatenate([dist, dist])[order]
+
+    # Pair each edge with all other edges sharing the same central ligand
+    degree = np.bincount(center, minlength=k)
+    offset = np.cumsum(degree) - degree
+    count = degree[center]
+    i = np.repeat(np.arange(len(center)), count)
+    j = offset[center[i]] + np.arange(len(i)) - np.repeat(np.cumsum(count) - count, count)
+    keep = i < j
+    i, j = i[keep], j[keep]
+    if not len(i):
+        return np.zeros(180, dtype=float)
+
+    cos_ang = np.einsum('ij,ij->i', unit_vec[i], unit_vec[j]).clip(-1, 1)
+    ang = np.degrees(np.arccos(cos_ang)).astype(int)
+    weights = weight(np.maximum(dist[i], dist[j])) if weight is not None else None
+    return get_adf(ang, weights=weights)
@@ -153,6 +153,7 @@ except ImportError:
     )
 
 from FOX import from_hdf5, assert_error
+from FOX.io.hdf5_utils import LazyDataset
 from FOX.logger import DEFAULT_LOGGER as logger
 
 __all__ = ['get_best', 'overlay_descriptor', 'plot_descriptor']
@@ -164,6 +165,9 @@ PlotAccessor: type = pd.DataFrame.plot  # A class used by Pandas for plotting st
 def get_best(hdf5_file: str, name: str = 'rdf', i: int = 0) -> pd.DataFrame:
     """Return the PES descriptor or ARMC property which yields the lowest error.
 
+    The auxiliary error is scanned in blocks (see :meth:`LazyDataset.iter_chunks`)
+    and only the optimal PES descriptor is read from **hdf5_file**.
+
     Parameters
     ----------
     hdf5_file : :class:`str`
@@ -188,20 +192,15 @@ def get_best(hdf5_file: str, name: str = 'rdf', i: int = 0) -> pd.DataFrame:
     with h5py.File(hdf5_file, 'r', libver='latest') as f:
         if full_name not in f.keys():  # i.e. if **name** does not belong to a PE descriptor
             full_name = name
-        shape = f['aux_error'].shape[:2]
 
-    # Load the DataFrames
-    if full_name == 'aux_error':
-        aux_error = prop = from_hdf5(hdf5_file, 'aux_error')
+    # Read the best DataFrame (or Series)
+    j, (kappa, omega) = _get_best_iteration(hdf5_file)
+    if full_name == 'phi':  # "phi" has historically been indexed by the flat iteration
+        prop = from_hdf5(hdf5_file, full_name, kappa=j)
     else:
-        hdf5_dict = from_hdf5(hdf5_file, ['aux_error', full_name])
-        aux_error, prop = hdf5_dict['aux_error'], hdf5_dict[full_name]
-
-    # Return the best DataFrame (or Series)
-    j: int = aux_error.sum(axis=1, skipna=False).idxmin()
-    logger.debug(f"Optimum ARMC cycle: {np.unravel_index(j, shape)}")
+        prop = from_hdf5(hdf5_file, full_name, kappa=kappa, omega=omega)
 
-    df = prop[j] if not isinstance(prop, NDFrame) else prop.iloc[j]
+    df = prop[0] if not isinstance(prop, NDFrame) else prop.iloc[0]
     if isinstance(df, pd.DataFrame):
         df.columns.name = full_name
     elif isinstance(df, pd.Series):
@@ -233,18 +232,12 @@ def overlay_descriptor(hdf5_file: str, name: str = 'rdf', i: int = 0) -> Dict[st
         Atom pairs, such as ``"Cd Cd"``, are used as keys.
 
     """  # noqa
-    with h5py.File(hdf5_file, 'r', libver='latest') as f:
-        shape = f['aux_error'].shape[:2]
-
     mm_name = f'{name}.{i}'
     qm_name = f'{name}.{i}.ref'
-    hdf5_dict = from_hdf5(hdf5_file, ['aux_error', mm_name, qm_name])
-    aux_error, mm, qm = hdf5_dict['aux_error'], hdf5_dict[mm_name], hdf5_dict[qm_name]
 
-    j: int = aux_error.sum(axis=1, skipna=False).idxmin()
-    logger.debug(f"Optimum ARMC cycle: {np.unravel_index(j, shape)}")
-    mm = mm[j]
-    qm = qm[0]
+    _, (kappa, omega) = _get_best_iteration(hdf5_file)
+    mm = from_hdf5(hdf5_file, mm_name, kappa=kappa, omega=omega)[0]
+    qm = from_hdf5(hdf5_file, qm_name)[0]
 
     ret = {}
     for key in mm:
@@ -254,6 +247,35 @@ def overlay_descriptor(hdf5_file: str, name: str = 'rdf', i: int = 0) -> Dict[st
     return ret
 
 
+def _get_best_iteration(hdf5_file: str) -> Tuple[int, Tuple[int, int]]:
+    """Return the flat ARMC iteration and super- & sub-iteration with the lowest auxiliary error.
+
+    Iterations with an auxiliary error of ``nan`` (*e.g.* crashed MD simulations) are ignored.
+
+    """
+    aux_error = LazyDataset(hdf5_file, 'aux_error')
+    omega_max = aux_error.shape[1]
+
+    err_min = np.inf
+    j: Optional[int] = None
+    for index, err in aux_error.iter_chunks():
+        err_sum = err.reshape(len(err), -1).sum(axis=1)
+        err_sum[np.isnan(err_sum)] = np.inf
+        if not len(err_sum):
+            continue
+
+        k = err_sum.argmin()
+        if err_sum[k] < err_min:
+            err_min, j = err_sum[k], index[k]
+
+    if j is None:
+        raise ValueError(f"No finite auxiliary errors found in {hdf5_file!r}")
+
+    kappa_omega = divmod(int(j), omega_max)
+    logger.debug(f"Optimum ARMC cycle: {kappa_omega}")
+    return int(j), kappa_omega
+
+
 @assert_error(PLT_ERROR)
 def plot_descriptor(descriptor: Union[NDFrame, Iterable[NDFrame]],
                     show_fig: bool = True, kind: str = 'line',
@@ -69,6 +69,17 @@ Example for multiple ligands.
     >>> psf: PSFContainer = generate_psf2(qd, *ligands, rtf_file=rtf_files)
     >>> psf.write(...)
 
+For quantum dots with many identical ligands the ``template`` option can be used,
+performing the substructure matching once for every unique ligand and replicating
+its bonded topology for all other copies.
+
+.. code:: python
+
+    >>> ...
+
+    >>> psf: PSFContainer = generate_psf2(qd, *ligands, rtf_file=rtf_files, template=True)
+    >>> psf.write(...)
+
 If the the psf construction with :func:`generate_psf2` failes to identify a particular ligand,
 it is possible to return all (failed) potential ligands with the **ret_failed_lig** parameter.
 
@@ -101,17 +112,19 @@ from os import PathLike
 from sys import version_info
 from types import MappingProxyType
 from typing import (Union, Iterable, Optional, TypeVar, Callable, Mapping, Type, Iterator,
-                    Hashable, Any, Tuple, MutableMapping, AnyStr, List, SupportsFloat)
-from itertools import chain
+                    Hashable, Any, Tuple, MutableMapping, AnyStr, List, SupportsFloat, Dict)
+from itertools import chain, repeat
 from collections import abc
 
 import numpy as np
-from scm.plams import Molecule, Atom, Bond, MoleculeError, PT
+from scm.plams import Molecule, Atom, MoleculeError, PT
 
 from FOX import PSFContainer, assert_error
 from FOX.io.read_psf import overlay_rtf_file, overlay_str_file
 from FOX.functions.utils import group_by_values
-from FOX.functions.molecule_utils import fix_bond_orders
+from FOX.functions.molecule_utils import (
+    fix_bond_orders, get_bond_matrix, get_bonds, get_angles, get_dihedrals, get_impropers
+)
 from FOX.armc_functions.sanitization import _assign_residues
 
 if version_info.minor < 7:
@@ -148,7 +161,8 @@ __all__ = ['generate_psf', 'generate_psf2', 'extract_ligand']
 
 
 def generate_psf(qd: Union[str, Molecule], ligand: Union[str, Molecule],
-                 rtf_file: Optional[str] = None, str_file: Optional[str] = None) -> PSFContainer:
+                 rtf_file: Optional[str] = None, str_file: Optional[str] = None,
+                 template: bool = False) -> PSFContainer:
     """Generate a :class:`PSFContainer` instance for **qd**.
 
     Parameters
@@ -171,6 +185,12 @@ def generate_psf(qd: Union[str, Molecule], ligand: Union[str, Molecule],
         Used for assigning atom types.
         Alternativelly, one can supply a .rtf file with the **rtf_file** argument.
 
+    template : :class:`bool`
+        If ``True``, construct the bonds, angles, dihedrals and impropers of the first ligand
+        and replicate them, by offsetting their atomic indices, for all other ligands.
+        Produces the same topology as ``template=False``, albeit with a potentially
+        different order of rows sharing the same first atom.
+
     Returns
     -------
     :class:`PSFContainer`
@@ -199,16 +219,21 @@ def generate_psf(qd: Union[str, Molecule], ligand: Union[str, Molecule],
     # Manually add bonds to the quantum dot
     ligand_len = len(ligand)
     qd.delete_all_bonds()
-    while True:
-        try:
-            qd[bonds[0, 0]]
-        except IndexError:
-            break
-        else:
-            for j, k in bonds:
-                at1, at2 = qd[j], qd[k]
-                qd.add_bond(at1, at2)
-            bonds += ligand_len
+    if template:
+        ligand_count = (len(qd) - ligand_start) // ligand_len
+        offset = ligand_len * np.arange(ligand_count)
+        _add_bonds(qd, (bonds[None] + offset[:, None, None]).reshape(-1, 2))
+    else:
+        while True:
+            try:
+                qd[bonds[0, 0]]
+            except IndexError:
+                break
+            else:
+                for j, k in bonds:
+                    at1, at2 = qd[j], qd[k]
+                    qd.add_bond(at1, at2)
+                bonds += ligand_len
 
     # Create a nested list with residue indices
     res_ar = np.arange(ligand_start, len(qd))
@@ -219,10 +244,14 @@ def generate_psf(qd: Union[str, Molecule], ligand: Union[str, Molecule],
 
     # Create the .psf file
     psf = PSFContainer()
-    psf.generate_bonds(qd)
-    psf.generate_angles(qd)
-    psf.generate_dihedrals(qd)
-    psf.generate_impropers(qd)
+    if template:
+        _generate_bonded_template(psf, qd, [(res_ar[:, 0], ligand_len)])
+    else:
+        bond_mat = get_bond_matrix(qd)
+        psf.generate_bonds(qd)
+        psf.generate_angles(qd, bond_mat)
+        psf.generate_dihedrals(qd, bond_mat)
+        psf.generate_impropers(qd, bond_mat)
     psf.generate_atoms(qd)
     overlay_rtf_file(psf, rtf_file) if rtf_file is not None else None
     overlay_str_file(psf, str_file) if str_file is not None else None
@@ -280,7 +309,8 @@ def generate_psf2(qd: Union[str, Molecule],
                   *ligands: Union[str, Molecule, Mol],
                   rtf_file: Union[None, str, Iterable[str]] = None,
                   str_file: Union[None, str, Iterable[str]] = None,
-                  ret_failed_lig: bool = False) -> PSFContainer:
+                  ret_failed_lig: bool = False,
+                  template: bool = False) -> PSFContainer:
     r"""Generate a :class:`PSFContainer` instance for **qd** with multiple different **ligands**.
 
     Parameters
@@ -310,6 +340,16 @@ def generate_psf2(qd: Union[str, Molecule],
         Usefull for debugging.
         If ``False``, raise a :exc:`MoleculeError`.
 
+    template : :class:`bool`
+        If ``True``, only perform the (RDKit) substructure matching once for every unique
+        sequence of atoms, reusing its result for all subsequent ligands with
+        the same sequence of atoms.
+        Furthermore, the bonds, angles, dihedrals and impropers are only constructed for the
+        first ligand of each type and then replicated, by offsetting their atomic indices,
+        for all other ligands of the same type.
+        Note that this assumes that (identical) ligands are always ordered in the same manner
+        and that **qd** contains no bonds other than those of the ligands.
+
     Returns
     -------
     :class:`Molecule`
@@ -341,7 +381,31 @@ def generate_psf2(qd: Union[str, Molecule],
     # Identify all bonds and residues
     res_list = [np.arange(i)]
     res_dict = {}
+    match_dict: Dict[Tuple[int, ...], Tuple[Mol, int, np.ndarray, List[float]]] = {}
+    if template:
+        qd.delete_all_bonds()
+        atnum = np.fromiter((at.atnum for at in qd), dtype=int, count=len(qd))
+
+        # The cache key spans the atoms of the largest ligand (i.e. the first value in
+        # rdmol_dict), rather than the atoms of the identified ligand.
+        # This is the window passed to _get_initial_lig(), so identical keys imply an
+        # identical input for the substructure matching, even if the window extends into
+        # the next ligand when dealing with ligands of different sizes.
+        # Smaller ligands can thus be matched multiple times (once for every unique successor),
+        # but never incorrectly.
+        window = next(iter(rdmol_dict.values()))
+
     while True:
+        if template:  # Check if a ligand with the same atoms has previously been identified
+            key = tuple(atnum[i:i+window].tolist())
+            if key in match_dict:
+                ref, j, bonds, order = match_dict[key]
+                _add_bonds(qd, bonds + i, order)
+                res_list.append(np.arange(i, i+j))
+                res_dict[len(res_list)] = id(ref)
+                i += j
+                continue
+
         new, j = _get_initial_lig(qd, rdmol_dict, i)
         if new is None:
             break
@@ -353,11 +417,14 @@ def generate_psf2(qd: Union[str, Molecule],
             j += k
 
             if _get_matches(new, ref):
-                qd.bonds += [Bond(atom1=qd[bond.atom1.id],
-                                  atom2=qd[bond.atom2.id],
-                                  order=bond.order, mol=qd) for bond in new.bonds]
+                bonds = np.array([(b.atom1.id, b.atom2.id) for b in new.bonds], dtype=int)
+                bonds = bonds.reshape(-1, 2) - i
+                order = [b.order for b in new.bonds]
+                _add_bonds(qd, bonds + i, order)
                 res_list.append(np.arange(i, i+j))
                 res_dict[len(res_list)] = id(ref)
+                if template:
+                    match_dict[key] = ref, j, bonds, order
                 break
             else:
                 continue
@@ -375,10 +442,21 @@ def generate_psf2(qd: Union[str, Molecule],
     # Create the .psf file
     _assign_residues(qd, res_list)
     psf = PSFContainer()
-    psf.generate_bonds(qd)
-    psf.generate_angles(qd)
-    psf.generate_dihedrals(qd)
-    psf.generate_impropers(qd)
+    if template:
+        _id_dict = group_by_values(res_dict.items())
+        template_list = []
+        for ref in rdmol_dict:
+            res_id = _id_dict.get(id(ref), [])
+            if res_id:
+                start = np.array([res_list[k - 1][0] for k in res_id])
+                template_list.append((start, len(res_list[res_id[0] - 1])))
+        _generate_bonded_template(psf, qd, template_list)
+    else:
+        bond_mat = get_bond_matrix(qd)
+        psf.generate_bonds(qd)
+        psf.generate_angles(qd, bond_mat)
+        psf.generate_dihedrals(qd, bond_mat)
+        psf.generate_impropers(qd, bond_mat)
     psf.generate_atoms(qd, res_dict)
 
     if not (rtf_file is str_file is None):
@@ -392,6 +470,49 @@ def generate_psf2(qd: Union[str, Molecule],
     return psf
 
 
+def _add_bonds(qd: Molecule, bonds: np.ndarray,
+               order: Optional[Iterable[float]] = None) -> None:
+    """Add all bonds defined by the (1-based) atomic indices in **bonds** to **qd**."""
+    atoms = qd.atoms
+    order_iter = order if order is not None else repeat(1)
+    for (j, k), bond_order in zip(bonds.tolist(), order_iter):
+        qd.add_bond(atoms[j - 1], atoms[k - 1], order=bond_order)
+
+
+def _generate_bonded_template(psf: PSFContainer, qd: Molecule,
+                              templates: Iterable[Tuple[np.ndarray, int]]) -> None:
+    """Construct the bonded topology of **qd** by replicating the topology of template ligands.
+
+    **templates** consists of tuples with the (0-based) indices of the first atom
+    of all ligands of a given type and the number of atoms in aforementioned ligands.
+    The first ligand of each type is used as template.
+
+    """
+    ret: Dict[str, List[np.ndarray]] = {
+        'bonds': [], 'angles': [], 'dihedrals': [], 'impropers': []
+    }
+
+    for start, size in templates:
+        ligand = qd.copy(atoms=qd.atoms[start[0]:start[0]+size])
+        bond_mat = get_bond_matrix(ligand)
+        ar_dict = {
+            'bonds': get_bonds(ligand),
+            'angles': get_angles(ligand, bond_mat),
+            'dihedrals': get_dihedrals(ligand, bond_mat),
+            'impropers': get_impropers(ligand, bond_mat)
+        }
+        for key, ar in ar_dict.items():
+            if ar.size:  # Offset the (1-based) indices of the template
+                ret[key].append((ar[None] + start[:, None, None]).reshape(-1, ar.shape[1]))
+
+    for key, ar_list in ret.items():
+        if not ar_list:
+            setattr(psf, key, np.array([], dtype=int, ndmin=2))
+            continue
+        ar = np.concatenate(ar_list)
+        setattr(psf, key, ar[np.argsort(ar[:, 0], kind='stable')])
+
+
 def _get_initial_lig(qd: Molecule, rdmol_dict: Mapping[Mol, int], i: int
                      ) -> Tuple[Union[None, Molecule], int]:
     """Construct a new ligand at the begining of the :func:`generate_psf2` ``while`` loop."""
@@ -0,0 +1,15 @@
+"""An airspeed velocity (asv) benchmark suite for Auto-FOX.
+
+See ``asv.conf.json`` in the root of the repository for the configuration of the suite.
+
+Usage:
+
+.. code:: bash
+
+    # Benchmark the current commit
+    asv run HEAD^!
+
+    # Compare the current commit to master
+    asv continuous master HEAD
+
+"""
@@ -0,0 +1,54 @@
+"""Benchmarks for the forcefield-related functions in :mod:`FOX.ff`."""
+
+import numpy as np
+
+from FOX import PRMContainer, get_bonded, get_non_bonded, get_intra_non_bonded
+
+from .common import TILES, PRM_FILE, get_mol, get_psf
+
+
+class _FFBenchmark:
+    """A base class for benchmarks requiring a .psf and .prm file."""
+
+    params = [TILES]
+    param_names = ['tiles']
+
+    def setup(self, tiles: int, *args) -> None:
+        self.mol = get_mol(tiles)
+        self.psf = get_psf(tiles)
+        self.prm = PRMContainer.read(PRM_FILE)
+
+
+class GetNonBonded(_FFBenchmark):
+    """Benchmarks for :func:`FOX.ff.lj_calculate.get_non_bonded`."""
+
+    params = [TILES, [np.inf, 10.0]]
+    param_names = ['tiles', 'distance_upper_bound']
+
+    def time_get_non_bonded(self, tiles: int, distance_upper_bound: float) -> None:
+        get_non_bonded(self.mol, self.psf, prm=self.prm,
+                       distance_upper_bound=distance_upper_bound)
+
+    def peakmem_get_non_bonded(self, tiles: int, distance_upper_bound: float) -> None:
+        get_non_bonded(self.mol, self.psf, prm=self.prm,
+                       distance_upper_bound=distance_upper_bound)
+
+
+class GetIntraNonBonded(_FFBenchmark):
+    """Benchmarks for :func:`FOX.ff.lj_intra_calculate.get_intra_non_bonded`."""
+
+    def time_get_intra_non_bonded(self, tiles: int) -> None:
+        get_intra_non_bonded(self.mol, self.psf, self.prm)
+
+    def peakmem_get_intra_non_bonded(self, tiles: int) -> None:
+        get_intra_non_bonded(self.mol, self.psf, self.prm)
+
+
+class GetBonded(_FFBenchmark):
+    """Benchmarks for :func:`FOX.ff.bonded_calculate.get_bonded`."""
+
+    def time_get_bonded(self, tiles: int) -> None:
+        get_bonded(self.mol, self.psf, self.prm)
+
+    def peakmem_get_bonded(self, tiles: int) -> None:
+        get_bonded(self.mol, self.psf, self.prm)
@@ -0,0 +1,47 @@
+"""Benchmarks for the import time of Auto-FOX and a number of its (sub-)modules."""
+
+import sys
+import subprocess
+from typing import Tuple
+
+#: The to-be benchmarked modules.
+MODULES: Tuple[str, ...] = (
+    'FOX',
+    'FOX.armc_functions.csv_utils',
+    'FOX.classes.multi_mol',
+    'FOX.classes.armc',
+)
+
+#: Third party packages whose (accidental) import is tracked.
+HEAVY_MODULES: Tuple[str, ...] = (
+    'numpy', 'pandas', 'scipy', 'h5py', 'yaml', 'matplotlib', 'scm.plams', 'pkg_resources'
+)
+
+_SCRIPT = """\
+import sys
+import {module}
+print(sum(i in sys.modules for i in {heavy!r}))
+"""
+
+
+class Import:
+    """Benchmarks for the import time of Auto-FOX.
+
+    The import of :mod:`FOX` should remain lazy; a regression will thus show up both
+    in :meth:`Import.timeraw_import` and :meth:`Import.track_heavy_imports`.
+
+    """
+
+    params = [MODULES]
+    param_names = ['module']
+
+    def timeraw_import(self, module: str) -> str:
+        return f'import {module}'
+
+    def track_heavy_imports(self, module: str) -> int:
+        script = _SCRIPT.format(module=module, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, '-c', script], check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        return int(output)
+
+    track_heavy_imports.unit = 'modules'  # type: ignore
@@ -0,0 +1,188 @@
+"""Benchmarks for the .psf and .hdf5 I/O functions in :mod:`FOX.io`."""
+
+import os
+import shutil
+import tempfile
+import warnings
+
+import h5py
+import numpy as np
+import pandas as pd
+
+from FOX import ARMC, MultiMolecule, PSFContainer, create_hdf5, create_xyz_hdf5, to_hdf5, from_hdf5
+from FOX.io.hdf5_utils import mol_from_hdf5, _get_filename_xyz, _xyz_to_hdf5
+from FOX.armc_functions.csv_utils import dset_to_file
+from FOX.functions.utils import serialize_array
+
+from .common import TILES, get_mol, get_psf, get_solvent_psf
+
+#: A (dummy) set of ARMC parameters.
+PARAM = pd.DataFrame(
+    {'param': [1.0, -1.0], 'unit': ['{:f}', '{:f}'], 'keys': [['input'], ['input']]},
+    index=pd.MultiIndex.from_tuples([('charge', 'Cd'), ('charge', 'Se')])
+)
+
+
+class PSFReadWrite:
+    """Benchmarks for :meth:`PSFContainer.read` and :meth:`PSFContainer.write`."""
+
+    params = [TILES]
+    param_names = ['tiles']
+
+    def setup(self, tiles: int) -> None:
+        fd, self.filename = tempfile.mkstemp(suffix='.psf')
+        os.close(fd)
+        self.psf = get_psf(tiles)
+        self.psf.write(self.filename)
+
+    def teardown(self, tiles: int) -> None:
+        os.remove(self.filename)
+
+    def time_read(self, tiles: int) -> None:
+        PSFContainer.read(self.filename)
+
+    def time_write(self, tiles: int) -> None:
+        self.psf.write(self.filename)
+
+
+class SerializeArray:
+    """Benchmarks for :func:`FOX.functions.utils.serialize_array`."""
+
+    params = [[10**4, 10**5]]
+    param_names = ['atoms']
+
+    def setup(self, atoms: int) -> None:
+        psf = get_solvent_psf(atoms)
+        self.blocks = [(psf.bonds, 4), (psf.angles, 3), (psf.dihedrals, 2), (psf.impropers, 2)]
+
+    def time_serialize_array(self, atoms: int) -> None:
+        for array, items_per_row in self.blocks:
+            serialize_array(array, items_per_row)
+
+
+def create_legacy_xyz_hdf5(filename: str, mol: MultiMolecule, iter_len: int) -> None:
+    """Create an .xyz.hdf5 file using the pre-0.7.5 layout: gzip and chunks chosen by h5py."""
+    with h5py.File(_get_filename_xyz(filename), 'w-', libver='latest') as f:
+        f.create_dataset(
+            name='xyz.0',
+            compression='gzip',
+            shape=(iter_len, 0, mol.shape[1], 3),
+            dtype=np.dtype('float16'),
+            maxshape=(iter_len, None, mol.shape[1], 3),
+            fillvalue=np.nan
+        )
+        f['xyz.0'].attrs['atoms'] = mol.symbol.astype('S')
+        f['xyz.0'].attrs['bonds'] = mol.bonds
+
+
+class XYZHDF5:
+    """Benchmarks for the layout and compression of the .xyz.hdf5 file.
+
+    See :func:`FOX.io.hdf5_utils.create_xyz_hdf5`; ``"legacy"`` refers to the pre-0.7.5 layout.
+
+    """
+
+    params = [['legacy', 'gzip', 'lzf', 'blosc', None]]
+    param_names = ['compression']
+
+    #: The number of sub-iterations, frames and atoms.
+    ITER_LEN, FRAMES, ATOMS = 20, 500, 500
+
+    def setup(self, compression: str) -> None:
+        rng = np.random.RandomState(42)
+        atoms = {'Cd': list(range(self.ATOMS))}
+        self.mol_list = [MultiMolecule(50 * rng.rand(self.FRAMES, self.ATOMS, 3), atoms=atoms)
+                         for _ in range(self.ITER_LEN)]
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'armc.hdf5')
+        self.filename_xyz = _get_filename_xyz(self.filename)
+        self.create(compression)
+        self.write()
+
+    def teardown(self, compression: str) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def create(self, compression: str) -> None:
+        """Create the .xyz.hdf5 file."""
+        if compression == 'legacy':
+            create_legacy_xyz_hdf5(self.filename, self.mol_list[0], self.ITER_LEN)
+            return None
+        with warnings.catch_warnings():  # Raised if blosc is unavailable
+            warnings.simplefilter('ignore', ImportWarning)
+            create_xyz_hdf5(self.filename, self.mol_list[:1], self.ITER_LEN,
+                            compression=compression)
+
+    def write(self) -> None:
+        """Write all molecules to the .xyz.hdf5 file."""
+        for omega, mol in enumerate(self.mol_list):
+            _xyz_to_hdf5(self.filename_xyz, omega, [mol])
+
+    def time_write(self, compression: str) -> None:
+        self.write()
+
+    def time_read_iteration(self, compression: str) -> None:
+        mol_from_hdf5(self.filename_xyz, i=self.ITER_LEN // 2)
+
+    def time_read_frame(self, compression: str) -> None:
+        mol_from_hdf5(self.filename_xyz, i=self.ITER_LEN // 2, mol_subset=-1)
+
+    def track_size(self, compression: str) -> float:
+        return os.path.getsize(self.filename_xyz) / 2**20
+
+    track_size.unit = 'MiB'  # type: ignore
+
+
+class HDF5:
+    """Benchmarks for :func:`FOX.io.hdf5_utils.to_hdf5` and :func:`FOX.io.hdf5_utils.from_hdf5`."""  # noqa: E501
+
+    params = [TILES]
+    param_names = ['tiles']
+
+    def setup(self, tiles: int) -> None:
+        mol = get_mol(tiles)
+        armc = ARMC(molecule=(mol,), param=PARAM, md_settings=[{}], iter_len=100, sub_iter_len=10)
+        armc.add_pes_evaluator('rdf', MultiMolecule.init_rdf, kwargs={'atom_subset': ['Cd', 'Se']})
+
+        tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(tmp_dir, 'armc.hdf5')
+        self.filename_csv = os.path.join(tmp_dir, 'param.csv')
+        create_hdf5(self.filename, armc)
+        create_xyz_hdf5(self.filename, armc.molecule, iter_len=armc.sub_iter_len)
+
+        pes_dict = {k: func(mol) for k, func in armc.pes.items()}
+        self.dset_dict = {
+            'param': armc.param['param'],
+            'xyz': armc.molecule,
+            'phi': armc.phi,
+            'acceptance': True,
+            'aux_error': armc.get_aux_error(pes_dict),
+            'aux_error_mod': np.append(armc.param['param'].values, armc.phi)
+        }
+        self.dset_dict.update(pes_dict)
+        to_hdf5(self.filename, self.dset_dict, 0, 0)
+
+    def teardown(self, tiles: int) -> None:
+        tmp_dir = os.path.dirname(self.filename)
+        for filename in (self.filename, _get_filename_xyz(self.filename), self.filename_csv):
+            if os.path.isfile(filename):
+                os.remove(filename)
+        os.rmdir(tmp_dir)
+
+    def time_to_hdf5(self, tiles: int) -> None:
+        to_hdf5(self.filename, self.dset_dict, 0, 1)
+
+    def time_from_hdf5(self, tiles: int) -> None:
+        from_hdf5(self.filename, ['param', 'aux_error', 'rdf.0'])
+
+    def peakmem_from_hdf5(self, tiles: int) -> None:
+        from_hdf5(self.filename, ['param', 'aux_error', 'rdf.0'])
+
+    def time_mol_from_hdf5(self, tiles: int) -> None:
+        mol_from_hdf5(_get_filename_xyz(self.filename), 0)
+
+    def peakmem_dset_to_csv(self, tiles: int) -> None:
+        dset_to_file(self.filename, 'param', self.filename_csv, chunksize=1)
+
+    def time_dset_to_csv(self, tiles: int) -> None:
+        dset_to_file(self.filename, 'param', self.filename_csv, chunksize=1)
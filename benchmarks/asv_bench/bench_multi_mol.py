@@ -0,0 +1,65 @@
+"""Benchmarks for :func:`FOX.io.read_xyz.read_multi_xyz` and the :class:`FOX.MultiMolecule` PES descriptors."""  # noqa: E501
+
+import os
+import tempfile
+
+import numpy as np
+
+from FOX.io.read_xyz import read_multi_xyz
+
+from .common import TILES, get_mol
+
+
+class ReadMultiXYZ:
+    """Benchmarks for :func:`read_multi_xyz`."""
+
+    params = [TILES]
+    param_names = ['tiles']
+
+    def setup(self, tiles: int) -> None:
+        fd, self.filename = tempfile.mkstemp(suffix='.xyz')
+        os.close(fd)
+        get_mol(tiles).as_xyz(self.filename)
+
+    def teardown(self, tiles: int) -> None:
+        os.remove(self.filename)
+
+    def time_read_multi_xyz(self, tiles: int) -> None:
+        read_multi_xyz(self.filename)
+
+    def peakmem_read_multi_xyz(self, tiles: int) -> None:
+        read_multi_xyz(self.filename)
+
+
+class InitRDF:
+    """Benchmarks for :meth:`MultiMolecule.init_rdf`."""
+
+    params = [TILES, [0, 1, 2]]
+    param_names = ['tiles', 'mem_level']
+
+    def setup(self, tiles: int, mem_level: int) -> None:
+        self.mol = get_mol(tiles)
+
+    def time_init_rdf(self, tiles: int, mem_level: int) -> None:
+        self.mol.init_rdf(atom_subset=['Cd', 'Se', 'O'], mem_level=mem_level)
+
+    def peakmem_init_rdf(self, tiles: int, mem_level: int) -> None:
+        self.mol.init_rdf(atom_subset=['Cd', 'Se', 'O'], mem_level=mem_level)
+
+
+class InitADF:
+    """Benchmarks for :meth:`MultiMolecule.init_adf` with and without a distance cutoff."""
+
+    # Without a cutoff the number of angles scales cubically with the number of atoms
+    params = [TILES[:2], [8.0, np.inf]]
+    param_names = ['tiles', 'r_max']
+    timeout = 300
+
+    def setup(self, tiles: int, r_max: float) -> None:
+        self.mol = get_mol(tiles)[:10]
+
+    def time_init_adf(self, tiles: int, r_max: float) -> None:
+        self.mol.init_adf(atom_subset=['Cd', 'Se'], r_max=r_max)
+
+    def peakmem_init_adf(self, tiles: int, r_max: float) -> None:
+        self.mol.init_adf(atom_subset=['Cd', 'Se'], r_max=r_max)
@@ -0,0 +1,82 @@
+"""Benchmarks for the functions in :mod:`FOX.recipes`."""
+
+from FOX.recipes import (
+    get_multi_lig_center, analyze_lig_center, generate_psf, generate_psf2, extract_ligand
+)
+from FOX.recipes.psf import RDKIT_ERROR
+from FOX.functions.utils import group_by_values
+
+from .common import TILES, get_mol, get_psf, get_plams_mol
+
+#: The number of tiled copies of the example system used for benchmarking the .psf generation;
+#: the example system contains 26 ligands, yielding a total of 520 ligands.
+PSF_TILES: int = 20
+
+
+class GetMultiLigCenter:
+    """Benchmarks for :func:`FOX.recipes.get_multi_lig_center`."""
+
+    params = [TILES, [None, 10]]
+    param_names = ['tiles', 'chunksize']
+
+    def setup(self, tiles: int, chunksize: int) -> None:
+        self.mol = get_mol(tiles)
+        idx_dict = group_by_values(enumerate(get_psf(tiles).residue_id))
+        del idx_dict[1]  # Delete the core
+        self.idx_list = list(idx_dict.values())
+
+    def time_get_multi_lig_center(self, tiles: int, chunksize: int) -> None:
+        get_multi_lig_center(self.mol, self.idx_list, chunksize=chunksize)
+
+    def peakmem_get_multi_lig_center(self, tiles: int, chunksize: int) -> None:
+        get_multi_lig_center(self.mol, self.idx_list, chunksize=chunksize)
+
+
+class AnalyzeLigCenter:
+    """Benchmarks for :func:`FOX.recipes.analyze_lig_center`."""
+
+    params = [TILES]
+    param_names = ['tiles']
+
+    def setup(self, tiles: int) -> None:
+        mol = get_mol(tiles)
+        idx_dict = group_by_values(enumerate(get_psf(tiles).residue_id))
+        del idx_dict[1]  # Delete the core
+        self.lig_centra = get_multi_lig_center(mol, idx_dict.values())
+
+    def time_analyze_lig_center(self, tiles: int) -> None:
+        analyze_lig_center(self.lig_centra)
+
+    def peakmem_analyze_lig_center(self, tiles: int) -> None:
+        analyze_lig_center(self.lig_centra)
+
+
+class GeneratePSF:
+    """Benchmarks for :func:`FOX.recipes.generate_psf`."""
+
+    params = [[False, True]]
+    param_names = ['template']
+    timeout = 600
+
+    def setup(self, template: bool) -> None:
+        self.qd = get_plams_mol(PSF_TILES)
+        self.ligand = extract_ligand(self.qd, 4, {'C', 'H', 'O'})
+
+    def time_generate_psf(self, template: bool) -> None:
+        generate_psf(self.qd.copy(), self.ligand, template=template)
+
+
+class GeneratePSF2:
+    """Benchmarks for :func:`FOX.recipes.generate_psf2`."""
+
+    params = [[False, True]]
+    param_names = ['template']
+    timeout = 600
+
+    def setup(self, template: bool) -> None:
+        if RDKIT_ERROR is not None:
+            raise NotImplementedError("Requires rdkit")
+        self.qd = get_plams_mol(PSF_TILES)
+
+    def time_generate_psf2(self, template: bool) -> None:
+        generate_psf2(self.qd.copy(), 'C(=O)[O-]', template=template)
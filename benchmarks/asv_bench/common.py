@@ -0,0 +1,129 @@
+"""Utilities for constructing the systems used throughout the benchmark suite.
+
+Systems of variable size are constructed by tiling the bundled
+``Cd68Se55_26COO_MD_trajec.xyz`` trajectory (and its matching .psf file) along the x-axis.
+The cores of all tiles are merged into a single residue, such that the tiled systems
+can be passed to the functions in :mod:`FOX.ff` just like the original system.
+
+"""
+
+import functools
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from scm.plams import Molecule
+
+from FOX import MultiMolecule, PSFContainer, example_xyz
+from FOX.functions.utils import group_by_values
+
+#: The path to the Auto-FOX test files.
+PATH: Path = Path(__file__).resolve().parents[2] / 'tests' / 'test_files'
+
+#: The .psf and .prm files matching :data:`FOX.example_xyz`.
+PSF_FILE: Path = PATH / 'Cd68Se55_26COO_MD_trajec.psf'
+PRM_FILE: Path = PATH / 'Cd68Se55_26COO_MD_trajec.prm'
+
+#: The number of frames in the benchmarked trajectories.
+FRAMES: int = 100
+
+#: The number of tiled copies of the example system; the system size in atoms is 227 times larger.
+TILES: Tuple[int, ...] = (1, 2, 4)
+
+#: The distance between the tiled copies, in Angstrom.
+TILE_SPACING: float = 10.0
+
+
+@functools.lru_cache(maxsize=None)
+def _get_example_mol() -> MultiMolecule:
+    """Read the first :data:`FRAMES` frames of :data:`FOX.example_xyz`."""
+    return MultiMolecule.from_xyz(example_xyz)[:FRAMES].copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_example_psf() -> PSFContainer:
+    """Read the .psf file matching :data:`FOX.example_xyz`."""
+    return PSFContainer.read(PSF_FILE)
+
+
+def _get_tile_order(tiles: int) -> np.ndarray:
+    """Return the indices for reordering **tiles** copies of the example system.
+
+    The core atoms of all copies are placed first (forming a single residue),
+    followed by all ligands, thus mirroring the layout of a single system.
+
+    """
+    is_core = _get_example_psf().residue_id.values == 1
+    idx = np.arange(tiles * len(is_core)).reshape(tiles, -1)
+    return np.concatenate([idx[:, is_core].ravel(), idx[:, ~is_core].ravel()])
+
+
+def get_mol(tiles: int) -> MultiMolecule:
+    """Return a :class:`MultiMolecule` consisting of **tiles** copies of the example system."""
+    mol = _get_example_mol()
+    width = np.ptp(mol[..., 0]) + TILE_SPACING
+    order = _get_tile_order(tiles)
+
+    xyz = np.concatenate([mol + [i * width, 0, 0] for i in range(tiles)], axis=1)[:, order]
+    symbols = np.tile(mol.symbol, tiles)[order]
+    return MultiMolecule(xyz, atoms=group_by_values(enumerate(symbols.tolist())))
+
+
+def get_psf(tiles: int) -> PSFContainer:
+    """Return a :class:`PSFContainer` consisting of **tiles** copies of the example system."""
+    psf = _get_example_psf().copy()
+    atom_count = len(psf.atoms)
+    lig_count = psf.atoms['residue ID'].max() - 1
+    order = _get_tile_order(tiles)
+    new_idx = np.empty_like(order)
+    new_idx[order] = np.arange(len(order))
+
+    atoms_list = []
+    for i in range(tiles):
+        df = psf.atoms.copy()
+        df.loc[df['residue ID'] != 1, 'residue ID'] += i * lig_count
+        atoms_list.append(df)
+    psf.atoms = pd.concat(atoms_list).iloc[order]
+    psf.atoms.index = pd.RangeIndex(1, 1 + len(order), name=psf.atoms.index.name)
+
+    for key in ('bonds', 'angles', 'dihedrals', 'impropers'):
+        ar = getattr(psf, key) - 1
+        ar_tiled = np.concatenate([ar + i * atom_count for i in range(tiles)])
+        setattr(psf, key, 1 + new_idx[ar_tiled])
+    return psf
+
+
+def get_plams_mol(tiles: int) -> Molecule:
+    """Return the first frame of :func:`get_mol` as a PLAMS :class:`~scm.plams.mol.molecule.Molecule`."""  # noqa: E501
+    return get_mol(tiles).as_Molecule(mol_subset=0)[0]
+
+
+def get_solvent_psf(atoms: int) -> PSFContainer:
+    """Return a :class:`PSFContainer` of a solvent box with **atoms** atoms (3 atoms per molecule).
+
+    **atoms** is rounded down to a multiple of 3.
+
+    """
+    res_count = atoms // 3
+    idx = 1 + np.arange(3 * res_count).reshape(-1, 3)
+
+    atoms_df = pd.DataFrame({
+        'segment name': 'MOL1',
+        'residue ID': np.repeat(np.arange(1, res_count + 1), 3),
+        'residue name': 'SOL',
+        'atom name': np.tile(['O', 'H', 'H'], res_count),
+        'atom type': np.tile(['OT', 'HT', 'HT'], res_count),
+        'charge': np.tile([-0.834, 0.417, 0.417], res_count),
+        'mass': np.tile([15.999, 1.008, 1.008], res_count),
+        '0': 0
+    }, index=pd.RangeIndex(1, 3 * res_count + 1, name='ID'))
+
+    return PSFContainer(
+        title=np.array(['PSF file generated with Auto-FOX']),
+        atoms=atoms_df,
+        bonds=np.concatenate([idx[:, [0, 1]], idx[:, [0, 2]]]),
+        angles=idx[:, [1, 0, 2]],
+        dihedrals=np.stack([idx[:-1, 1], idx[:-1, 0], idx[1:, 0], idx[1:, 1]], axis=1),
+        impropers=np.stack([idx[:-1, 0], idx[:-1, 1], idx[:-1, 2], idx[1:, 0]], axis=1),
+    )
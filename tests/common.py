@@ -0,0 +1,32 @@
+"""Objects shared by multiple test modules."""
+
+import numpy as np
+import pandas as pd
+
+from FOX import MultiMolecule
+
+__all__ = ['ATOMS', 'get_random_mol', 'get_param']
+
+#: The atoms of the molecules returned by :func:`get_random_mol`.
+ATOMS = {'Cd': list(range(10)), 'Se': list(range(10, 20)), 'O': list(range(20, 30))}
+
+
+def get_random_mol(mol_count: int = 5, seed: int = 42) -> MultiMolecule:
+    """Construct a :class:`MultiMolecule` with :data:`ATOMS` and **mol_count** random frames.
+
+    The coordinates lie within a 10 Angstrom cube and are rounded to 3 decimals.
+
+    """
+    rng = np.random.RandomState(seed)
+    ret = MultiMolecule(10 * rng.rand(mol_count, 30, 3), atoms=ATOMS)
+    ret.round(3)
+    return ret
+
+
+def get_param(**kwargs) -> pd.DataFrame:
+    """Construct a minimal parameter DataFrame for :class:`MonteCarlo<FOX.classes.monte_carlo.MonteCarlo>`.
+
+    Keyword arguments are passed to the :class:`pandas.DataFrame` constructor.
+
+    """  # noqa: E501
+    return pd.DataFrame({'param': [1.0], 'unit': ['{:f}'], 'keys': [['input']]}, **kwargs)
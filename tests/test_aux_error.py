@@ -0,0 +1,68 @@
+"""A module for testing :meth:`FOX.classes.armc.ARMC.get_aux_error`."""
+
+from itertools import cycle
+
+import numpy as np
+from assertionlib import assertion
+
+from FOX import ARMC, MultiMolecule
+
+from tests.common import get_random_mol, get_param
+
+
+def _get_mol_list():
+    """Construct two random :class:`MultiMolecule` instances."""
+    return [get_random_mol(4, seed=i) for i in range(2)]
+
+
+def _get_armc() -> ARMC:
+    """Construct an :class:`ARMC` instance with RDF, ADF and :func:`numpy.sum` PES descriptors."""
+    armc = ARMC(molecule=_get_mol_list(), param=get_param(), md_settings=[{}, {}])
+    kwargs = [{'atom_subset': ['Cd', 'Se']}, {'atom_subset': ['Cd', 'Se', 'O']}]
+    armc.add_pes_evaluator('rdf', MultiMolecule.init_rdf, kwargs=kwargs)
+    armc.add_pes_evaluator('adf', MultiMolecule.init_adf, kwargs={'atom_subset': ['Cd', 'Se']})
+    armc.add_pes_evaluator('sum', np.sum, kwargs={'axis': 0})
+    return armc
+
+
+def _aux_error_ref(armc: ARMC, pes_dict: dict) -> np.ndarray:
+    """A reference implementation of :meth:`ARMC.get_aux_error`."""
+    ret = []
+    for k, mm in pes_dict.items():
+        qm = armc.pes[k].ref
+        err = (np.abs(qm - mm)**2).sum() / np.abs(qm).sum()
+        ret.append(np.asarray(err, dtype=float).sum())
+    return np.array(ret).reshape(2, -1)
+
+
+def test_get_aux_error() -> None:
+    """Test :meth:`ARMC.get_aux_error`."""
+    armc = _get_armc()
+    pes_dict = {k: func(mol) for (k, func), mol in zip(armc.pes.items(), cycle(_get_mol_list()))}
+    pes_dict['rdf.0'].iloc[3, 0] = np.nan
+
+    aux_error = armc.get_aux_error(pes_dict)
+    assertion.eq(aux_error.shape, (2, 3))
+    np.testing.assert_allclose(aux_error, _aux_error_ref(armc, pes_dict), rtol=1e-12)
+
+    # The reference descriptors are stacked only once
+    blocks = armc._get_aux_blocks(tuple(pes_dict))
+    assertion.is_(blocks, armc._get_aux_blocks(tuple(pes_dict)))
+    assertion.len_eq(blocks, 4)  # rdf.0, rdf.1, adf.0 + adf.1 and sum.0 + sum.1
+
+    # Crashed jobs
+    pes_inf = {k: np.inf for k in pes_dict}
+    np.testing.assert_array_equal(armc.get_aux_error(pes_inf), np.inf)
+
+    # Misaligned descriptors
+    pes_dict['rdf.1'] = pes_dict['rdf.1'].iloc[:-10]
+    np.testing.assert_allclose(armc.get_aux_error(pes_dict), _aux_error_ref(armc, pes_dict),
+                               rtol=1e-12)
+
+    # Descriptors with permuted labels; pandas aligns these with the reference
+    pes_dict = {k: func(mol) for (k, func), mol in zip(armc.pes.items(), cycle(_get_mol_list()))}
+    ref = armc.get_aux_error(pes_dict)
+    pes_dict['rdf.0'] = pes_dict['rdf.0'].iloc[:, ::-1]
+    pes_dict['adf.1'] = pes_dict['adf.1'].iloc[::-1]
+    np.testing.assert_allclose(armc.get_aux_error(pes_dict), ref, rtol=1e-12)
+    np.testing.assert_allclose(ref, _aux_error_ref(armc, pes_dict), rtol=1e-12)
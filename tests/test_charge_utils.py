@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 from assertionlib import assertion
 
-from FOX.functions.charge_utils import assign_constraints
+from FOX.functions.charge_utils import assign_constraints, update_charge, get_net_charge
 
 PATH = Path('tests') / 'test_files'
 
@@ -54,3 +54,30 @@ def test_assign_constraints() -> None:
 
     assertion.assert_(assign_constraints, ['bob == bub'], df, 'key', exception=KeyError)
     assertion.assert_(assign_constraints, ['bob > 1.0'], df, 'key', exception=KeyError)
+
+
+def test_update_charge() -> None:
+    """Test :func:`update_charge`."""
+    df = pd.DataFrame(index=pd.Index(['Cd', 'Se', 'O', 'C', 'H']))
+    df['param'] = [0.9, -0.9, -0.5, 0.4, 0.1]
+    df['count'] = [68, 55, 52, 26, 26]
+    df['min'] = [0.5, -1.5, -1.0, 0.0, 0.0]
+    df['max'] = [1.5, -0.5, 0.0, 0.5, 0.2]
+    net_charge = get_net_charge(df)
+
+    update_charge('Cd', 1.2, df)
+    assertion.eq(df.at['Cd', 'param'], 1.2)
+    np.testing.assert_allclose(get_net_charge(df), net_charge)
+    assertion.assert_(np.all, df['param'] >= df['min'])
+    assertion.assert_(np.all, df['param'] <= df['max'])
+    assertion.eq(df.at['C', 'param'], 0.5)  # Clipped by the ``"max"`` column
+
+    constrain_dict = {'Cd': functools.partial(np.multiply, 1.0),
+                      'Se': functools.partial(np.multiply, -1.0)}
+    update_charge('Se', -1.0, df, constrain_dict)
+    assertion.eq(df.loc[['Cd', 'Se'], 'param'].tolist(), [1.0, -1.0])
+    np.testing.assert_allclose(get_net_charge(df), net_charge)
+
+    update_charge('O', -0.8, df, charge=False)
+    assertion.eq(df.at['O', 'param'], -0.8)
+    np.testing.assert_allclose(df.loc[['Cd', 'Se'], 'param'], [1.0, -1.0])
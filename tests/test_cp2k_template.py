@@ -0,0 +1,80 @@
+"""A module for testing :mod:`FOX.io.cp2k_template`."""
+
+from pathlib import Path
+
+import yaml
+import numpy as np
+import pandas as pd
+from scm.plams import Settings, Molecule, Atom, Cp2kJob
+from assertionlib import assertion
+
+from FOX import MultiMolecule
+from FOX.classes.monte_carlo import MonteCarlo
+from FOX.io.cp2k_template import CP2KTemplate
+
+PATH = Path('tests') / 'test_files'
+
+with open(PATH / 'armc_md_settings.yaml', 'r') as f:
+    SETTINGS = Settings(yaml.load(f, Loader=yaml.SafeLoader))
+
+KEYS = (
+    ('input', 'force_eval', 'mm', 'forcefield', 'charge', 1, 'charge'),
+    ('input', 'force_eval', 'mm', 'forcefield', 'nonbonded', 'lennard-jones', 2, 'epsilon'),
+    ('input', 'force_eval', 'mm', 'forcefield', 'nonbonded', 'lennard-jones', 2, 'sigma')
+)
+
+MOL = Molecule()
+MOL.add_atom(Atom(symbol='Cd', coords=(0.0, 0.0, 0.0)))
+MOL.add_atom(Atom(symbol='Se', coords=(1.0, 2.5, -3.0)))
+
+
+def test_render() -> None:
+    """Test :meth:`CP2KTemplate.render`."""
+    template = CP2KTemplate(SETTINGS, KEYS, molecule=MOL)
+    assertion.eq(sorted(template.index), [-1, 0, 1, 2])
+
+    mol = MOL.copy()
+    mol[2].coords = (5.0, 6.0, 7.0)
+    values = ['1.500000', '[kjmol] 2.000000', '[nm] 0.300000']
+
+    s = SETTINGS.copy()
+    for key, v in zip(KEYS, values):
+        s.set_nested(key, v)
+    ref = Cp2kJob(settings=s, molecule=mol).get_input()
+    assertion.eq(template.render(values, molecule=mol), ref)
+
+    # A template without coordinates
+    template2 = CP2KTemplate(SETTINGS, KEYS)
+    assertion.eq(template2.render(values), Cp2kJob(settings=s).get_input())
+    assertion.assert_(template.render, values, exception=TypeError)
+
+
+def test_monte_carlo() -> None:
+    """Test :meth:`MonteCarlo.get_input_template`."""
+    mol = MultiMolecule(MOL.as_array()[None, ...], atoms={'Cd': [0], 'Se': [1]})
+    param = pd.DataFrame({
+        'param': [1.5, 2.0, 0.3],
+        'unit': ['{:f}', '[kjmol] {:f}', '[nm] {:f}'],
+        'keys': [list(k) for k in KEYS]
+    })
+    mc = MonteCarlo(mol, param, md_settings=SETTINGS, input_template=True)
+
+    template, = mc.get_input_template()
+    assertion.is_(template, mc.get_input_template()[0])
+
+    job, = mc._get_jobs('test', mc._plams_molecule, 'md_settings')
+    s = SETTINGS.copy()
+    for key, v in zip(KEYS, ['1.500000', '[kjmol] 2.000000', '[nm] 0.300000']):
+        s.set_nested(key, v)
+    ref = Cp2kJob(settings=s, molecule=mc._plams_molecule[0]).get_input()
+    assertion.eq(job.get_input(), ref)
+    np.testing.assert_array_equal(mc.param['param'], [1.5, 2.0, 0.3])
+
+    # Assigning new settings should clear the cached templates
+    mc.preopt_settings = SETTINGS
+    template_preopt, = mc.get_input_template('preopt_settings')
+    mc.md_settings = s
+    assertion.is_not(template, mc.get_input_template()[0])
+    assertion.is_(template_preopt, mc.get_input_template('preopt_settings')[0])
+    mc.preopt_settings = SETTINGS
+    assertion.is_not(template_preopt, mc.get_input_template('preopt_settings')[0])
@@ -0,0 +1,72 @@
+"""A module for testing :mod:`FOX.armc_functions.csv_utils`."""
+
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+import pandas as pd
+from assertionlib import assertion
+
+from FOX import from_hdf5
+from FOX.armc_functions.csv_utils import dset_to_csv, dset_to_file, PYARROW_ERROR
+
+PATH = Path('tests') / 'test_files'
+HDF5_FILE = PATH / 'armc_test.hdf5'
+
+
+def _to_csv(df: pd.DataFrame) -> str:
+    """Convert **df** into a .csv string."""
+    buf = io.StringIO()
+    df.to_csv(buf)
+    return buf.getvalue()
+
+
+def test_dset_to_csv() -> None:
+    """Test :func:`dset_to_csv` and :func:`dset_to_file`."""
+    path = PATH / 'csv_utils'
+    try:
+        path.mkdir()
+        for key in ('param', 'aux_error', 'acceptance', 'phi', 'rdf.0.ref'):
+            filename = path / f'{key}.csv'
+            dset_to_file(HDF5_FILE, key, filename, chunksize=1)
+            df = from_hdf5(HDF5_FILE, key)
+            if isinstance(df, list):
+                df = df[0]
+            with open(filename, 'r') as f:
+                assertion.eq(f.read(), _to_csv(df))
+
+        # PES descriptors: export a single iteration
+        dset_to_csv(HDF5_FILE, 'rdf.0', path / 'rdf.csv', iteration=5)
+        with open(path / 'rdf.csv', 'r') as f:
+            assertion.eq(f.read(), _to_csv(from_hdf5(HDF5_FILE, 'rdf.0')[5]))
+
+        # Export a subset of super-iterations and columns
+        columns = [('charge', 'Cd'), ('charge', 'Se')]
+        dset_to_file(HDF5_FILE, 'param', path / 'param_subset.csv',
+                     kappa=slice(1, None), columns=columns)
+        df = pd.read_csv(path / 'param_subset.csv', header=[0, 1], index_col=0)
+        assertion.len_eq(df, 0)
+        assertion.eq(df.columns.tolist(), columns)
+
+        assertion.assert_(dset_to_file, HDF5_FILE, 'param', path / 'param.bob',
+                          exception=ValueError)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.mark.skipif(PYARROW_ERROR is not None, reason="Requires pyarrow")
+def test_dset_to_arrow() -> None:
+    """Test :func:`dset_to_file` with the .parquet and .feather formats."""
+    path = PATH / 'csv_utils_arrow'
+    ref = from_hdf5(HDF5_FILE, 'param')
+    ref.columns = ['.'.join(i) for i in ref.columns]
+    try:
+        path.mkdir()
+        dset_to_file(HDF5_FILE, 'param', path / 'param.parquet', chunksize=1)
+        pd.testing.assert_frame_equal(pd.read_parquet(path / 'param.parquet'), ref)
+
+        dset_to_file(HDF5_FILE, 'param', path / 'param.arrow', fmt='feather', chunksize=1)
+        pd.testing.assert_frame_equal(pd.read_feather(path / 'param.arrow'), ref)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,68 @@
+"""A module for testing :mod:`FOX.entry_points`."""
+
+import os
+import shutil
+from pathlib import Path
+
+import h5py
+import matplotlib
+from assertionlib import assertion
+
+from FOX.entry_points import main_plot_pes, main_plot_param, main_plot_dset
+
+matplotlib.use('Agg')
+
+PATH = Path('tests') / 'test_files'
+
+
+def _copy_hdf5(path: Path) -> str:
+    """Copy ``armc_test.hdf5`` to **path** and mark its final ARMC iteration as written.
+
+    Ensures that the ``--watch`` loop is exhausted after its first refresh.
+
+    """
+    hdf5_file = str(path / 'armc.hdf5')
+    shutil.copyfile(PATH / 'armc_test.hdf5', hdf5_file)
+    with h5py.File(hdf5_file, 'r+') as f:
+        kappa_max, omega_max = f['param'].shape[:2]
+        f.attrs['super-iteration'] = kappa_max - 1
+        f.attrs['sub-iteration'] = omega_max - 1
+    return hdf5_file
+
+
+def test_plot_watch() -> None:
+    """Test the ``--watch`` argument of :func:`main_plot_param` and :func:`main_plot_dset`."""
+    path = PATH / 'entry_points_watch'
+    try:
+        path.mkdir()
+        hdf5_file = _copy_hdf5(path)
+
+        param_png = str(path / 'param.png')
+        main_plot_param([hdf5_file, '-o', param_png, '--watch', '0.01'])
+        assertion.assert_(os.path.isfile, param_png)
+
+        dset_png = str(path / 'dset.png')
+        main_plot_dset([hdf5_file, '-o', dset_png, '-dset', 'aux_error', 'phi', '--watch', '0.01'])
+        assertion.assert_(os.path.isfile, dset_png)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_plot_pes_processes() -> None:
+    """Test the ``--watch`` and ``--processes`` arguments of :func:`main_plot_pes`."""
+    path = PATH / 'entry_points_pes'
+    cwd = os.getcwd()
+    try:
+        path.mkdir()
+        hdf5_file = os.path.abspath(_copy_hdf5(path))
+
+        # The .png files are written to the current working directory
+        os.chdir(path)
+        main_plot_pes([hdf5_file, '-dset', 'rdf', '--processes', '1'])
+        assertion.assert_(os.path.isfile, 'rdf.0.png')
+
+        main_plot_pes([hdf5_file, '-o', 'rdf.png', '-dset', 'rdf', '--watch', '0.01'])
+        assertion.assert_(os.path.isfile, '0_rdf.png')
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(path, ignore_errors=True)
@@ -1,5 +1,7 @@
 """A module for testing functions in the :mod:`FOX.io.hdf5_utils` module."""
 
+import shutil
+import warnings
 from os import remove
 from os.path import join, isfile
 
@@ -10,7 +12,10 @@ from scm.plams import Settings
 from assertionlib import assertion
 
 import FOX
-from FOX.io.hdf5_utils import create_hdf5, to_hdf5, from_hdf5, create_xyz_hdf5
+from FOX.io.hdf5_utils import (
+    create_hdf5, to_hdf5, from_hdf5, create_xyz_hdf5, mol_from_hdf5, get_xyz_chunks, _xyz_to_hdf5,
+    LazyDataset, IncrementalDataset, iter_hdf5_updates
+)
 
 PATH: str = join('tests', 'test_files')
 
@@ -36,6 +41,8 @@ def test_create_hdf5():
     ref_dict['rdf.0'].dtype = np.float
     ref_dict['rdf.0.ref'].shape = 241, 6
     ref_dict['rdf.0.ref'].dtype = np.float
+    ref_dict.timings.shape = 500, 100, 14
+    ref_dict.timings.dtype = np.float
 
     try:
         create_hdf5(hdf5_file, armc)
@@ -127,3 +134,142 @@ def test_from_hdf5():
         xyz_hdf5 = hdf5_file.replace('.hdf5', '.xyz.hdf5')
         remove(hdf5_file) if isfile(hdf5_file) else None
         remove(xyz_hdf5) if isfile(xyz_hdf5) else None
+
+
+def test_xyz_hdf5():
+    """Test :func:`FOX.io.hdf5_utils.create_xyz_hdf5` and :func:`.mol_from_hdf5`."""
+    rng = np.random.RandomState(42)
+    mol = FOX.MultiMolecule(rng.rand(20, 10, 3), atoms={'Cd': list(range(10))})
+    hdf5_file = join(PATH, 'test.hdf5')
+    xyz_hdf5 = hdf5_file.replace('.hdf5', '.xyz.hdf5')
+
+    try:
+        for compression in ('gzip', 'lzf', 'blosc', None):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', ImportWarning)
+                create_xyz_hdf5(hdf5_file, [mol], 5, compression=compression, frame_chunk=4)
+            _xyz_to_hdf5(xyz_hdf5, 2, [mol])
+
+            with h5py.File(xyz_hdf5, 'r') as f:
+                assertion.eq(f['xyz.0'].chunks, (1, 4, 10, 3))
+
+            xyz, atoms, _ = mol_from_hdf5(xyz_hdf5, i=2)
+            assertion.eq(atoms, mol.atoms)
+            np.testing.assert_allclose(xyz, mol, atol=1e-3)
+
+            xyz_subset, *_ = mol_from_hdf5(xyz_hdf5, i=2, mol_subset=slice(5, 10))
+            np.testing.assert_allclose(xyz_subset, mol[5:10], atol=1e-3)
+
+            xyz_frame, *_ = mol_from_hdf5(xyz_hdf5, i=2, mol_subset=-1)
+            np.testing.assert_allclose(xyz_frame, mol[-1:], atol=1e-3)
+
+        assertion.assert_(create_xyz_hdf5, hdf5_file, [mol], 5, compression='bob',
+                          exception=ValueError)
+    finally:
+        remove(xyz_hdf5) if isfile(xyz_hdf5) else None
+
+
+def test_get_xyz_chunks():
+    """Test :func:`FOX.io.hdf5_utils.get_xyz_chunks`."""
+    assertion.eq(get_xyz_chunks(1000), (1, 43, 1000, 3))
+    assertion.eq(get_xyz_chunks(1000, frame_chunk=10), (1, 10, 1000, 3))
+    assertion.eq(get_xyz_chunks(10**6), (1, 1, 10**6, 3))
+
+
+def test_from_hdf5_slice():
+    """Test :meth:`FOX.io.hdf5_utils.from_hdf5` with the **kappa**, **omega** & **columns** args."""
+    hdf5_file = join(PATH, 'armc_test.hdf5')
+    ref = from_hdf5(hdf5_file, ['param', 'aux_error', 'acceptance', 'rdf.0', 'phi'])
+    columns = ref['param'].columns[[1, 3]]
+
+    param = from_hdf5(hdf5_file, 'param', omega=slice(10, 20, 2), columns=columns)
+    np.testing.assert_array_equal(param, ref['param'].iloc[10:20:2][columns])
+    assertion.eq(param.index.tolist(), list(range(10, 20, 2)))
+
+    aux_error = from_hdf5(hdf5_file, 'aux_error', kappa=0, omega=-3)
+    np.testing.assert_array_equal(aux_error, ref['aux_error'].iloc[97:98])
+
+    acceptance = from_hdf5(hdf5_file, 'acceptance', kappa=slice(1, None))
+    assertion.len_eq(acceptance, 0)
+
+    rdf = from_hdf5(hdf5_file, 'rdf.0', omega=5, columns=['Cd Se'])
+    assertion.len_eq(rdf, 1)
+    np.testing.assert_array_equal(rdf[0], ref['rdf.0'][5][['Cd Se']])
+
+    phi = from_hdf5(hdf5_file, 'phi', kappa=slice(0, 3))
+    np.testing.assert_array_equal(phi, ref['phi'].iloc[0:3])
+
+    assertion.assert_(from_hdf5, hdf5_file, 'param', omega=slice(None, None, -1),
+                      exception=ValueError)
+    assertion.assert_(from_hdf5, hdf5_file, 'param', kappa=500, exception=IndexError)
+    assertion.assert_(from_hdf5, hdf5_file, 'param', columns=['bob'], exception=KeyError)
+
+
+def test_lazy_dataset():
+    """Test :class:`FOX.io.hdf5_utils.LazyDataset`."""
+    hdf5_file = join(PATH, 'armc_test.hdf5')
+    ref = from_hdf5(hdf5_file, 'aux_error')
+
+    dset = from_hdf5(hdf5_file, 'aux_error', lazy=True)
+    assertion.isinstance(dset, LazyDataset)
+    assertion.eq(dset.shape, (200, 100, 1, 1))
+    assertion.len_eq(dset, 98)
+
+    np.testing.assert_array_equal(dset.read(omega=slice(0, 10)), ref.iloc[:10])
+
+    index_list, data_list = zip(*dset.iter_chunks(chunksize=1))
+    assertion.len_eq(data_list, 1)
+    np.testing.assert_array_equal(index_list[0], np.arange(98))
+    np.testing.assert_array_equal(data_list[0].reshape(98, -1), ref)
+
+
+def test_incremental_dataset():
+    """Test :class:`FOX.io.hdf5_utils.IncrementalDataset`."""
+    hdf5_file = join(PATH, 'incremental_test.hdf5')
+    shutil.copyfile(join(PATH, 'armc_test.hdf5'), hdf5_file)
+    try:
+        param = IncrementalDataset(hdf5_file, 'param')
+        rdf = IncrementalDataset(hdf5_file, 'rdf.0')
+        phi = IncrementalDataset(hdf5_file, 'phi')
+        for dset in (param, rdf, phi):
+            assertion.is_(dset.data, None)
+            assertion.truth(dset.update())
+            assertion.is_(dset.update(), False)
+        assertion.len_eq(param.data, 98)
+        assertion.len_eq(rdf.data, 98)
+        np.testing.assert_array_equal(param.data, from_hdf5(hdf5_file, 'param'))
+
+        # Append two iterations and overwrite the last previously read one
+        with h5py.File(hdf5_file, 'r+') as f:
+            f['param'][0, 97:99] = 1.0
+            f['rdf.0'][0, 97:99] = 1.0
+            f.attrs['sub-iteration'] = 98
+
+        for dset in (param, rdf):
+            assertion.truth(dset.update())
+        np.testing.assert_array_equal(param.index, np.arange(99))
+        np.testing.assert_array_equal(param.data.index, np.arange(99))
+        np.testing.assert_array_equal(param.data, from_hdf5(hdf5_file, 'param'))
+        np.testing.assert_array_equal(param.data.iloc[97:], 1.0)
+        assertion.len_eq(rdf.data, 99)
+        np.testing.assert_array_equal(rdf.data[97], 1.0)
+    finally:
+        remove(hdf5_file) if isfile(hdf5_file) else None
+
+
+def test_iter_hdf5_updates():
+    """Test :func:`FOX.io.hdf5_utils.iter_hdf5_updates`."""
+    hdf5_file = join(PATH, 'incremental_test.hdf5')
+    shutil.copyfile(join(PATH, 'armc_test.hdf5'), hdf5_file)
+    try:
+        iterator = iter_hdf5_updates(hdf5_file, interval=0.01)
+        assertion.eq(next(iterator), (0, 97))
+        with h5py.File(hdf5_file, 'r+') as f:
+            kappa_max, omega_max = f['param'].shape[:2]
+            f.attrs['super-iteration'] = kappa_max - 1
+            f.attrs['sub-iteration'] = omega_max - 1
+
+        # The generator is exhausted after the final iteration
+        assertion.eq(list(iterator), [(kappa_max - 1, omega_max - 1)])
+    finally:
+        remove(hdf5_file) if isfile(hdf5_file) else None
@@ -0,0 +1,47 @@
+"""A module for testing :mod:`FOX.functions.lazy`."""
+
+import sys
+import subprocess
+
+import pytest
+from assertionlib import assertion
+
+import FOX
+from FOX.functions.lazy import lazy_loader
+
+_SCRIPT = """\
+import sys
+import {module}
+print(' '.join(i for i in {heavy!r} if i in sys.modules))
+"""
+
+
+def _get_imported(module: str, heavy: tuple) -> list:
+    """Import **module** in a fresh interpreter and return all imported modules in **heavy**."""
+    script = _SCRIPT.format(module=module, heavy=heavy)
+    output = subprocess.run([sys.executable, '-c', script], check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return output.split()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires module-level __getattr__")
+def test_import_time() -> None:
+    """Guard against regressions in the import time of Auto-FOX."""
+    heavy = ('pandas', 'scipy', 'h5py', 'yaml', 'matplotlib', 'scm.plams', 'pkg_resources')
+    assertion.eq(_get_imported('FOX', heavy), [])
+
+    imported = _get_imported('FOX.armc_functions.csv_utils', heavy)
+    assertion.isdisjoint(imported, {'scipy', 'yaml', 'matplotlib', 'scm.plams', 'pkg_resources'})
+
+
+def test_lazy_loader() -> None:
+    """Test :func:`lazy_loader`."""
+    for name in FOX.__all__:
+        assertion.hasattr(FOX, name)
+    assertion.contains(dir(FOX), 'ARMC')
+    assertion.assert_(getattr, FOX, 'bob', exception=AttributeError)
+
+    __getattr__, __dir__ = lazy_loader(__name__, {'FOX.functions.lazy': ['lazy_loader']})
+    assertion.is_(__getattr__('lazy_loader'), lazy_loader)
+    assertion.contains(__dir__(), 'lazy_loader')
+    assertion.assert_(__getattr__, 'test_lazy_loader2', exception=AttributeError)
@@ -6,8 +6,13 @@ from pathlib import Path
 import numpy as np
 from assertionlib import assertion
 from matplotlib.image import imread
+from scipy.spatial.distance import cdist
 
-from FOX.recipes import get_best, overlay_descriptor, plot_descriptor
+from FOX import MultiMolecule
+from FOX.recipes import (
+    get_best, overlay_descriptor, plot_descriptor, get_lig_center, get_multi_lig_center,
+    analyze_lig_center
+)
 
 PATH = Path('tests') / 'test_files' / 'recipes'
 HDF5 = Path('tests') / 'test_files' / 'armc_test.hdf5'
@@ -69,3 +74,55 @@ def test_plot_descriptor() -> None:
     finally:
         os.remove(name1) if os.path.isfile(name1) else None
         os.remove(name2) if os.path.isfile(name2) else None
+
+
+def test_get_multi_lig_center() -> None:
+    """Test :func:`FOX.recipes.ligands.get_multi_lig_center`."""
+    rng = np.random.RandomState(42)
+    atoms = {'Cd': list(range(10)), 'C': list(range(10, 40, 3)),
+             'O': list(range(11, 40, 3)) + list(range(12, 40, 3))}
+    mol = MultiMolecule(10 * rng.rand(11, 40, 3), atoms=atoms)
+    idx_list = [range(i, i + 3) for i in range(10, 40, 3)]
+
+    for mass_weighted in (True, False):
+        ref = get_lig_center(mol, 10, 3, mass_weighted=mass_weighted)
+        for chunksize in (None, 1, 4):
+            lig_center = get_multi_lig_center(mol, idx_list, mass_weighted, chunksize=chunksize)
+            np.testing.assert_allclose(lig_center, ref)
+
+    # Ligands of variable size
+    idx_list2 = [[0], [1, 2, 3], [10, 11, 12, 13, 14, 15]]
+    ref2 = [np.average(mol[:, i], axis=1, weights=mol.mass[i]) for i in idx_list2]
+    np.testing.assert_allclose(get_multi_lig_center(mol, idx_list2), np.stack(ref2, axis=1))
+
+    assertion.eq(get_multi_lig_center(mol, []).shape, (11, 0, 3))
+    assertion.assert_(get_multi_lig_center, mol, [[0], []], exception=ValueError)
+
+
+def test_analyze_lig_center() -> None:
+    """Test :func:`FOX.recipes.ligands.analyze_lig_center`."""
+    rng = np.random.RandomState(42)
+    xyz = 15 * rng.rand(10, 30, 3)
+    mol = MultiMolecule(xyz, atoms={'Xx': list(range(30))})
+
+    rdf, adf, cn = analyze_lig_center(xyz, adf_r_max=5.0, cn_r_max=5.0)
+    np.testing.assert_allclose(rdf, mol.init_rdf(mem_level=0), rtol=0, atol=1e-12)
+    assertion.eq(adf.shape, (180, 1))
+    assertion.eq(cn.shape, (10, 30))
+    for i, frame in enumerate(xyz):
+        np.testing.assert_array_equal(cn.loc[i], (cdist(frame, frame) <= 5.0).sum(axis=1) - 1)
+
+    # init_adf() normalizes with respect to all angles; compare the (normalized) ADF per frame
+    for i in range(3):
+        adf1 = analyze_lig_center(xyz[i], adf_r_max=5.0)[1].values.ravel()
+        adf2 = mol[i:i+1].init_adf(r_max=5.0).values.ravel()
+        np.testing.assert_allclose(adf1 / adf1.sum(), adf2 / adf2.sum(), rtol=0, atol=1e-12)
+
+    # A single ligand or (nearly) coinciding ligands; the RDF should remain finite
+    rdf, adf, cn = analyze_lig_center(xyz[:, :1], adf_r_max=5.0)
+    np.testing.assert_array_equal(rdf, 0.0)
+    np.testing.assert_array_equal(cn, 0)
+    rdf = analyze_lig_center(np.zeros((2, 2, 3)))[0]
+    assertion.assert_(np.isfinite(rdf.values).all)
+
+    assertion.assert_(analyze_lig_center, xyz[0, 0], exception=ValueError)
@@ -0,0 +1,79 @@
+"""A module for testing :mod:`FOX.functions.mem_utils`."""
+
+import numpy as np
+
+from assertionlib import assertion
+
+from FOX import MultiMolecule
+from FOX.functions.mem_utils import ALLOC_COUNTER, AllocationCounter
+
+_RNG = np.random.RandomState(42)
+MOL = MultiMolecule(
+    10 * _RNG.rand(500, 40, 3),
+    atoms={'Cd': list(range(0, 20)), 'Se': list(range(20, 40))}
+)
+
+
+def test_counter() -> None:
+    """Test :class:`AllocationCounter`."""
+    counter = AllocationCounter()
+
+    @counter.track
+    def func(n: int) -> np.ndarray:
+        return np.ones(n)
+
+    func(1000)
+    assertion.eq(counter.records, {})
+
+    with counter:
+        assertion.is_(counter.enabled, True)
+        func(1000)
+        func(2000)
+    assertion.is_(counter.enabled, False)
+
+    key = func.__qualname__
+    assertion.len_eq(counter.records[key], 2)
+    assertion.ge(counter.records[key][0], 1000 * 8)
+    assertion.ge(counter.records[key][1], 2000 * 8)
+    assertion.eq(counter.peak(key), counter.records[key][1])
+    assertion.is_(counter.peak('bob'), None)
+
+    counter.reset()
+    assertion.eq(counter.records, {})
+
+
+def test_get_velocity() -> None:
+    """Test that :meth:`MultiMolecule.get_velocity` does not copy nor alter the trajectory."""
+    mol = MOL.copy()
+    with ALLOC_COUNTER:
+        ALLOC_COUNTER.reset()
+        mol.get_velocity(mol_subset=slice(0, 10), atom_subset='Cd')
+        mol.get_velocity(norm=False)
+
+    np.testing.assert_array_equal(mol, MOL)
+    peak = ALLOC_COUNTER.records['MultiMolecule.get_velocity']
+    assertion.lt(peak[0], mol.nbytes / 10)
+
+
+def test_shell_search() -> None:
+    """Test that :meth:`MultiMolecule.init_shell_search` only copies the selected frames."""
+    mol = MOL.copy()
+    with ALLOC_COUNTER:
+        ALLOC_COUNTER.reset()
+        mol.init_shell_search(mol_subset=slice(0, 5), atom_subset=('Cd', 'Se'))
+
+    np.testing.assert_array_equal(mol, MOL)
+    peak = ALLOC_COUNTER.peak('MultiMolecule.init_shell_search')
+    assertion.lt(peak, mol.nbytes)
+
+
+def test_adf() -> None:
+    """Test that :meth:`MultiMolecule.init_adf` only copies the selected frames and atoms."""
+    mol = MOL.copy()
+    with ALLOC_COUNTER:
+        ALLOC_COUNTER.reset()
+        df = mol.init_adf(mol_subset=slice(0, 2), atom_subset=('Cd',), r_max=np.inf)
+
+    assertion.eq(df.columns.tolist(), ['Cd Cd Cd'])
+    peak = ALLOC_COUNTER.peak('MultiMolecule.init_adf')
+    assertion.lt(peak, mol.nbytes)
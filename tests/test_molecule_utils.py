@@ -6,13 +6,37 @@ import numpy as np
 
 from scm.plams import Molecule
 
-from FOX.functions.molecule_utils import get_bonds, get_angles, get_dihedrals, get_impropers
+from assertionlib import assertion
+
+from FOX.functions.molecule_utils import (
+    get_bonds, get_angles, get_dihedrals, get_impropers, get_bond_matrix
+)
 
 PATH: str = join('tests', 'test_files')
 MOL: Molecule = Molecule(join(PATH, 'hexanoic_acid.pdb'))
 MOL.guess_bonds()
 
 
+def test_get_bond_matrix() -> None:
+    """Tests for :func:`FOX.functions.molecule_utils.get_bond_matrix`."""
+    mol = MOL.copy()
+    bond_mat = get_bond_matrix(mol)
+    assertion.eq(bond_mat.shape, (len(mol), len(mol)))
+    assertion.eq(bond_mat.nnz, 2 * len(mol.bonds))
+    np.testing.assert_array_equal(bond_mat.toarray(), bond_mat.toarray().T)
+
+    # The neighbours of every atom should be ordered as in Atom.bonds
+    mol.set_atoms_id(start=0)
+    for i, at in enumerate(mol.atoms):
+        ref = [b.other_end(at).id for b in at.bonds]
+        neighbours = bond_mat.indices[bond_mat.indptr[i]:bond_mat.indptr[i+1]]
+        np.testing.assert_array_equal(neighbours, ref)
+    mol.unset_atoms_id()
+
+    angles = get_angles(mol, bond_mat=bond_mat)
+    np.testing.assert_array_equal(angles, get_angles(mol))
+
+
 def test_get_bonds() -> None:
     """Tests for :func:`nanoCAT.ff.mol_topology.get_bonds`."""
     mol = MOL.copy()
@@ -1,11 +1,18 @@
 """A module for testing the :class:`FOX.classes.armc.ARMC` class."""
 
+import os
+import shutil
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
+from scm.plams import JobManager, config
 from assertionlib import assertion
 
-from FOX import ARMC
+from FOX import ARMC, MultiMolecule
+from FOX.classes.monte_carlo import MonteCarlo
+
+from tests.common import get_param
 
 PATH: Path = Path('tests') / 'test_files'
 ARMC_, _ = ARMC.from_yaml(PATH / 'armc.yaml')
@@ -42,3 +49,54 @@ def test_super_iter_len() -> None:
     armc = ARMC_.copy(deep=True)
 
     assertion.eq(armc.super_iter_len, armc.iter_len // armc.sub_iter_len)
+
+
+def test_get_jobmanager() -> None:
+    """Test :meth:`MonteCarlo.get_jobmanager` and :meth:`MonteCarlo.clear_job_cache`."""
+    mol = MultiMolecule(np.zeros((1, 2, 3)), atoms={'Cd': [0], 'Se': [1]})
+    param = get_param()
+    scratch_dir = PATH / 'scratch'
+
+    mc1 = MonteCarlo(mol, param, md_settings={})
+    assertion.is_(mc1.get_jobmanager(), None)
+
+    mc2 = MonteCarlo(mol, param, md_settings={}, scratch_dir=str(scratch_dir))
+    default_jobmanager = config.default_jobmanager
+    try:
+        jobmanager = mc2.get_jobmanager()
+        assertion.isinstance(jobmanager, JobManager)
+        assertion.is_(jobmanager, mc2.get_jobmanager())
+        assertion.eq(os.path.dirname(jobmanager.workdir), str(scratch_dir.resolve()))
+
+        job_path = Path(jobmanager.workdir) / 'job'
+        job_path.mkdir()
+        jobmanager.jobs.append(None)
+        mc2.job_cache.append(SimpleNamespace(path=str(job_path)))
+
+        mc2.clear_job_cache()
+        assertion.not_(job_path.exists())
+        assertion.eq(mc2.job_cache, [])
+        assertion.eq(jobmanager.jobs, [])
+
+        # Kept jobs should be moved to a unique directory in the PLAMS working directory
+        mc2.keep_files = True
+        config.default_jobmanager = JobManager(config.jobmanager, path=str(scratch_dir),
+                                               folder='workdir')
+        workdir = Path(config.default_jobmanager.workdir)
+        (workdir / 'job').mkdir(exist_ok=True)
+        job_path.mkdir()
+        mc2.job_cache.append(SimpleNamespace(path=str(job_path)))
+        mc2.clear_job_cache()
+        assertion.not_(job_path.exists())
+        assertion.assert_(Path.is_dir, workdir / 'job.002')
+
+        # Jobs left in the cache are moved before the scratch directory is deleted
+        job_path.mkdir()
+        mc2.job_cache.append(SimpleNamespace(path=str(job_path)))
+        mc2.clear_scratch_dir()
+        assertion.not_(os.path.exists(jobmanager.workdir))
+        assertion.assert_(Path.is_dir, workdir / 'job.003')
+        assertion.is_not(mc2.get_jobmanager(), jobmanager)
+    finally:
+        config.default_jobmanager = default_jobmanager
+        shutil.rmtree(scratch_dir, ignore_errors=True)
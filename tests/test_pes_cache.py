@@ -0,0 +1,126 @@
+"""A module for testing :mod:`FOX.armc_functions.pes_cache`."""
+
+import os
+import shutil
+import functools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from assertionlib import assertion
+
+from FOX import MultiMolecule
+from FOX.classes.monte_carlo import MonteCarlo
+from FOX.armc_functions import pes_cache
+from FOX.armc_functions.pes_cache import get_pes_cached, get_pes_cache_key
+
+from tests.common import get_random_mol, get_param
+
+PATH = Path('tests') / 'test_files'
+CACHE_DIR = PATH / '.pes_cache'
+
+MOL = get_random_mol(5)
+
+
+def _count_calls(func):
+    """Decorate **func** such that the number of calls is stored in its ``call_count`` attribute."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        wrapper.call_count += 1
+        return func(*args, **kwargs)
+    wrapper.call_count = 0
+    return wrapper
+
+
+def test_get_pes_cache_key() -> None:
+    """Test :func:`get_pes_cache_key`."""
+    func = functools.partial(MultiMolecule.init_rdf, atom_subset=['Cd', 'Se'])
+    key = get_pes_cache_key(func, MOL)
+    assertion.eq(key, get_pes_cache_key(func, MOL.copy()))
+
+    func2 = functools.partial(MultiMolecule.init_rdf, atom_subset=['Cd'])
+    assertion.ne(key, get_pes_cache_key(func2, MOL))
+    func3 = functools.partial(MultiMolecule.init_adf, atom_subset=['Cd', 'Se'])
+    assertion.ne(key, get_pes_cache_key(func3, MOL))
+
+    mol = MOL.copy()
+    mol[0, 0, 0] += 1
+    assertion.ne(key, get_pes_cache_key(func, mol))
+    mol = MOL.copy()
+    mol.atoms = {'Cd': list(range(20))}
+    assertion.ne(key, get_pes_cache_key(func, mol))
+
+    # Callables and arrays are identified by their name and content, respectively
+    func4 = functools.partial(MultiMolecule.init_adf, weight=np.exp)
+    assertion.eq(get_pes_cache_key(func4, MOL), get_pes_cache_key(func4, MOL))
+    func5 = functools.partial(np.add, np.zeros(2000))
+    func6 = functools.partial(np.add, np.zeros(2000))
+    func6.args[0][1000] = 1
+    assertion.ne(get_pes_cache_key(func5, MOL), get_pes_cache_key(func6, MOL))
+
+
+def _get_closure(i: int):
+    """Return a closure around **i** and a recursive closure."""
+    def recursive(n):
+        return recursive(n - 1) if n else i
+    return lambda mol: recursive(2) * mol
+
+
+def test_get_pes_cache_key_code() -> None:
+    """Test :func:`get_pes_cache_key` with user-defined functions and the Auto-FOX version."""
+    func = functools.partial(MultiMolecule.init_rdf, atom_subset=['Cd', 'Se'])
+    key = get_pes_cache_key(func, MOL)
+    version = pes_cache.__version__
+    try:
+        pes_cache.__version__ = '999.0.0'
+        assertion.ne(key, get_pes_cache_key(func, MOL))
+    finally:
+        pes_cache.__version__ = version
+    assertion.eq(key, get_pes_cache_key(func, MOL))
+
+    # Functions sharing the same qualified name are identified by their code
+    func1 = functools.partial(lambda mol: mol * 2)
+    func2 = functools.partial(lambda mol: mol * 3)
+    func3 = functools.partial(lambda mol: mol * 2)
+    assertion.ne(get_pes_cache_key(func1, MOL), get_pes_cache_key(func2, MOL))
+    assertion.eq(get_pes_cache_key(func1, MOL), get_pes_cache_key(func3, MOL))
+
+    # Closures are identified by their content
+    key1 = get_pes_cache_key(functools.partial(_get_closure(1)), MOL)
+    key2 = get_pes_cache_key(functools.partial(_get_closure(2)), MOL)
+    assertion.ne(key1, key2)
+    assertion.eq(key1, get_pes_cache_key(functools.partial(_get_closure(1)), MOL))
+
+
+def test_get_pes_cached() -> None:
+    """Test :func:`get_pes_cached`."""
+    func = functools.partial(_count_calls(MultiMolecule.init_rdf), atom_subset=['Cd', 'Se'])
+    try:
+        rdf1 = get_pes_cached(func, MOL, CACHE_DIR)
+        rdf2 = get_pes_cached(func, MOL, CACHE_DIR)
+        assertion.eq(func.func.call_count, 1)
+        pd.testing.assert_frame_equal(rdf1, rdf2)
+
+        # A corrupted cache
+        filename, = CACHE_DIR.iterdir()
+        with open(filename, 'wb') as f:
+            f.write(b'bob')
+        rdf3 = get_pes_cached(func, MOL, CACHE_DIR)
+        assertion.eq(func.func.call_count, 2)
+        pd.testing.assert_frame_equal(rdf1, rdf3)
+    finally:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+def test_add_pes_evaluator() -> None:
+    """Test :meth:`MonteCarlo.add_pes_evaluator` with a PES cache."""
+    param = get_param()
+    func = _count_calls(MultiMolecule.init_rdf)
+    try:
+        for _ in range(2):
+            mc = MonteCarlo(MOL, param, md_settings={}, pes_cache=os.fspath(CACHE_DIR))
+            mc.add_pes_evaluator('rdf', func, kwargs={'atom_subset': ['Cd', 'Se']})
+        assertion.eq(func.call_count, 1)
+        pd.testing.assert_frame_equal(mc.pes['rdf.0'].ref, mc.pes['rdf.0'](MOL))
+    finally:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
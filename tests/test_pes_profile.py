@@ -0,0 +1,83 @@
+"""A module for testing :mod:`FOX.armc_functions.pes_profile`."""
+
+import copy
+import shutil
+import pstats
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from assertionlib import assertion
+
+from FOX import MultiMolecule
+from FOX.classes.monte_carlo import MonteCarlo
+from FOX.armc_functions.pes_profile import PESProfiler
+from FOX.armc_functions.schemas import get_pes_schema
+
+from tests.common import get_random_mol, get_param
+
+PATH = Path('tests') / 'test_files'
+
+MOL = get_random_mol(5)
+
+
+def test_profiler() -> None:
+    """Test :class:`PESProfiler`."""
+    assertion.assert_(PESProfiler, MultiMolecule.init_rdf, mode='bob', exception=ValueError)
+    ref = MOL.init_rdf()
+
+    for mode in (True, 'cprofile', 'tracemalloc'):
+        profiler = PESProfiler(MultiMolecule.init_rdf, mode=mode)
+        for _ in range(2):
+            pd.testing.assert_frame_equal(profiler(MOL), ref)
+        assertion.eq(profiler.call_count, 2)
+        assertion.gt(profiler.time, 0)
+        assertion.eq(np.isnan(profiler.peak_memory), mode != 'tracemalloc')
+        assertion.is_(profiler.profile is None, mode != 'cprofile')
+
+        profiler_copy = copy.deepcopy(profiler)
+        assertion.eq(profiler_copy.call_count, 0)
+        assertion.eq(profiler_copy.mode, mode)
+
+        profiler.reset()
+        assertion.eq(profiler.call_count, 0)
+        assertion.eq(profiler.time, 0)
+
+
+def test_dump_pes_profile() -> None:
+    """Test :meth:`MonteCarlo.dump_pes_profile`."""
+    param = get_param()
+    mc = MonteCarlo(MOL, param, md_settings={})
+    assertion.is_(mc.dump_pes_profile(), None)
+
+    mc.add_pes_evaluator('rdf', MultiMolecule.init_rdf, profile='cprofile')
+    mc.add_pes_evaluator('adf', MultiMolecule.init_adf, profile='tracemalloc')
+    mc.add_pes_evaluator('rmsf', MultiMolecule.init_rmsf)
+    assertion.eq(mc.pes['rdf.0'].profile, 'cprofile')
+    assertion.eq(list(mc._pes_profiler), ['rdf.0', 'adf.0'])
+    for k, func in mc.pes.items():
+        mc._pes_profiler.get(k, func)(MOL)
+
+    path = PATH / 'pes_profile'
+    try:
+        path.mkdir()
+        df = mc.dump_pes_profile(str(path / 'pes_profile.{}.prof'))
+        assertion.eq(df['calls'].tolist(), [1, 1])
+        assertion.gt(df.at['adf.0', 'peak memory (MiB)'], 0)
+        assertion.isfile(path / 'pes_profile.rdf.0.prof')
+        assertion.isfile(path / 'pes_profile.adf.0.prof', invert=True)
+        assertion.gt(pstats.Stats(str(path / 'pes_profile.rdf.0.prof')).total_calls, 0)
+        assertion.eq(mc.dump_pes_profile()['calls'].tolist(), [0, 0])
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_schema() -> None:
+    """Test the ``pes.<name>.profile`` option of :func:`get_pes_schema`."""
+    schema = get_pes_schema('rdf')
+    for profile in (False, True, 'cprofile', 'tracemalloc'):
+        dct = schema.validate({'func': 'FOX.MultiMolecule.init_rdf', 'profile': profile})
+        assertion.eq(dct['profile'], profile)
+    assertion.is_(schema.validate({'func': 'FOX.MultiMolecule.init_rdf'})['profile'], False)
+    assertion.assert_(schema.validate, {'func': 'FOX.MultiMolecule.init_rdf', 'profile': 'bob'},
+                      exception=Exception)
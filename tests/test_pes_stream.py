@@ -0,0 +1,54 @@
+"""A module for testing :mod:`FOX.armc_functions.pes_stream`."""
+
+import functools
+
+import numpy as np
+from assertionlib import assertion
+
+from FOX import MultiMolecule
+from FOX.classes.monte_carlo import MonteCarlo
+from FOX.armc_functions.pes_stream import PESAccumulator
+
+from tests.common import get_random_mol, get_param
+
+MOL = get_random_mol(23)
+
+
+def test_accumulator() -> None:
+    """Test :class:`PESAccumulator`."""
+    func_list = [
+        functools.partial(MultiMolecule.init_rdf, atom_subset=['Cd', 'Se']),
+        functools.partial(MultiMolecule.init_rdf, mem_level=0),
+        functools.partial(MultiMolecule.init_adf, r_max=8.0)
+    ]
+    for func in func_list:
+        accumulator = PESAccumulator(func)
+        assertion.assert_(accumulator.result, exception=ValueError)
+
+        for i in range(0, len(MOL), 5):
+            accumulator.update(MOL[i:i+5])
+        accumulator.update(MOL[:0])
+        assertion.eq(accumulator.frame_count, len(MOL))
+
+        ref = func(MOL)
+        np.testing.assert_allclose(accumulator.result(), ref, rtol=0, atol=1e-12)
+
+
+def test_stream_callback() -> None:
+    """Test :meth:`MonteCarlo._get_stream_callback`."""
+    param = get_param()
+    mc = MonteCarlo(MOL[:1], param, md_settings={})
+    mc.add_pes_evaluator('rdf', MultiMolecule.init_rdf, kwargs={'atom_subset': ['Cd', 'O']},
+                         stream=True)
+    mc.add_pes_evaluator('adf', MultiMolecule.init_adf, kwargs={'atom_subset': ['Cd']})
+    assertion.assert_(mc.add_pes_evaluator, 'rdf2', MultiMolecule.init_rdf,
+                      kwargs={'mol_subset': 1}, stream=True, exception=ValueError)
+
+    mc._pes_stream = {'rdf.0': PESAccumulator(mc.pes['rdf.0'])}
+    callback = mc._get_stream_callback(0)
+    assertion.is_(mc._get_stream_callback(1), None)
+
+    for i in range(0, len(MOL), 7):
+        callback(np.asarray(MOL[i:i+7]))
+    rdf = mc._pes_stream['rdf.0'].result()
+    np.testing.assert_allclose(rdf, mc.pes['rdf.0'](MOL), rtol=0, atol=1e-12)
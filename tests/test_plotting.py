@@ -0,0 +1,76 @@
+"""A module for testing :mod:`FOX.armc_functions.plotting`."""
+
+import shutil
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import matplotlib
+import numpy as np
+from assertionlib import assertion
+
+from FOX.io.hdf5_utils import IncrementalDataset
+from FOX.armc_functions.plotting import (
+    plot_param, plot_dset, plot_pes_descriptors, plot_pes_descriptors_mp
+)
+
+matplotlib.use('Agg')
+
+PATH = Path('tests') / 'test_files'
+
+
+def test_plot_cache() -> None:
+    """Test the **fig** and **cache** parameters of the :mod:`plotting` functions."""
+    path = PATH / 'plotting'
+    hdf5_file = str(path / 'armc.hdf5')
+    try:
+        path.mkdir()
+        shutil.copyfile(PATH / 'armc_test.hdf5', hdf5_file)
+
+        cache: dict = {}
+        fig1 = plot_param(hdf5_file, str(path / 'param.png'), cache=cache)
+        fig2 = plot_dset(hdf5_file, ['aux_error', 'phi'], str(path / 'dset.png'), cache=cache)
+        fig3 = plot_pes_descriptors(hdf5_file, 'rdf.0', str(path / 'rdf.png'), cache=cache)
+        assertion.eq(cache.keys(), {'param', 'aux_error', 'phi', 'rdf.0.ref'})
+        for dset in cache.values():
+            assertion.isinstance(dset, IncrementalDataset)
+        assertion.len_eq(cache['param'].data, 98)
+        for name in ('param.png', 'dset.png', 'rdf.png'):
+            assertion.assert_(Path.is_file, path / name)
+
+        # Append a new iteration and refresh the figures
+        with h5py.File(hdf5_file, 'r+') as f:
+            f['param'][0, 98] = 1.0
+            f.attrs['sub-iteration'] = 98
+        assertion.is_(plot_param(hdf5_file, str(path / 'param.png'), fig=fig1, cache=cache), fig1)
+        assertion.is_(plot_dset(hdf5_file, ['aux_error', 'phi'], str(path / 'dset.png'),
+                                fig=fig2, cache=cache), fig2)
+        assertion.is_(plot_pes_descriptors(hdf5_file, 'rdf.0', str(path / 'rdf.png'),
+                                           fig=fig3, cache=cache), fig3)
+        assertion.len_eq(cache['param'].data, 99)
+        np.testing.assert_array_equal(cache['param'].data.iloc[-1], 1.0)
+        assertion.len_eq(fig1.axes, cache['param'].data.columns.levels[0].size)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_plot_pes_descriptors_mp() -> None:
+    """Test :func:`plot_pes_descriptors_mp`."""
+    path = PATH / 'plotting_mp'
+    hdf5_file = str(path / 'armc.hdf5')
+    try:
+        path.mkdir()
+        shutil.copyfile(PATH / 'armc_test.hdf5', hdf5_file)
+
+        filenames = [str(path / 'rdf1.png'), str(path / 'rdf2.png')]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ret = plot_pes_descriptors_mp(hdf5_file, ['rdf.0', 'rdf.0'], filenames,
+                                          iteration=5, executor=executor)
+        assertion.eq(ret, filenames)
+
+        ret = plot_pes_descriptors_mp(hdf5_file, ['rdf.0'], filenames[:1])
+        assertion.eq(ret, filenames[:1])
+        for name in filenames:
+            assertion.assert_(Path.is_file, Path(name))
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
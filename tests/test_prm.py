@@ -32,3 +32,32 @@ def test_write() -> None:
         f2.seek(0)
         for i, j in zip_longest(f1, f2):
             assertion.eq(i, j)
+
+
+def test_get_row_map() -> None:
+    """Tests for :meth:`PRMContainer.get_row_map`."""
+    prm = PRM.copy()
+    row_map = prm.get_row_map('bonds')
+    assertion.len_eq(row_map, len(prm.bonds))
+    assertion.is_(row_map, prm.get_row_map('bonds'))
+    for i, key in enumerate(prm.bonds.index):
+        assertion.eq(row_map[prm.normalize_key(key[::-1], 'bonds')], (i,))
+
+    assertion.eq(prm.normalize_key(('C', 'O', 'H', 'C'), 'impropers'), ('C', 'C', 'H', 'O'))
+    assertion.eq(prm.normalize_key('C', 'nonbonded'), ('C',))
+    assertion.eq(prm.get_row_map('nbfix'), {})
+
+
+def test_overlay_mapping() -> None:
+    """Tests for :meth:`PRMContainer.overlay_mapping`."""
+    prm = PRM.copy()
+    bonds = prm.bonds.copy()
+    at1, at2 = bonds.index[0]
+
+    param = {'k': {f'{at2} {at1}': 1.0, 'Cd Se': 2.0}, 'r0': {f'{at2} {at1}': 3.0, 'Cd Se': 4.0}}
+    prm.overlay_mapping('bonds', param)
+    assertion.len_eq(prm.bonds, len(bonds) + 1)
+    assertion.eq(prm.bonds.loc[(at1, at2), [2, 3]].tolist(), [1.0, 3.0])
+    assertion.eq(prm.bonds.loc[('Cd', 'Se'), [2, 3]].tolist(), [2.0, 4.0])
+    assertion.eq(prm.bonds.iloc[1:-1, :2].values.tolist(), bonds.iloc[1:, :2].values.tolist())
+    assertion.contains(prm.get_row_map('bonds'), ('Cd', 'Se'))
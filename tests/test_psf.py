@@ -6,11 +6,13 @@ from tempfile import TemporaryFile
 from itertools import zip_longest
 
 import numpy as np
+import pandas as pd
 
 from scm.plams import Molecule
 from assertionlib import assertion
 
 from FOX import PSFContainer
+from FOX.functions.molecule_utils import get_bond_matrix
 
 PATH: str = join('tests', 'test_files', 'psf')
 PSF: PSFContainer = PSFContainer.read(join(PATH, 'mol.psf'))
@@ -39,6 +41,35 @@ def test_write() -> None:
         for i, j in zip_longest(f1, f2):
             assertion.eq(i, j)
 
+    # Serialize all blocks in chunks of 2 lines
+    psf = PSF.copy()
+    psf._WRITE_CHUNK = 2
+    with open(filename1, 'rb') as f1, TemporaryFile() as f2:
+        psf.write(f2, encoding='utf-8')
+        f2.seek(0)
+        assertion.eq(f1.read(), f2.read())
+
+
+def test_read() -> None:
+    """Tests for :meth:`PSFContainer.read`."""
+    with open(join(PATH, 'mol.psf')) as f:
+        psf_str = f.read()
+
+    assertion.eq(PSF.atoms.shape, (305, 8))
+    assertion.eq(PSF.atoms.index.name, 'ID')
+    assertion.eq(PSF.atoms['residue ID'].dtype, np.dtype(int))
+    assertion.eq(PSF.atoms['charge'].dtype, np.dtype(float))
+    assertion.eq(PSF.bonds.shape, (156, 2))
+    assertion.eq(PSF.dihedrals.shape, (156, 4))
+
+    # Block headers with incorrect item counts
+    for count in ('       100', '      1000'):
+        psf_str2 = psf_str.replace('       156 !NBOND', f'{count} !NBOND')
+        psf = PSFContainer.read(psf_str2.splitlines(keepends=True))
+        np.testing.assert_array_equal(psf.bonds, PSF.bonds)
+        np.testing.assert_array_equal(psf.angles, PSF.angles)
+        pd.testing.assert_frame_equal(psf.atoms, PSF.atoms)
+
 
 def test_update_atom_charge() -> None:
     """Tests for :meth:`PSFContainer.update_atom_charge`."""
@@ -72,6 +103,9 @@ def test_generate_angles() -> None:
     psf.generate_angles(MOL)
     np.testing.assert_array_equal(ref, psf.angles)
 
+    psf.generate_angles(MOL, bond_mat=get_bond_matrix(MOL))
+    np.testing.assert_array_equal(ref, psf.angles)
+
 
 def test_generate_dihedrals() -> None:
     """Tests for :meth:`PSFContainer.generate_dihedrals`."""
@@ -80,6 +114,9 @@ def test_generate_dihedrals() -> None:
     psf.generate_dihedrals(MOL)
     np.testing.assert_array_equal(ref, psf.dihedrals)
 
+    psf.generate_dihedrals(MOL, bond_mat=get_bond_matrix(MOL))
+    np.testing.assert_array_equal(ref, psf.dihedrals)
+
 
 def test_generate_impropers() -> None:
     """Tests for :meth:`PSFContainer.generate_impropers`."""
@@ -87,3 +124,6 @@ def test_generate_impropers() -> None:
     ref = np.load(join(PATH, 'generate_impropers.npy'))
     psf.generate_impropers(MOL)
     np.testing.assert_array_equal(ref, psf.impropers)
+
+    psf.generate_impropers(MOL, bond_mat=get_bond_matrix(MOL))
+    np.testing.assert_array_equal(ref, psf.impropers)
@@ -4,11 +4,13 @@ import warnings
 from os.path import join
 
 import numpy as np
+import pytest
 
 from scm.plams import Molecule, MoleculeError
 from assertionlib import assertion
 
 from FOX.recipes import generate_psf, generate_psf2, extract_ligand
+from FOX.recipes.psf import RDKIT_ERROR
 
 PATH: str = join('tests', 'test_files')
 STR_FILE: str = join(PATH, 'ligand.str')
@@ -43,6 +45,20 @@ def test_generate_psf() -> None:
     np.testing.assert_array_equal(psf.bonds, ref)
 
 
+def test_generate_psf_template() -> None:
+    """Tests for :func:`generate_psf` with ``template=True``."""
+    qd = QD.copy()
+    ligand = extract_ligand(qd, 4, {'C', 'H', 'O'})
+    psf1 = generate_psf(qd.copy(), ligand, str_file=STR_FILE)
+    psf2 = generate_psf(qd.copy(), ligand, str_file=STR_FILE, template=True)
+
+    assertion.eq(psf1.atoms.values.tolist(), psf2.atoms.values.tolist())
+    for name in ('bonds', 'angles', 'dihedrals', 'impropers'):
+        ar1, ar2 = getattr(psf1, name), getattr(psf2, name)
+        assertion.eq(ar1.shape, ar2.shape)
+        np.testing.assert_array_equal(np.unique(ar1, axis=0), np.unique(ar2, axis=0))
+
+
 def test_generate_psf2() -> None:
     """Tests for :func:`extract_ligand`."""
     qd = QD.copy()
@@ -58,3 +74,16 @@ def test_generate_psf2() -> None:
 
     assertion.len_eq(mol_list, 1)
     assertion.eq(mol_list[0].get_formula(), 'C2H2O3')
+
+
+@pytest.mark.skipif(RDKIT_ERROR is not None, reason="Requires rdkit")
+def test_generate_psf2_template() -> None:
+    """Tests for :func:`generate_psf2` with ``template=True``."""
+    psf1 = generate_psf2(QD.copy(), 'C(=O)[O-]')
+    psf2 = generate_psf2(QD.copy(), 'C(=O)[O-]', template=True)
+
+    assertion.eq(psf1.atoms.values.tolist(), psf2.atoms.values.tolist())
+    for name in ('bonds', 'angles', 'dihedrals', 'impropers'):
+        ar1, ar2 = getattr(psf1, name), getattr(psf2, name)
+        assertion.eq(ar1.shape, ar2.shape)
+        np.testing.assert_array_equal(np.unique(ar1, axis=0), np.unique(ar2, axis=0))
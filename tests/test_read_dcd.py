@@ -0,0 +1,130 @@
+"""A module for testing files in the :mod:`FOX.io.read_dcd` module."""
+
+import os
+import shutil
+from os.path import join
+
+import numpy as np
+from assertionlib import assertion
+from scm.plams import Cp2kJob
+
+from FOX import MultiMolecule
+from FOX.io.read_dcd import read_dcd, get_dcd_dtype, DCDError
+from FOX.classes import monte_carlo  # noqa: F401  # Adds Cp2kResults.get_trajectory_path()
+
+PATH = join('tests', 'test_files')
+
+_RNG = np.random.RandomState(42)
+XYZ = 10 * _RNG.rand(20, 8, 3)
+
+
+def _write_dcd(filename: str, xyz: np.ndarray, cell: bool = True, endian: str = '<',
+               truncate: int = 0) -> None:
+    """Write **xyz** to a CHARMM-style .dcd file."""
+    i4, f4, f8 = f'{endian}i4', f'{endian}f4', f'{endian}f8'
+    mol_count, atom_count, _ = xyz.shape
+
+    def record(data: bytes) -> bytes:
+        marker = np.array(len(data), dtype=i4).tobytes()
+        return marker + data + marker
+
+    icntrl = np.zeros(20, dtype=i4)
+    icntrl[0] = mol_count
+    icntrl[10] = cell
+    icntrl[19] = 24
+    title = np.array(1, dtype=i4).tobytes() + b'Auto-FOX test'.ljust(80)
+
+    ret = record(b'CORD' + icntrl.tobytes()) + record(title)
+    ret += record(np.array(atom_count, dtype=i4).tobytes())
+    for frame in xyz:
+        if cell:
+            ret += record(np.array([50, 0, 50, 0, 0, 50], dtype=f8).tobytes())
+        for i in range(3):
+            ret += record(frame[:, i].astype(f4).tobytes())
+
+    with open(filename, 'wb') as f:
+        f.write(ret[:len(ret) - truncate])
+
+
+def test_read_dcd() -> None:
+    """Test :func:`FOX.io.read_dcd.read_dcd`."""
+    filename = join(PATH, 'test.dcd')
+    try:
+        for endian in ('<', '>'):
+            for cell in (True, False):
+                _write_dcd(filename, XYZ, cell=cell, endian=endian)
+                dtype, _ = get_dcd_dtype(filename)
+                assertion.eq('cell' in dtype.names, cell)
+
+                xyz = read_dcd(filename)
+                assertion.eq(xyz.dtype, np.dtype(float))
+                np.testing.assert_allclose(xyz, XYZ, rtol=1e-6)
+
+                xyz_subset = read_dcd(filename, mol_subset=slice(5, None, 3))
+                np.testing.assert_allclose(xyz_subset, XYZ[5::3], rtol=1e-6)
+
+                xyz_int = read_dcd(filename, mol_subset=2)
+                np.testing.assert_allclose(xyz_int, XYZ[2:3], rtol=1e-6)
+
+        # An incomplete last frame
+        _write_dcd(filename, XYZ, truncate=10)
+        np.testing.assert_allclose(read_dcd(filename), XYZ[:-1], rtol=1e-6)
+    finally:
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+
+def test_read_dcd_err() -> None:
+    """Test :func:`FOX.io.read_dcd.read_dcd` with invalid files."""
+    filename = join(PATH, 'test.dcd')
+    try:
+        assertion.assert_(read_dcd, join(PATH, 'md.rkf'), exception=DCDError)
+
+        with open(filename, 'wb') as f:
+            f.write(b'bob')
+        assertion.assert_(read_dcd, filename, exception=DCDError)
+    finally:
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+
+def test_from_dcd() -> None:
+    """Test :meth:`FOX.MultiMolecule.from_dcd`."""
+    filename = join(PATH, 'test.dcd')
+    atoms = {'Cd': [0, 1, 2, 3], 'Se': [4, 5, 6, 7]}
+    try:
+        _write_dcd(filename, XYZ)
+        mol = MultiMolecule.from_dcd(filename, atoms=atoms, mol_subset=slice(0, 10))
+    finally:
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+    assertion.isinstance(mol, MultiMolecule)
+    assertion.eq(mol.atoms, atoms)
+    assertion.eq(mol.properties['filename'], filename)
+    np.testing.assert_allclose(mol, XYZ[:10], rtol=1e-6)
+
+
+def test_get_trajectory_path() -> None:
+    """Test :meth:`Cp2kResults.get_trajectory_path`."""
+    path = join(PATH, 'trajectory_path')
+    files = ['md-pos-1.xyz', 'md-pos-1.dcd']
+    job = Cp2kJob(name='md')
+    job.path = path
+    job.status = 'successful'
+    job.results.files = files
+    try:
+        os.mkdir(path)
+        for file in files:
+            open(join(path, file), 'w').close()
+
+        # No trajectory format has been specified
+        assertion.eq(job.results.get_trajectory_path(), join(path, 'md-pos-1.xyz'))
+        assertion.contains(job.settings, 'input', invert=True)
+
+        job.settings.input.motion.print.trajectory.format = 'DCD'
+        assertion.eq(job.results.get_trajectory_path(), join(path, 'md-pos-1.dcd'))
+        job.settings.input.motion.print.trajectory.format = 'XMOL'
+        assertion.eq(job.results.get_trajectory_path(), join(path, 'md-pos-1.xyz'))
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
@@ -3,9 +3,11 @@
 from os.path import join
 
 import numpy as np
+from scm.plams import KFReader
 from assertionlib import assertion
 
-from FOX.io.read_kf import read_kf
+import FOX.io.read_kf as read_kf_module
+from FOX.io.read_kf import read_kf, _read_coords
 
 PATH = join('tests', 'test_files')
 
@@ -17,3 +19,31 @@ def test_read_kf():
 
     assertion.eq(dct, {'C': [0, 1], 'H': [2, 3, 4, 5, 6, 7]})
     np.testing.assert_allclose(ar, ref)
+
+
+def test_read_coords():
+    """Test :func:`FOX.io.read_psf._read_coords` and the fallback of :func:`read_kf`."""
+    filename = join(PATH, 'md.rkf')
+    ref = np.load(join(PATH, 'md_rkf.npy'))
+    kf = KFReader(filename)
+    mol_count, atom_count = ref.shape[:2]
+    np.testing.assert_allclose(_read_coords(kf, mol_count, atom_count), ref.ravel())
+
+    # Running out of data blocks
+    datablocks = KFReader._datablocks
+    try:
+        KFReader._datablocks = staticmethod(lambda lst, n=1: iter([]))
+        assertion.assert_(_read_coords, kf, mol_count, atom_count, exception=ValueError)
+    finally:
+        KFReader._datablocks = datablocks
+
+    # Changes to the PLAMS internals
+    def read_coords(*args):
+        raise TypeError
+
+    try:
+        read_kf_module._read_coords = read_coords
+        ar, _ = read_kf(filename)
+        np.testing.assert_allclose(ar, ref)
+    finally:
+        read_kf_module._read_coords = _read_coords
@@ -0,0 +1,87 @@
+"""A module for testing files in the :mod:`FOX.io.read_xyz` module."""
+
+import os
+from os.path import join, isfile
+
+import numpy as np
+from assertionlib import assertion
+
+from FOX import MultiMolecule
+from FOX.io.read_xyz import read_multi_xyz, read_multi_xyz_cached, get_xyz_cache_path
+from FOX.armc_functions.sanitization import validate_mol
+
+PATH = join('tests', 'test_files')
+
+_RNG = np.random.RandomState(42)
+MOL = MultiMolecule(
+    _RNG.rand(20, 10, 3).round(6),
+    atoms={'Cd': [0, 1, 2, 3], 'Se': [4, 5, 6, 7], 'O': [8, 9]}
+)
+
+
+def test_read_multi_xyz_cached() -> None:
+    """Test :func:`FOX.io.read_xyz.read_multi_xyz_cached`."""
+    xyz = join(PATH, 'cache_test.xyz')
+    npy, npz = get_xyz_cache_path(xyz)
+    try:
+        MOL.as_xyz(xyz)
+        ref_coords, ref_atoms, ref_comments = read_multi_xyz(xyz)
+
+        # Parse the file and write the cache
+        coords, atoms, comments = read_multi_xyz_cached(xyz)
+        assertion.assert_(isfile, npy)
+        assertion.assert_(isfile, npz)
+        np.testing.assert_array_equal(coords, ref_coords)
+        np.testing.assert_array_equal(comments, ref_comments)
+        assertion.eq(atoms, ref_atoms)
+
+        # Read the cache
+        coords, atoms, comments = read_multi_xyz_cached(xyz)
+        assertion.isinstance(coords, np.memmap)
+        np.testing.assert_array_equal(coords, ref_coords)
+        np.testing.assert_array_equal(comments, ref_comments)
+        assertion.eq(atoms, ref_atoms)
+
+        # Modifications of the memory-map should not affect the cache
+        coords[:] = 0
+        coords, *_ = read_multi_xyz_cached(xyz)
+        np.testing.assert_array_equal(coords, ref_coords)
+
+        # Invalidate the cache by modifying the .xyz file
+        mol = MOL[:5].copy()
+        mol.as_xyz(xyz)
+        stat = os.stat(xyz)
+        os.utime(xyz, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        coords, atoms, comments = read_multi_xyz_cached(xyz)
+        assertion.isinstance(coords, np.memmap, invert=True)
+        np.testing.assert_allclose(coords, mol)
+        assertion.len_eq(comments, 5)
+
+        mol_new = MultiMolecule.from_xyz(xyz, cache=True)
+        np.testing.assert_allclose(mol_new, mol)
+        assertion.eq(mol_new.atoms, mol.atoms)
+    finally:
+        for file in (xyz, npy, npz):
+            if isfile(file):
+                os.remove(file)
+
+
+def test_validate_mol_cache() -> None:
+    """Test that :func:`FOX.armc_functions.sanitization.validate_mol` only caches if requested."""
+    xyz = join(PATH, 'cache_test.xyz')
+    npy, npz = get_xyz_cache_path(xyz)
+    try:
+        MOL.as_xyz(xyz)
+        mol, = validate_mol(xyz)
+        np.testing.assert_allclose(mol, np.round(MOL, 3))
+        assertion.assert_(isfile, npy, invert=True)
+        assertion.assert_(isfile, npz, invert=True)
+
+        mol, = validate_mol(xyz, cache=True)
+        np.testing.assert_allclose(mol, np.round(MOL, 3))
+        assertion.assert_(isfile, npy)
+        assertion.assert_(isfile, npz)
+    finally:
+        for file in (xyz, npy, npz):
+            if isfile(file):
+                os.remove(file)
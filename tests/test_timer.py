@@ -0,0 +1,113 @@
+"""A module for testing :mod:`FOX.armc_functions.timer`."""
+
+import time
+import shutil
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pandas as pd
+from assertionlib import assertion
+
+from FOX import ARMC, MultiMolecule, create_hdf5, create_xyz_hdf5, to_hdf5, from_hdf5
+from FOX.armc_functions.timer import StageTimer, get_peak_rss
+
+from tests.common import get_param
+
+PATH = Path('tests') / 'test_files'
+
+
+def test_stage_timer() -> None:
+    """Test :class:`StageTimer`."""
+    timer = StageTimer(['md', 'pes', 'hdf5'])
+    assertion.assert_(timer.span('bob').__enter__, exception=KeyError)
+    assertion.gt(get_peak_rss(), 0)
+
+    for _ in range(2):
+        with timer.span('md'):
+            time.sleep(0.01)
+            with timer.span('pes'):
+                ar = np.ones(2**24)  # 128 MiB
+                del ar
+        with timer.span('pes'):
+            pass
+
+        row = timer.commit().reshape(-1, 2)
+        assertion.ge(row[0, 0], 0.01)
+        assertion.le(row[1, 0], row[0, 0])
+        assertion.ge(row[0, 1], row[1, 1])  # The RSS of enclosed stages is propagated
+        assertion.gt(row[1, 1], 128)
+        np.testing.assert_array_equal(row[2], np.nan)
+        np.testing.assert_array_equal(timer.time, np.nan)
+
+    df = timer.summary()
+    assertion.eq(df.shape, (3, 3))
+    assertion.eq(timer.history, [])
+    np.testing.assert_allclose(df['total time (s)'].iloc[:2], 2 * df['mean time (s)'].iloc[:2])
+    assertion.truth(np.isnan(df.loc['hdf5']).all())
+    assertion.truth(np.isnan(timer.summary().values).all())
+
+
+def test_timings_to_hdf5() -> None:
+    """Test the ``"timings"`` dataset in :func:`create_hdf5` and :func:`to_hdf5`."""
+    param = get_param(index=pd.MultiIndex.from_tuples([('charge', 'Cd')]))
+    mol = MultiMolecule(np.random.rand(3, 4, 3), atoms={'Cd': [0, 1], 'Se': [2, 3]})
+    armc = ARMC(molecule=mol, param=param, md_settings={}, iter_len=4, sub_iter_len=2)
+
+    path = PATH / 'timer'
+    filename = path / 'armc.hdf5'
+    try:
+        path.mkdir()
+        create_hdf5(filename, armc)
+        with armc._timer.span('md'):
+            pass
+        row = armc._timer.commit()
+        to_hdf5(filename, {'timings': row}, 1, 0)
+
+        df = from_hdf5(filename, 'timings')
+        assertion.eq(df.shape, (3, 2 * len(armc._timer.stages)))
+        pd.testing.assert_index_equal(df.columns, armc._timer.index)
+        np.testing.assert_array_equal(df.iloc[-1], row)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_do_inner_timings() -> None:
+    """Test the ``"timings"`` dataset in :meth:`ARMC.do_inner`, including pre-0.7.5 .hdf5 files."""
+    param = get_param(index=pd.MultiIndex.from_tuples([('charge', 'Cd')]))
+    mol = MultiMolecule(np.random.rand(3, 4, 3), atoms={'Cd': [0, 1], 'Se': [2, 3]})
+    armc = ARMC(molecule=mol, param=param, md_settings={}, iter_len=4, sub_iter_len=2)
+    armc.add_pes_evaluator('rdf', MultiMolecule.init_rdf, kwargs={'atom_subset': ['Cd', 'Se']})
+
+    pes = {k: func(mol) for k, func in armc.pes.items()}
+    key = tuple(armc.param['param'].values)
+    armc.move = lambda: key
+    armc.get_pes_descriptors = lambda key: (pes, [mol])
+    armc[key] = armc.get_aux_error(pes)
+    armc.param['param_old'] = armc.param['param']
+
+    path = PATH / 'timer'
+    filename = path / 'armc.hdf5'
+    armc.hdf5_file = str(filename)
+    try:
+        path.mkdir()
+        create_hdf5(filename, armc)
+        create_xyz_hdf5(filename, armc.molecule, iter_len=armc.sub_iter_len)
+        armc._check_hdf5_timings()
+        acceptance = np.zeros(armc.sub_iter_len, dtype=bool)
+        for omega in range(armc.sub_iter_len):
+            key = armc.do_inner(0, omega, acceptance, key)
+
+        df = from_hdf5(filename, 'timings')
+        assertion.truth(np.isfinite(df.loc[0, ('aux_error', 'time')]))
+        assertion.truth(np.isfinite(df.loc[1, ('hdf5', 'time')]))  # The export of iteration 0
+
+        # A .hdf5 file without a "timings" dataset
+        with h5py.File(filename, 'r+') as f:
+            del f['timings']
+        armc._check_hdf5_timings()
+        assertion.is_(armc._hdf5_timings, False)
+        key = armc.do_inner(1, 0, acceptance, key)
+        np.testing.assert_array_equal(from_hdf5(filename, 'param').iloc[2], armc.param['param'])
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
@@ -63,6 +63,15 @@ def test_serialize_array():
            '0\n         0         0         0         0')
     assertion.eq(serialize_array(zeros), ref)
 
+    ar = np.array([[1, 22], [333, 4444], [5, 1234567890], [-1, 12345678901]])
+    ref2 = ('         1        22       333      4444\n'
+            '         51234567890        -112345678901\n')
+    assertion.eq(serialize_array(ar[:2], 2), ref2[:41])
+    assertion.eq(serialize_array(ar[:3], 2), ref2[:61])
+    assertion.eq(serialize_array(ar, 2), ref2)
+    assertion.eq(serialize_array(ar[:0]), '')
+    assertion.assert_(serialize_array, ar.astype(float), exception=ValueError)
+
 
 def test_read_str_file():
     """Test :func:`FOX.functions.utils.read_str_file`,"""
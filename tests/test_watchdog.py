@@ -0,0 +1,163 @@
+"""A module for testing :mod:`FOX.armc_functions.watchdog`."""
+
+import time
+import logging
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from scm.plams import Settings
+from assertionlib import assertion
+
+from FOX.armc_functions.watchdog import MDWatchdog
+
+PATH = Path('tests') / 'test_files'
+
+_RNG = np.random.RandomState(42)
+XYZ = 5 * _RNG.rand(10, 4, 3) + 2 * np.arange(4)[None, :, None]
+
+
+def _write_xyz(f, xyz: np.ndarray) -> None:
+    """Append a single frame to the opened .xyz file **f**."""
+    f.write(f'{len(xyz)}\n\n')
+    for i in xyz:
+        f.write('Cd {:f} {:f} {:f}\n'.format(*i))
+
+
+def _get_job(path: Path) -> SimpleNamespace:
+    """Construct a stand-in for a PLAMS job."""
+    return SimpleNamespace(name='md', path=str(path), settings=Settings())
+
+
+def test_check_frame() -> None:
+    """Test :meth:`MDWatchdog.check_frame`."""
+    job = _get_job(PATH)
+
+    watchdog = MDWatchdog(job, max_rmsd=1.0)
+    assertion.not_(watchdog.check_frame(XYZ[0]))
+    assertion.not_(watchdog.check_frame(XYZ[0] + 0.5))
+    assertion.not_(watchdog.tripped)
+    assertion.assert_(watchdog.check_frame, XYZ[0] + 1.0)
+    assertion.contains(watchdog.reason, 'RMSD')
+
+    watchdog = MDWatchdog(job, min_distance=0.5)
+    xyz = XYZ[0].copy()
+    assertion.not_(watchdog.check_frame(xyz))
+    xyz[1] = xyz[0] + 0.1
+    assertion.assert_(watchdog.check_frame, xyz)
+    assertion.contains(watchdog.reason, 'distance')
+
+    assertion.not_(MDWatchdog(job).enabled)
+
+
+def test_poll() -> None:
+    """Test :meth:`MDWatchdog.poll`."""
+    path = PATH / 'watchdog'
+    filename = path / 'md-pos-1.xyz'
+    try:
+        path.mkdir()
+        watchdog = MDWatchdog(_get_job(path), max_rmsd=100.0)
+        assertion.not_(watchdog.poll())  # The trajectory does not exist yet
+
+        with open(filename, 'w') as f:
+            for xyz in XYZ[:5]:
+                _write_xyz(f, xyz)
+            f.write('4\n\nCd 1.0')  # An incomplete frame
+        assertion.not_(watchdog.poll())
+        assertion.eq(watchdog._frame_count, 5)
+
+        with open(filename, 'a') as f:
+            f.write(' 1.0 1.0\n')
+            for xyz in XYZ[1:4]:
+                f.write('Cd {:f} {:f} {:f}\n'.format(*xyz[0]))
+            _write_xyz(f, XYZ[0] + 1000)
+        assertion.assert_(watchdog.poll)
+        assertion.eq(watchdog._frame_count, 7)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_run() -> None:
+    """Test :meth:`MDWatchdog.run`."""
+    path = PATH / 'watchdog'
+    filename = path / 'md-pos-1.xyz'
+    try:
+        path.mkdir()
+        with MDWatchdog(_get_job(path), min_distance=0.5, interval=0.01) as watchdog:
+            assertion.assert_(watchdog.is_alive)
+            with open(filename, 'w') as f:
+                _write_xyz(f, XYZ[0])
+                _write_xyz(f, np.zeros_like(XYZ[0]))
+
+            for _ in range(500):
+                if not watchdog.is_alive():
+                    break
+                time.sleep(0.01)
+
+        assertion.truth(watchdog.tripped)
+        assertion.assert_((path / 'EXIT').is_file)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_callback() -> None:
+    """Test the **callback** parameter of :class:`MDWatchdog`."""
+    path = PATH / 'watchdog'
+    filename = path / 'md-pos-1.xyz'
+    frames = []
+    try:
+        path.mkdir()
+        with MDWatchdog(_get_job(path), interval=10.0, callback=frames.append) as watchdog:
+            assertion.truth(watchdog.enabled)
+            with open(filename, 'w') as f:
+                for xyz in XYZ[:3]:
+                    _write_xyz(f, xyz)
+            watchdog.poll()
+            with open(filename, 'a') as f:
+                for xyz in XYZ[3:]:
+                    _write_xyz(f, xyz)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    assertion.eq([len(i) for i in frames], [3, 7])
+    np.testing.assert_allclose(np.concatenate(frames), XYZ, atol=1e-6)
+
+
+def test_callback_exception() -> None:
+    """Test that an exception raised by the **callback** of :class:`MDWatchdog` is contained."""
+    path = PATH / 'watchdog'
+    filename = path / 'md-pos-1.xyz'
+    frames = []
+    logger = logging.getLogger('FOX.test_watchdog')
+    logger.propagate = False
+
+    def callback(xyz: np.ndarray) -> None:
+        frames.append(xyz)
+        raise RuntimeError('test')
+
+    try:
+        path.mkdir()
+        job = _get_job(path)
+        with MDWatchdog(job, min_distance=0.5, interval=0.01,
+                        callback=callback, logger=logger) as watchdog:
+            with open(filename, 'w') as f:
+                _write_xyz(f, XYZ[0])
+            for _ in range(500):
+                if watchdog.callback is None:
+                    break
+                time.sleep(0.01)
+            assertion.is_(watchdog.callback, None)
+
+            # The thresholds should still be checked after disabling the callback
+            with open(filename, 'a') as f:
+                _write_xyz(f, np.zeros_like(XYZ[0]))
+            for _ in range(500):
+                if not watchdog.is_alive():
+                    break
+                time.sleep(0.01)
+
+        assertion.truth(watchdog.tripped)
+        assertion.len_eq(frames, 1)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)